@@ -35,6 +35,9 @@ class Lookup(object):
             list(self.df.index) * len(self.df.columns), dtype='object')
         self.col_labels_all = np.array(
             list(self.df.columns) * len(self.df.index), dtype='object')
+        self.set_row_labels = np.random.randint(0, 10000, 100000)
+        self.set_col_labels = np.random.choice(list('abcdefgh'), 100000)
+        self.set_values = np.random.randn(100000)
 
     def time_frame_fancy_lookup(self):
         self.df.lookup(self.row_labels, self.col_labels)
@@ -42,6 +45,10 @@ class Lookup(object):
     def time_frame_fancy_lookup_all(self):
         self.df.lookup(self.row_labels_all, self.col_labels_all)
 
+    def time_frame_fancy_set_lookup(self):
+        self.df.set_lookup(self.set_row_labels, self.set_col_labels,
+                           self.set_values)
+
 
 class Reindex(object):
 
@@ -481,6 +488,21 @@ class Quantile(object):
         self.df.quantile([0.1, 0.5], axis=axis)
 
 
+class InsertColumns(object):
+
+    goal_time = 0.2
+
+    def setup(self):
+        self.N = 5000
+        self.values = np.random.randn(100)
+
+    def time_insert_columns_and_reduce(self):
+        df = DataFrame(index=range(100))
+        for i in range(self.N):
+            df[i] = self.values
+        df.sum()
+
+
 class GetDtypeCounts(object):
     # 2807
     goal_time = 0.2
@@ -509,3 +531,22 @@ class NSort(object):
 
     def time_nsmallest(self, keep):
         self.df.nsmallest(100, 'A', keep=keep)
+
+
+class NSortMultipleColumns(object):
+
+    goal_time = 0.2
+    params = ['first', 'last']
+    param_names = ['keep']
+
+    def setup(self, keep):
+        N = 10**6
+        self.df = DataFrame({'A': np.random.randint(0, 100, N),
+                             'B': np.random.randint(0, 1000, N),
+                             'C': np.random.randn(N)})
+
+    def time_nlargest(self, keep):
+        self.df.nlargest(100, ['A', 'B', 'C'], keep=keep)
+
+    def time_nsmallest(self, keep):
+        self.df.nsmallest(100, ['A', 'B', 'C'], keep=keep)
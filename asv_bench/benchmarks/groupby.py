@@ -237,6 +237,25 @@ class CountInt(object):
         df.groupby(['key1', 'key2']).nunique()
 
 
+class ApproxNunique(object):
+
+    goal_time = 0.2
+
+    def setup_cache(self):
+        n = 10**6
+        df = DataFrame({'key': np.random.randint(0, 100, size=n),
+                        'ints': np.random.randint(0, 10**5, size=n),
+                        'strings': tm.makeStringIndex(1000).take(
+                            np.random.randint(0, 1000, size=n))})
+        return df
+
+    def time_nunique(self, df):
+        df.groupby('key').nunique()
+
+    def time_approx_nunique(self, df):
+        df.groupby('key').approx_nunique()
+
+
 class AggFunctions(object):
 
     goal_time = 0.2
@@ -268,6 +287,13 @@ class AggFunctions(object):
     def time_different_python_functions_singlecol(self, df):
         df.groupby('key1').agg([sum, min, max])
 
+    def time_multiple_str_functions(self, df):
+        df.groupby(['key1', 'key2']).agg(['sum', 'mean', 'min', 'max',
+                                          'count'])
+
+    def time_single_str_function(self, df):
+        df.groupby(['key1', 'key2']).agg('sum')
+
 
 class GroupStrings(object):
 
@@ -291,6 +317,9 @@ class GroupStrings(object):
     def time_multi_columns(self):
         self.df.groupby(list('abcd')).max()
 
+    def time_multi_columns_sort_false(self):
+        self.df.groupby(list('abcd'), sort=False).max()
+
 
 class MultiColumn(object):
 
@@ -435,6 +464,9 @@ class GroupByMethods(object):
     def time_prod(self, dtype, ngroups):
         self.df.groupby('key')['values'].prod()
 
+    def time_quantile(self, dtype, ngroups):
+        self.df.groupby('key')['values'].quantile()
+
     def time_rank(self, dtype, ngroups):
         self.df.groupby('key')['values'].rank()
 
@@ -207,6 +207,9 @@ class Range(object):
     def setup(self):
         self.idx_inc = RangeIndex(start=0, stop=10**7, step=3)
         self.idx_dec = RangeIndex(start=10**7, stop=-1, step=-3)
+        self.slice_like = np.arange(10, len(self.idx_inc) - 10, 2)
+        self.prefix_mask = self.idx_inc < 5 * 10**6
+        self.tail = Int64Index(np.arange(10**7 + 2, 10**7 + 302, 3))
 
     def time_max(self):
         self.idx_inc.max()
@@ -220,6 +223,15 @@ class Range(object):
     def time_min_trivial(self):
         self.idx_inc.min()
 
+    def time_take_slice_like(self):
+        self.idx_inc.take(self.slice_like)
+
+    def time_getitem_prefix_mask(self):
+        self.idx_inc[self.prefix_mask]
+
+    def time_append_int64index(self):
+        self.idx_inc.append(self.tail)
+
 
 class IndexOps(object):
     goal_time = 0.2
@@ -238,3 +250,26 @@ class IndexOps(object):
 
     def time_concat_obj(self):
         self.oidx[0].append(self.oidx[1:])
+
+
+class IndexEngineLookup(object):
+    goal_time = 0.2
+    number = 1
+    repeat = 5
+    params = ['monotonic', 'non_monotonic']
+    param_names = ['index_type']
+
+    def setup(self, index_type):
+        N = 10**6
+        values = np.arange(N)
+        if index_type == 'non_monotonic':
+            values = np.random.permutation(values)
+        self.idx = Index(values)
+        self.keys = values[::N // 100]
+
+    def time_get_loc_first(self, index_type):
+        self.idx.get_loc(self.keys[0])
+
+    def time_get_loc_many(self, index_type):
+        for key in self.keys:
+            self.idx.get_loc(key)
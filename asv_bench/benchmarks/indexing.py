@@ -258,6 +258,33 @@ class MultiIndexing(object):
         self.mi_unused_levels.remove_unused_levels()
 
 
+class MultiIndexEngine(object):
+    goal_time = 0.2
+
+    def setup(self):
+        n = 10**6
+        rng = np.random.RandomState(5)
+        self.mi = MultiIndex.from_product(
+            [np.arange(100), np.arange(100), np.arange(100)])
+        self.target = MultiIndex.from_arrays(
+            [rng.randint(0, 100, n), rng.randint(0, 100, n),
+             rng.randint(0, 110, n)])
+        self.target_sorted = self.target.sort_values()
+
+    def time_engine(self):
+        # fresh copy, as the engine is cached
+        self.mi.copy()._engine.is_unique
+
+    def time_get_indexer(self):
+        self.mi.get_indexer(self.target)
+
+    def time_get_indexer_pad(self):
+        self.mi.get_indexer(self.target_sorted, method='pad')
+
+    def time_get_loc(self):
+        self.mi.get_loc((99, 99, 99))
+
+
 class IntervalIndexing(object):
     goal_time = 0.2
 
@@ -305,6 +332,38 @@ class IndexerLookup(object):
         self.s.loc
 
 
+class ScalarAccessOverhead(object):
+    # small Series, so that the timings are dominated by the fixed cost of
+    # each scalar lookup rather than by the index engine
+    goal_time = 0.2
+    params = ['int', 'float', 'string']
+    param_names = ['index']
+
+    def setup(self, index):
+        N = 100
+        indexes = {'int': Index(np.arange(N) * 2),
+                   'float': Float64Index(np.arange(N) * 0.5),
+                   'string': tm.makeStringIndex(N)}
+        self.s = Series(np.random.rand(N), index=indexes[index])
+        self.lbl = self.s.index[50]
+        self.s.loc[self.lbl]
+
+    def time_loc_scalar(self, index):
+        self.s.loc[self.lbl]
+
+    def time_getitem_scalar(self, index):
+        self.s[self.lbl]
+
+    def time_at_scalar(self, index):
+        self.s.at[self.lbl]
+
+    def time_iloc_scalar(self, index):
+        self.s.iloc[50]
+
+    def time_iat_scalar(self, index):
+        self.s.iat[50]
+
+
 class BooleanRowSelect(object):
 
     goal_time = 0.2
@@ -67,6 +67,22 @@ class Concat(object):
         concat([self.empty, self.df])
 
 
+class ConcatUpcast(object):
+    goal_time = 0.2
+
+    def setup(self):
+        N = 10**4
+        ints = pd.DataFrame(np.random.randint(0, 100, size=(N, 10)))
+        floats = pd.DataFrame(np.random.randn(N, 10))
+        self.chunks = [ints, floats] * 500
+
+    def time_concat_upcast(self):
+        concat(self.chunks, ignore_index=True)
+
+    def peakmem_concat_upcast(self):
+        concat(self.chunks, ignore_index=True)
+
+
 class ConcatPanels(object):
     goal_time = 0.2
 
@@ -239,6 +255,75 @@ class Merge(object):
         merge(self.df, self.df2, on='key1')
 
 
+class MergeTypedKeys(object):
+    goal_time = 0.2
+    params = ['float64', 'uint64', 'string']
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        N = 10**5
+        if dtype == 'string':
+            keys = tm.makeStringIndex(N).values
+        else:
+            keys = np.arange(N).astype(dtype) * 3
+        self.left = pd.DataFrame({'key': np.tile(keys[:N // 2], 10),
+                                  'value': np.random.randn(5 * N)})
+        self.right = pd.DataFrame({'key': keys[N // 4:],
+                                   'value2': np.random.randn(N - N // 4)})
+
+    def time_merge(self, dtype):
+        merge(self.left, self.right, on='key')
+
+
+class MergeParallelHash(object):
+    goal_time = 0.2
+    params = [['inner', 'left', 'outer'], [None, 'parallel_hash']]
+    param_names = ['how', 'engine']
+
+    def setup(self, how, engine):
+        N = 10**6
+        self.left = pd.DataFrame({'key': np.random.randint(0, N, size=N),
+                                  'value': np.random.randn(N)})
+        self.right = pd.DataFrame({'key': np.random.randint(0, N, size=N),
+                                   'value2': np.random.randn(N)})
+
+    def time_merge(self, how, engine):
+        merge(self.left, self.right, on='key', how=how, engine=engine)
+
+
+class MergeSortedKeys(object):
+    goal_time = 0.2
+    params = ['inner', 'left', 'outer']
+    param_names = ['how']
+
+    def setup(self, how):
+        N = 10**6
+        times = pd.date_range('2017', periods=N, freq='s').values
+        self.left = pd.DataFrame({'time': times,
+                                  'value': np.random.randn(N)})
+        self.right = pd.DataFrame({'time': times[::10],
+                                   'value2': np.random.randn(N // 10)})
+
+    def time_merge(self, how):
+        merge(self.left, self.right, on='time', how=how, sort=True)
+
+
+class MergeSemiJoin(object):
+    goal_time = 0.2
+    params = ['inner', 'left']
+    param_names = ['how']
+
+    def setup(self, how):
+        N = 10**7
+        self.left = pd.DataFrame({'key': np.random.randint(0, N, size=N),
+                                  'value': np.random.randn(N)})
+        self.right = pd.DataFrame({'key': np.random.randint(0, N, size=1000),
+                                   'value2': np.random.randn(1000)})
+
+    def time_merge(self, how):
+        merge(self.right, self.left, on='key', how=how)
+
+
 class i8merge(object):
     goal_time = 0.2
 
@@ -356,6 +441,31 @@ class MergeAsof(object):
         merge_asof(self.df1e, self.df2e, on='time', by=['key', 'key2'])
 
 
+class MergeAsofMultiBy(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(0)
+        N = 10**7
+        tickers = tm.makeStringIndex(100).values
+        self.trades = pd.DataFrame(
+            {'time': np.arange(N),
+             'ticker': np.random.choice(tickers, N),
+             'exch': np.random.randint(0, 10, N),
+             'side': np.random.choice([1.0, -1.0], N),
+             'price': np.random.randn(N)})
+        self.quotes = pd.DataFrame(
+            {'time': np.arange(0, 2 * N, 2),
+             'ticker': np.random.choice(tickers, N),
+             'exch': np.random.randint(0, 10, N),
+             'side': np.random.choice([1.0, -1.0], N),
+             'bid': np.random.randn(N)})
+
+    def time_multiby(self):
+        merge_asof(self.trades, self.quotes, on='time',
+                   by=['ticker', 'exch', 'side'])
+
+
 # ----------------------------------------------------------------------
 # data alignment
 
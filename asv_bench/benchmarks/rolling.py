@@ -39,3 +39,58 @@ class Quantile(object):
 
     def time_quantile(self, contructor, window, dtype, percentile):
         self.roll.quantile(percentile)
+
+
+class VariableWindowMethods(object):
+
+    sample_time = 0.2
+    params = (['DataFrame', 'Series'],
+              ['50s', '1h', '1d'],
+              ['median', 'mean', 'max', 'min', 'std', 'count', 'skew', 'kurt',
+               'sum'])
+    param_names = ['contructor', 'window', 'method']
+
+    def setup(self, contructor, window, method):
+        N = 10**5
+        arr = np.random.random(N)
+        # irregular ticks
+        index = pd.to_datetime(np.sort(np.random.randint(0, 10 * N, N)),
+                               unit='s')
+        self.roll = getattr(pd, contructor)(arr, index=index).rolling(window)
+
+    def time_rolling(self, contructor, window, method):
+        getattr(self.roll, method)()
+
+
+class VariableWindowQuantile(object):
+
+    sample_time = 0.2
+    params = (['50s', '1h', '1d'], [0.3, 0.5])
+    param_names = ['window', 'percentile']
+
+    def setup(self, window, percentile):
+        N = 10**5
+        index = pd.to_datetime(np.sort(np.random.randint(0, 10 * N, N)),
+                               unit='s')
+        self.roll = pd.Series(np.random.random(N), index=index).rolling(window)
+
+    def time_quantile(self, window, percentile):
+        self.roll.quantile(percentile)
+
+
+class WideFrameMethods(object):
+
+    sample_time = 0.2
+    params = ([10, 1000],
+              ['mean', 'max', 'min', 'var', 'sum'])
+    param_names = ['window', 'method']
+
+    def setup(self, window, method):
+        self.df = pd.DataFrame(np.random.randn(10**4, 100))
+        self.roll = self.df.rolling(window)
+
+    def time_rolling(self, window, method):
+        getattr(self.roll, method)()
+
+    def time_ewm_mean(self, window, method):
+        self.df.ewm(span=window).mean()
@@ -45,6 +45,57 @@ class series_isin_int64(object):
         self.s4.isin(self.values)
 
 
+class IsInStrategies(object):
+    goal_time = 0.2
+    params = ['table', 'search', 'hash', 'datetime']
+    param_names = ['strategy']
+
+    def setup(self, strategy):
+        N = 10**6
+        if strategy == 'table':
+            # dense ids in a known range
+            self.values = np.random.randint(0, N, N // 10)
+        elif strategy == 'search':
+            # large sorted values
+            self.values = np.arange(0, 100 * N, 50)
+        elif strategy == 'hash':
+            self.values = np.random.randint(0, 10**12, N // 10)
+        else:
+            # dense datetimes
+            self.values = pd.date_range('2017', periods=N // 10,
+                                        freq='N').values
+        if strategy == 'datetime':
+            self.s = Series(np.random.choice(self.values, N))
+        else:
+            self.s = Series(np.random.randint(0, 100 * N, N // 2))
+
+    def time_isin(self, strategy):
+        self.s.isin(self.values)
+
+
+class ApproxSketches(object):
+    goal_time = 0.2
+    params = ['int64', 'float64', 'object']
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        N = 10**6
+        self.s = Series(np.random.randint(0, N // 10, N)).astype(dtype)
+        self.f = Series(np.random.randn(N))
+
+    def time_nunique(self, dtype):
+        self.s.nunique()
+
+    def time_approx_nunique(self, dtype):
+        self.s.approx_nunique()
+
+    def time_quantile(self, dtype):
+        self.f.quantile([0.01, 0.5, 0.99])
+
+    def time_approx_quantile(self, dtype):
+        self.f.approx_quantile([0.01, 0.5, 0.99])
+
+
 class series_isin_object(object):
     goal_time = 0.2
 
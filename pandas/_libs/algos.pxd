@@ -1,6 +1,14 @@
 from util cimport numeric
 from numpy cimport float64_t, double_t
 
+cdef enum TiebreakEnumType:
+    TIEBREAK_AVERAGE
+    TIEBREAK_MIN
+    TIEBREAK_MAX
+    TIEBREAK_FIRST
+    TIEBREAK_FIRST_DESCENDING
+    TIEBREAK_DENSE
+
 cpdef numeric kth_smallest(numeric[:] a, Py_ssize_t k) nogil
 
 cdef inline Py_ssize_t swap(numeric *a, numeric *b) nogil:
@@ -36,14 +36,6 @@ import missing
 
 cdef int64_t iNaT = get_nat()
 
-cdef:
-    int TIEBREAK_AVERAGE = 0
-    int TIEBREAK_MIN = 1
-    int TIEBREAK_MAX = 2
-    int TIEBREAK_FIRST = 3
-    int TIEBREAK_FIRST_DESCENDING = 4
-    int TIEBREAK_DENSE = 5
-
 tiebreakers = {
     'average': TIEBREAK_AVERAGE,
     'min': TIEBREAK_MIN,
@@ -196,6 +188,101 @@ cpdef numeric kth_smallest(numeric[:] a, Py_ssize_t k) nogil:
     return a[k]
 
 
+cdef inline bint _lex_less(uint64_t *keys, Py_ssize_t k,
+                           int64_t a, int64_t b) nogil:
+    # whether row a of the k keys comes before row b, ties broken by position
+    cdef:
+        Py_ssize_t j
+        uint64_t x, y
+
+    for j in range(k):
+        x = keys[a * k + j]
+        y = keys[b * k + j]
+        if x != y:
+            return x < y
+    return a < b
+
+
+cdef inline void _lex_sift_down(uint64_t *keys, Py_ssize_t k, int64_t *heap,
+                                Py_ssize_t parent, Py_ssize_t size) nogil:
+    # restore the order of the max-heap of rows below heap[parent]
+    cdef:
+        Py_ssize_t child
+        int64_t tmp
+
+    while True:
+        child = 2 * parent + 1
+        if child >= size:
+            break
+        if child + 1 < size and _lex_less(keys, k, heap[child],
+                                          heap[child + 1]):
+            child += 1
+        if not _lex_less(keys, k, heap[parent], heap[child]):
+            break
+        tmp = heap[parent]
+        heap[parent] = heap[child]
+        heap[child] = tmp
+        parent = child
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def lex_nsmallest_indexer(uint64_t[:, ::1] keys, Py_ssize_t n):
+    """
+    Find the n first rows of ``keys`` in lexicographic order of its columns,
+    ties broken by position, in a single pass with a heap of n rows
+
+    Parameters
+    ----------
+    keys : 2-d C-contiguous uint64 ndarray
+        one row per element and one column per sort key, most significant
+        key first
+    n : int
+
+    Returns
+    -------
+    indexer : int64 ndarray
+        the positions of the min(n, len(keys)) first rows, in order
+    """
+    cdef:
+        Py_ssize_t i, m = keys.shape[0], k = keys.shape[1]
+        uint64_t *kp
+        int64_t *hp
+        int64_t tmp
+        ndarray[int64_t] heap
+
+    n = max(min(n, m), 0)
+    heap = np.empty(n, dtype=np.int64)
+    if n == 0 or k == 0:
+        heap[:] = np.arange(n)
+        return heap
+
+    kp = &keys[0, 0]
+    hp = <int64_t *> heap.data
+
+    with nogil:
+        # heap of the first n rows, the greatest on top
+        for i in range(n):
+            hp[i] = i
+        for i in range(n // 2 - 1, -1, -1):
+            _lex_sift_down(kp, k, hp, i, n)
+
+        # later rows replace the greatest row when they come before it
+        for i in range(n, m):
+            if _lex_less(kp, k, i, hp[0]):
+                hp[0] = i
+                _lex_sift_down(kp, k, hp, 0, n)
+
+        # heapsort the n rows in place
+        for i in range(n - 1, 0, -1):
+            tmp = hp[0]
+            hp[0] = hp[i]
+            hp[i] = tmp
+            _lex_sift_down(kp, k, hp, 0, i)
+
+    return heap
+
+
 cpdef numeric median(numeric[:] arr):
     """
     A faster median
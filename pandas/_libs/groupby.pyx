@@ -16,16 +16,51 @@ from numpy cimport (ndarray,
 from libc.stdlib cimport malloc, free
 
 from util cimport numeric, get_nat
-from algos cimport swap
-from algos import take_2d_axis1_float64_float64, groupsort_indexer
+from algos cimport (swap, TiebreakEnumType, TIEBREAK_AVERAGE, TIEBREAK_MIN,
+                    TIEBREAK_MAX, TIEBREAK_FIRST, TIEBREAK_DENSE)
+from algos import (take_2d_axis1_float64_float64, groupsort_indexer,
+                   tiebreakers)
 
 cdef int64_t iNaT = get_nat()
 
 cdef double NaN = <double> np.NaN
 cdef double nan = NaN
 
+cdef enum InterpolationEnumType:
+    INTERPOLATION_LINEAR,
+    INTERPOLATION_LOWER,
+    INTERPOLATION_HIGHER,
+    INTERPOLATION_NEAREST,
+    INTERPOLATION_MIDPOINT
+
+interpolations = {
+    'linear': INTERPOLATION_LINEAR,
+    'lower': INTERPOLATION_LOWER,
+    'higher': INTERPOLATION_HIGHER,
+    'nearest': INTERPOLATION_NEAREST,
+    'midpoint': INTERPOLATION_MIDPOINT,
+}
+
+cdef enum FusedAggEnumType:
+    FUSED_AGG_SUM,
+    FUSED_AGG_PROD,
+    FUSED_AGG_MEAN,
+    FUSED_AGG_VAR,
+    FUSED_AGG_MIN,
+    FUSED_AGG_MAX,
+    FUSED_AGG_COUNT
+
+fused_aggregations = {
+    'sum': FUSED_AGG_SUM,
+    'prod': FUSED_AGG_PROD,
+    'mean': FUSED_AGG_MEAN,
+    'var': FUSED_AGG_VAR,
+    'min': FUSED_AGG_MIN,
+    'max': FUSED_AGG_MAX,
+    'count': FUSED_AGG_COUNT,
+}
+
 
-# TODO: aggregate multiple columns in single pass
 # ----------------------------------------------------------------------
 # first, nth, last
 
@@ -186,5 +221,277 @@ cdef inline float64_t kth_smallest_c(float64_t* a,
     return a[k]
 
 
+# ----------------------------------------------------------------------
+# any, all, quantile
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_any_all(ndarray[uint8_t] out,
+                  ndarray[int64_t] labels,
+                  ndarray[uint8_t] values,
+                  ndarray[uint8_t] mask,
+                  object val_test,
+                  bint skipna):
+    """Aggregate the truth value of the elements of each group
+
+    Parameters
+    ----------
+    out : array of uint8 values which this method will write its results to
+    labels : array containing unique label for each group, with its
+        ordering matching up to the corresponding record in `values`
+    values : array containing the truth value of each element
+    mask : array indicating whether a value is na or not
+    val_test : str {'any', 'all'}
+        String object dictating whether to use any or all truth testing
+    skipna : boolean
+        Flag to ignore nan values during truth testing
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    The returned values will either be 0 or 1 (False or True, respectively).
+    """
+    cdef:
+        Py_ssize_t i, N = len(labels)
+        int64_t lab
+        uint8_t flag_val
+
+    if val_test == 'all':
+        # the 'all' of an empty group is True, so start with ones and
+        # set to zero when a False value is encountered
+        flag_val = 0
+    elif val_test == 'any':
+        # the 'any' of an empty group is False, so start with zeros and
+        # set to one when a True value is encountered
+        flag_val = 1
+    else:
+        raise ValueError("'val_test' must be either 'any' or 'all'!")
+
+    out.fill(1 - flag_val)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0 or (skipna and mask[i]):
+                continue
+
+            if values[i] == flag_val:
+                out[lab] = flag_val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile(ndarray[float64_t] out,
+                   ndarray[int64_t] labels,
+                   ndarray[float64_t] values,
+                   ndarray[uint8_t] mask,
+                   float64_t q,
+                   object interpolation):
+    """Calculate the quantile of the values of each group
+
+    Parameters
+    ----------
+    out : array of float64 values which this method will write its results to
+    labels : array containing unique label for each group, with its
+        ordering matching up to the corresponding record in `values`
+    values : array containing the values to compute the quantile of
+    mask : array indicating whether a value is na or not
+    q : float
+        The quantile value to search for, 0 <= q <= 1
+    interpolation : {'linear', 'lower', 'higher', 'nearest', 'midpoint'}
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    Groups without any non-na value are set to NaN.
+    """
+    cdef:
+        Py_ssize_t i, N = len(labels), ngroups = len(out)
+        Py_ssize_t grp_start = 0, idx, non_na_sz
+        int64_t lab
+        InterpolationEnumType interp
+        float64_t q_idx, frac, val, next_val
+        ndarray[int64_t] counts, non_na_counts, sort_arr
+
+    if not 0 <= q <= 1:
+        raise ValueError("'q' must be between 0 and 1. Got "
+                         "'{}' instead".format(q))
+
+    interp = interpolations[interpolation]
+
+    counts = np.zeros(ngroups, dtype=np.int64)
+    non_na_counts = np.zeros(ngroups, dtype=np.int64)
+
+    # figure out the size of every group, the na group sorts first
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                grp_start += 1
+                continue
+
+            counts[lab] += 1
+            if not mask[i]:
+                non_na_counts[lab] += 1
+
+    # an index of the values sorted by labels, then na-ness, then values
+    sort_arr = np.lexsort((values, mask, labels)).astype(np.int64,
+                                                         copy=False)
+
+    with nogil:
+        for i in range(ngroups):
+            non_na_sz = non_na_counts[i]
+
+            if non_na_sz == 0:
+                out[i] = NaN
+            else:
+                # position of the requested quantile among the sorted
+                # non-na values of this group
+                q_idx = q * (non_na_sz - 1)
+                idx = grp_start + <Py_ssize_t> q_idx
+                frac = q_idx - <Py_ssize_t> q_idx
+
+                val = values[sort_arr[idx]]
+                if frac == 0.0 or interp == INTERPOLATION_LOWER:
+                    out[i] = val
+                else:
+                    next_val = values[sort_arr[idx + 1]]
+                    if interp == INTERPOLATION_LINEAR:
+                        out[i] = val + (next_val - val) * frac
+                    elif interp == INTERPOLATION_HIGHER:
+                        out[i] = next_val
+                    elif interp == INTERPOLATION_MIDPOINT:
+                        out[i] = (val + next_val) / 2.0
+                    elif interp == INTERPOLATION_NEAREST:
+                        # round half to even, as numpy does
+                        if frac > .5 or (frac == .5 and
+                                         (<Py_ssize_t> q_idx) % 2 == 1):
+                            out[i] = next_val
+                        else:
+                            out[i] = val
+
+            grp_start += counts[i]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_fused_agg_float64(ndarray[float64_t, ndim=3] out,
+                            ndarray[int64_t] counts,
+                            ndarray[float64_t, ndim=2] values,
+                            ndarray[int64_t] labels,
+                            ndarray[int64_t] ops):
+    """Compute several reductions of every group in a single pass
+
+    Parameters
+    ----------
+    out : array of shape (len(ops), ngroups, K) which this method will
+        write the result of each reduction to, in the order of `ops`
+    counts : array which this method will write the size of each group to
+    values : array of shape (N, K) containing the values to reduce
+    labels : array containing the group label of each row of `values`
+    ops : array of the reductions to compute, see ``fused_aggregations``
+
+    Notes
+    -----
+    Only aggregates on axis=0. The results match those of the single
+    reduction kernels (``group_add_float64``, ``group_var_float64``, ...),
+    the labels and the na-ness of every value are only visited once.
+    """
+    cdef:
+        Py_ssize_t i, j, k, N, K, lab, ncounts = len(counts), nops = len(ops)
+        int64_t op
+        float64_t val, ct, oldmean
+        bint need_sum = False, need_prod = False, need_var = False
+        bint need_min = False, need_max = False
+        ndarray[float64_t, ndim=2] nobs, sumx, prodx, mean, ssqdm, minx, maxx
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    N, K = (<object> values).shape
+
+    for k in range(nops):
+        op = ops[k]
+        if op == FUSED_AGG_SUM or op == FUSED_AGG_MEAN:
+            need_sum = True
+        elif op == FUSED_AGG_PROD:
+            need_prod = True
+        elif op == FUSED_AGG_VAR:
+            need_var = True
+        elif op == FUSED_AGG_MIN:
+            need_min = True
+        elif op == FUSED_AGG_MAX:
+            need_max = True
+        elif op != FUSED_AGG_COUNT:
+            raise ValueError("unknown fused aggregation: {}".format(op))
+
+    # accumulators which are not needed are never touched in the loop
+    nobs = np.zeros((ncounts, K), dtype=np.float64)
+    sumx = np.zeros((ncounts, K) if need_sum else (0, 0), dtype=np.float64)
+    prodx = np.ones((ncounts, K) if need_prod else (0, 0), dtype=np.float64)
+    mean = np.zeros((ncounts, K) if need_var else (0, 0), dtype=np.float64)
+    ssqdm = np.zeros((ncounts, K) if need_var else (0, 0), dtype=np.float64)
+    minx = np.empty((ncounts, K) if need_min else (0, 0), dtype=np.float64)
+    maxx = np.empty((ncounts, K) if need_max else (0, 0), dtype=np.float64)
+    if need_min:
+        minx.fill(np.inf)
+    if need_max:
+        maxx.fill(-np.inf)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if need_sum:
+                        sumx[lab, j] += val
+                    if need_prod:
+                        prodx[lab, j] *= val
+                    if need_var:
+                        oldmean = mean[lab, j]
+                        mean[lab, j] += (val - oldmean) / nobs[lab, j]
+                        ssqdm[lab, j] += ((val - mean[lab, j]) *
+                                          (val - oldmean))
+                    if need_min and val < minx[lab, j]:
+                        minx[lab, j] = val
+                    if need_max and val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for k in range(nops):
+            op = ops[k]
+            for i in range(ncounts):
+                for j in range(K):
+                    ct = nobs[i, j]
+                    if op == FUSED_AGG_COUNT:
+                        out[k, i, j] = ct
+                    elif op == FUSED_AGG_VAR:
+                        if ct < 2:
+                            out[k, i, j] = NaN
+                        else:
+                            out[k, i, j] = ssqdm[i, j] / (ct - 1)
+                    elif ct == 0:
+                        out[k, i, j] = NaN
+                    elif op == FUSED_AGG_SUM:
+                        out[k, i, j] = sumx[i, j]
+                    elif op == FUSED_AGG_PROD:
+                        out[k, i, j] = prodx[i, j]
+                    elif op == FUSED_AGG_MEAN:
+                        out[k, i, j] = sumx[i, j] / ct
+                    elif op == FUSED_AGG_MIN:
+                        out[k, i, j] = minx[i, j]
+                    else:
+                        out[k, i, j] = maxx[i, j]
+
+
 # generated from template
 include "groupby_helper.pxi"
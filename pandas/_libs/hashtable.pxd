@@ -40,6 +40,9 @@ cdef class MultiIndexHashTable(HashTable):
     cpdef set_item(self, object key, Py_ssize_t val)
     cdef inline void _check_for_collision(self, Py_ssize_t loc, object label)
 
+cdef class MultiKeyHashTable(HashTable):
+    cdef kh_uint64_t *table
+
 
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
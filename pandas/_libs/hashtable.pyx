@@ -143,6 +143,81 @@ cdef class Int64Factorizer:
         return labels
 
 
+# number of bits set by each key of a BloomFilter
+cdef int _BLOOM_PROBES = 7
+
+
+cdef inline uint64_t _mix_uint64(uint64_t x) nogil:
+    # the splitmix64 finalizer
+    x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL
+    x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL
+    return x ^ (x >> 31)
+
+
+cdef class BloomFilter:
+    """
+    Blocked Bloom filter of uint64 keys, such as the bit patterns of
+    int64, float64 or datetime64 values.
+
+    Each key sets bits in a single 512 bit block, so adding or looking up
+    a key touches a single cache line. A lookup never misses an added
+    key, and with the default 10 bits per key about 1% of the other keys
+    are false positives.
+    """
+    cdef:
+        uint64_t[:] words
+        uint64_t nblocks
+
+    def __init__(self, Py_ssize_t size_hint, Py_ssize_t bits_per_key=10):
+        self.nblocks = max(1, (size_hint * bits_per_key + 511) // 512)
+        self.words = np.zeros(self.nblocks * 8, dtype=np.uint64)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def add(self, uint64_t[:] keys):
+        cdef:
+            Py_ssize_t i, n = len(keys)
+            uint64_t h, block, bit, step
+            int j
+
+        with nogil:
+            for i in range(n):
+                h = _mix_uint64(keys[i])
+                block = ((h >> 32) % self.nblocks) * 8
+                step = (h >> 9) | 1
+                for j in range(_BLOOM_PROBES):
+                    bit = (h + j * step) & 511
+                    self.words[block + (bit >> 6)] |= \
+                        (<uint64_t>1) << (bit & 63)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def contains(self, uint64_t[:] keys):
+        """
+        Return a boolean ndarray, True where the key may have been added
+        """
+        cdef:
+            Py_ssize_t i, n = len(keys)
+            uint64_t h, block, bit, step
+            int j
+            ndarray[uint8_t] result = np.empty(n, dtype=np.uint8)
+
+        with nogil:
+            for i in range(n):
+                h = _mix_uint64(keys[i])
+                block = ((h >> 32) % self.nblocks) * 8
+                step = (h >> 9) | 1
+                result[i] = 1
+                for j in range(_BLOOM_PROBES):
+                    bit = (h + j * step) & 511
+                    if not (self.words[block + (bit >> 6)] >>
+                            (bit & 63)) & 1:
+                        result[i] = 0
+                        break
+
+        return result.view(np.bool_)
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def unique_label_indices(ndarray[int64_t, ndim=1] labels):
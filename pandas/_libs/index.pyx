@@ -77,9 +77,21 @@ def set_value_at(ndarray arr, object loc, object val):
     return util.set_value_at(arr, loc, val)
 
 
-# Don't populate hash tables in monotonic indexes larger than this
+# Answer the first scalar lookups in indexes larger than this with a scan of
+# their values rather than populating a hash table
 _SIZE_CUTOFF = 1000000
 
+# Number of scalar lookups scanned before the hash table is populated
+_SCAN_LOOKUPS = 8
+
+# Don't keep the hash tables of indexes larger than this, None for no limit
+_HASHTABLE_MAX_SIZE = None
+
+
+def set_hashtable_max_size(size):
+    global _HASHTABLE_MAX_SIZE
+    _HASHTABLE_MAX_SIZE = size
+
 
 cdef class IndexEngine:
 
@@ -91,17 +103,39 @@ cdef class IndexEngine:
     cdef:
         bint unique, monotonic_inc, monotonic_dec
         bint need_monotonic_check, need_unique_check
+        Py_ssize_t size, lookups
 
     def __init__(self, vgetter, n):
         self.vgetter = vgetter
 
+        self.size = n
         self.over_size_threshold = n >= _SIZE_CUTOFF
         self.clear_mapping()
 
     def __contains__(self, object val):
-        self._ensure_mapping_populated()
         hash(val)
-        return val in self.mapping
+        if not self.is_mapping_populated and self.is_monotonic_increasing:
+            values = self._get_index_values_for_bool_indexer()
+            if len(values) == 0:
+                return False
+            try:
+                loc = _bin_search(values, val)
+                return (loc < len(values) and
+                        bool(util.get_value_at(values, loc) == val))
+            except (TypeError, ValueError):
+                return False
+
+        if not self._use_mapping(val):
+            try:
+                self._maybe_get_bool_indexer(val)
+            except KeyError:
+                return False
+            return True
+
+        self._ensure_mapping_populated()
+        mapping = self.mapping
+        self._maybe_release_mapping()
+        return val in mapping
 
     cpdef get_value(self, ndarray arr, object key, object tz=None):
         """
@@ -141,25 +175,37 @@ cdef class IndexEngine:
         if is_definitely_invalid_key(val):
             raise TypeError("'{val}' is an invalid key".format(val=val))
 
-        if self.over_size_threshold and self.is_monotonic_increasing:
+        # sorted values are searched without a hash table
+        if not self.is_mapping_populated and self.is_monotonic_increasing:
             if not self.is_unique:
                 return self._get_loc_duplicates(val)
-            values = self._get_index_values()
-            loc = _bin_search(values, val)  # .searchsorted(val, side='left')
-            if loc >= len(values):
+            self._check_type(val)
+            values = self._get_index_values_for_bool_indexer()
+            if len(values) == 0:
                 raise KeyError(val)
-            if util.get_value_at(values, loc) != val:
+            try:
+                loc = _bin_search(values, val)
+                if (loc >= len(values) or
+                        util.get_value_at(values, loc) != val):
+                    raise KeyError(val)
+            except (TypeError, ValueError):
                 raise KeyError(val)
             return loc
 
+        if not self._use_mapping(val):
+            self._check_type(val)
+            return self._maybe_get_bool_indexer(val)
+
         self._ensure_mapping_populated()
+        mapping = self.mapping
+        self._maybe_release_mapping()
         if not self.unique:
             return self._get_loc_duplicates(val)
 
         self._check_type(val)
 
         try:
-            return self.mapping.get_item(val)
+            return mapping.get_item(val)
         except (TypeError, ValueError):
             raise KeyError(val)
 
@@ -197,7 +243,8 @@ cdef class IndexEngine:
         indexer = result.view(np.uint8)
 
         for i in range(n):
-            if values[i] == val:
+            # the hash table matches identical objects, such as nan
+            if values[i] is val or values[i] == val:
                 count += 1
                 indexer[i] = 1
                 last_true = i
@@ -229,8 +276,15 @@ cdef class IndexEngine:
 
     cdef inline _do_unique_check(self):
 
+        # the uniqueness of monotonic values is known without a hash table
+        if self.need_monotonic_check:
+            self._do_monotonic_check()
+            if not self.need_unique_check:
+                return
+
         # this de-facto the same
         self._ensure_mapping_populated()
+        self._maybe_release_mapping()
 
     @property
     def is_monotonic_increasing(self):
@@ -259,14 +313,17 @@ cdef class IndexEngine:
 
         self.need_monotonic_check = 0
 
-        # we can only be sure of uniqueness if is_unique=1
-        if is_unique:
-            self.unique = 1
+        # uniqueness is only known for monotonic values, unless is_unique=1
+        if is_unique or self.monotonic_inc or self.monotonic_dec:
+            self.unique = is_unique
             self.need_unique_check = 0
 
     cdef _get_index_values(self):
         return self.vgetter()
 
+    cdef _get_index_values_for_bool_indexer(self):
+        return self._get_index_values()
+
     def _call_monotonic(self, values):
         raise NotImplementedError
 
@@ -276,6 +333,34 @@ cdef class IndexEngine:
     cdef _check_type(self, object val):
         hash(val)
 
+    cdef bint _can_scan(self, object val):
+        # whether val can be found in a scan of the values rather than
+        # looked up in the hash table
+        return False
+
+    cdef inline bint _use_mapping(self, object val) except -1:
+        # the hash table of an index larger than _SIZE_CUTOFF is only
+        # populated after _SCAN_LOOKUPS of its lookups, and never kept
+        # beyond _HASHTABLE_MAX_SIZE, where the values are always scanned
+        if self.is_mapping_populated or not self._can_scan(val):
+            return True
+        if self._over_max_size():
+            return False
+        if not self.over_size_threshold:
+            return True
+        self.lookups += 1
+        return self.lookups > _SCAN_LOOKUPS
+
+    cdef inline bint _over_max_size(self) except -1:
+        return (_HASHTABLE_MAX_SIZE is not None and
+                self.size > _HASHTABLE_MAX_SIZE)
+
+    cdef inline _maybe_release_mapping(self):
+        # free the hash table of an index over the size limit once it has
+        # been used, its uniqueness is still known
+        if self._over_max_size():
+            self.mapping = None
+
     @property
     def is_mapping_populated(self):
         return self.mapping is not None
@@ -307,10 +392,13 @@ cdef class IndexEngine:
         self.unique = 0
         self.monotonic_inc = 0
         self.monotonic_dec = 0
+        self.lookups = 0
 
     def get_indexer(self, values):
         self._ensure_mapping_populated()
-        return self.mapping.lookup(values)
+        mapping = self.mapping
+        self._maybe_release_mapping()
+        return mapping.lookup(values)
 
     def get_indexer_non_unique(self, targets):
         """ return an indexer suitable for takng from a non unique index
@@ -328,6 +416,7 @@ cdef class IndexEngine:
             Py_ssize_t i, j, n, n_t, n_alloc
 
         self._ensure_mapping_populated()
+        self._maybe_release_mapping()
         values = np.array(self._get_index_values(), copy=False)
         stargets = set(targets)
         n = len(values)
@@ -387,6 +476,9 @@ cdef Py_ssize_t _bin_search(ndarray values, object val) except -1:
     if hi >= 0 and val > util.get_value_at(values, hi):
         return len(values)
 
+    if hi < 0:
+        return 0
+
     while lo < hi:
         mid = (lo + hi) // 2
         pval = util.get_value_at(values, mid)
@@ -399,10 +491,11 @@ cdef Py_ssize_t _bin_search(ndarray values, object val) except -1:
                 mid -= 1
             return mid
 
-    if val <= util.get_value_at(values, mid):
-        return mid
+    # lo == hi, the first value which may not be below val
+    if val <= util.get_value_at(values, lo):
+        return lo
     else:
-        return mid + 1
+        return lo + 1
 
 _pad_functions = {
     'object': algos.pad_object,
@@ -423,16 +516,26 @@ cdef class DatetimeEngine(Int64Engine):
         return 'M8[ns]'
 
     def __contains__(self, object val):
-        if self.over_size_threshold and self.is_monotonic_increasing:
-            if not self.is_unique:
-                return self._get_loc_duplicates(val)
+        conv = maybe_datetimelike_to_i8(val)
+        if not self.is_mapping_populated and self.is_monotonic_increasing:
             values = self._get_index_values()
-            conv = maybe_datetimelike_to_i8(val)
-            loc = values.searchsorted(conv, side='left')
-            return util.get_value_at(values, loc) == conv
+            try:
+                loc = values.searchsorted(conv, side='left')
+            except TypeError:
+                return False
+            return loc < len(values) and util.get_value_at(values, loc) == conv
+
+        if not self._use_mapping(conv):
+            try:
+                self._maybe_get_bool_indexer(conv)
+            except KeyError:
+                return False
+            return True
 
         self._ensure_mapping_populated()
-        return maybe_datetimelike_to_i8(val) in self.mapping
+        mapping = self.mapping
+        self._maybe_release_mapping()
+        return conv in mapping
 
     cdef _get_index_values(self):
         return self.vgetter().view('i8')
@@ -445,7 +548,7 @@ cdef class DatetimeEngine(Int64Engine):
             raise TypeError
 
         # Welcome to the spaghetti factory
-        if self.over_size_threshold and self.is_monotonic_increasing:
+        if not self.is_mapping_populated and self.is_monotonic_increasing:
             if not self.is_unique:
                 val = maybe_datetimelike_to_i8(val)
                 return self._get_loc_duplicates(val)
@@ -462,21 +565,34 @@ cdef class DatetimeEngine(Int64Engine):
                 raise KeyError(val)
             return loc
 
+        try:
+            conv = maybe_datetimelike_to_i8(val)
+        except (TypeError, ValueError):
+            self._date_check_type(val)
+            raise KeyError(val)
+
+        if not self._use_mapping(conv):
+            try:
+                return self._maybe_get_bool_indexer(conv)
+            except KeyError:
+                raise KeyError(val)
+
         self._ensure_mapping_populated()
+        mapping = self.mapping
+        self._maybe_release_mapping()
         if not self.unique:
-            val = maybe_datetimelike_to_i8(val)
-            return self._get_loc_duplicates(val)
+            return self._get_loc_duplicates(conv)
 
         try:
-            return self.mapping.get_item(val.value)
+            return mapping.get_item(val.value)
         except KeyError:
             raise KeyError(val)
         except AttributeError:
             pass
 
         try:
-            val = maybe_datetimelike_to_i8(val)
-            return self.mapping.get_item(val)
+            val = conv
+            return mapping.get_item(val)
         except (TypeError, ValueError):
             self._date_check_type(val)
             raise KeyError(val)
@@ -488,10 +604,12 @@ cdef class DatetimeEngine(Int64Engine):
 
     def get_indexer(self, values):
         self._ensure_mapping_populated()
+        mapping = self.mapping
+        self._maybe_release_mapping()
         if values.dtype != self._get_box_dtype():
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
-        return self.mapping.lookup(values)
+        return mapping.lookup(values)
 
     def get_pad_indexer(self, other, limit=None):
         if other.dtype != self._get_box_dtype():
@@ -528,11 +646,13 @@ cdef class PeriodEngine(Int64Engine):
         cdef ndarray[int64_t, ndim=1] ordinals
 
         super(PeriodEngine, self)._ensure_mapping_populated()
+        mapping = self.mapping
+        self._maybe_release_mapping()
 
         freq = super(PeriodEngine, self).vgetter().freq
         ordinals = periodlib.extract_ordinals(values, freq)
 
-        return self.mapping.lookup(ordinals)
+        return mapping.lookup(ordinals)
 
     def get_pad_indexer(self, other, limit=None):
         freq = super(PeriodEngine, self).vgetter().freq
@@ -617,6 +737,16 @@ cdef class MultiIndexObjectEngine(ObjectEngine):
         # convert a MI to an ndarray
         if hasattr(val, 'values'):
             val = val.values
+
+        if self._over_max_size() and not self.is_mapping_populated:
+            # the hash table would not be kept
+            if is_definitely_invalid_key(val):
+                raise TypeError("'{val}' is an invalid key".format(val=val))
+            self._check_type(val)
+            return self._maybe_get_bool_indexer(val)
+
+        # tuples are looked up in the hash table rather than searched
+        self._ensure_mapping_populated()
         return super(MultiIndexObjectEngine, self).get_loc(val)
 
 
@@ -15,6 +15,9 @@ from numpy cimport (ndarray,
 cdef double NaN = <double> np.NaN
 cdef double nan = NaN
 
+from khash cimport (khiter_t, kh_int64_t, kh_init_int64, kh_resize_int64,
+                    kh_destroy_int64, kh_get_int64, kh_put_int64)
+
 from pandas._libs.algos import groupsort_indexer, ensure_platform_int
 from pandas.core.algorithms import take_nd
 
@@ -209,6 +212,359 @@ def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
             _get_result_indexer(right_sorter, right_indexer))
 
 
+# ----------------------------------------------------------------------
+# hash partitioned joins
+#
+# The rows of both sides are split by a hash of their key in partitions,
+# each of which is factorized and joined on its own, with the GIL
+# released, so that the partitions can be processed concurrently. A key
+# only ever falls in one partition, rows with a missing key all fall in
+# the first one.
+
+
+cdef inline Py_ssize_t _hash_partition(int64_t key,
+                                       Py_ssize_t nparts) nogil:
+    # splitmix64 finalizer, whose low bits do not depend on those of the
+    # khash hash, so that the keys of a partition spread in its table
+    cdef uint64_t x = <uint64_t> key
+    x = (x ^ (x >> 30)) * <uint64_t> 0xbf58476d1ce4e5b9ULL
+    x = (x ^ (x >> 27)) * <uint64_t> 0x94d049bb133111ebULL
+    x = x ^ (x >> 31)
+    return <Py_ssize_t> (x % <uint64_t> nparts)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def hash_partition_counts(int64_t[:] keys, uint8_t[:] mask,
+                          Py_ssize_t nparts, Py_ssize_t start,
+                          Py_ssize_t end, int64_t[:] counts):
+    """
+    Count the rows start to end of ``keys`` falling in each of the
+    ``nparts`` hash partitions, with the GIL released.
+
+    Parameters
+    ----------
+    keys : int64 ndarray
+    mask : uint8 ndarray
+        the rows with a missing key, empty if there is none
+    nparts : int
+    start, end : int
+        the range of rows to count
+    counts : int64 ndarray
+        the number of rows of each partition, added to
+    """
+    cdef:
+        Py_ssize_t i
+        bint has_mask = len(mask) > 0
+
+    with nogil:
+        for i in range(start, end):
+            if has_mask and mask[i]:
+                counts[0] += 1
+            else:
+                counts[_hash_partition(keys[i], nparts)] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def hash_partition_rows(int64_t[:] keys, uint8_t[:] mask,
+                        Py_ssize_t nparts, Py_ssize_t start,
+                        Py_ssize_t end, int64_t[:] offsets,
+                        int64_t[:] rows):
+    """
+    Write the rows start to end of ``keys`` in the locations of their hash
+    partition in ``rows``, with the GIL released. The rows of a partition
+    keep their order.
+
+    Parameters
+    ----------
+    keys : int64 ndarray
+    mask : uint8 ndarray
+        the rows with a missing key, empty if there is none
+    nparts : int
+    start, end : int
+        the range of rows to write
+    offsets : int64 ndarray
+        the next location of each partition in ``rows``, updated
+    rows : int64 ndarray
+        the rows of all the partitions, one after the other
+    """
+    cdef:
+        Py_ssize_t i, part
+        bint has_mask = len(mask) > 0
+
+    with nogil:
+        for i in range(start, end):
+            if has_mask and mask[i]:
+                part = 0
+            else:
+                part = _hash_partition(keys[i], nparts)
+            rows[offsets[part]] = i
+            offsets[part] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def factorize_partition(int64_t[:] left, uint8_t[:] left_mask,
+                        int64_t[:] right, uint8_t[:] right_mask,
+                        int64_t[:] left_rows, int64_t[:] right_rows,
+                        int64_t[:] left_labels, int64_t[:] right_labels,
+                        int64_t[:] first_rows):
+    """
+    Factorize the keys of the rows of a hash partition of both sides, the
+    left rows first, with the GIL released.
+
+    Parameters
+    ----------
+    left, right : int64 ndarray
+        the keys of all the rows
+    left_mask, right_mask : uint8 ndarray
+        the rows with a missing key, empty if there is none
+    left_rows, right_rows : int64 ndarray
+        the rows of the partition
+    left_labels, right_labels : int64 ndarray
+        the label of each row of the partition, filled
+    first_rows : int64 ndarray
+        the first row with each label, filled, right rows numbered after
+        the left ones and the missing key after all the rows
+
+    Returns
+    -------
+    the number of labels
+    """
+    cdef:
+        Py_ssize_t i, j, side, n, count = 0, na_label = -1, first
+        Py_ssize_t nleft = len(left), nright = len(right)
+        int ret = 0
+        int64_t[:] keys, rows, labels
+        uint8_t[:] mask
+        bint has_mask
+        kh_int64_t *table
+        khiter_t k
+
+    table = kh_init_int64()
+    try:
+        kh_resize_int64(table, len(left_rows) + len(right_rows))
+        for side in range(2):
+            if side == 0:
+                keys = left
+                mask = left_mask
+                rows = left_rows
+                labels = left_labels
+                first = 0
+            else:
+                keys = right
+                mask = right_mask
+                rows = right_rows
+                labels = right_labels
+                first = nleft
+            has_mask = len(mask) > 0
+            n = len(rows)
+
+            with nogil:
+                for j in range(n):
+                    i = rows[j]
+                    if has_mask and mask[i]:
+                        if na_label == -1:
+                            na_label = count
+                            first_rows[count] = nleft + nright
+                            count += 1
+                        labels[i] = na_label
+                        continue
+
+                    k = kh_get_int64(table, keys[i])
+                    if k != table.n_buckets:
+                        labels[i] = table.vals[k]
+                    else:
+                        k = kh_put_int64(table, keys[i], &ret)
+                        table.vals[k] = count
+                        first_rows[count] = first + i
+                        labels[i] = count
+                        count += 1
+    finally:
+        kh_destroy_int64(table)
+
+    return count
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def relabel_partition(int64_t[:] rows, int64_t[:] labels,
+                      int64_t[:] mapping):
+    """
+    Replace the labels of the rows of a partition by ``mapping[label]``,
+    with the GIL released.
+    """
+    cdef:
+        Py_ssize_t j, n = len(rows)
+
+    with nogil:
+        for j in range(n):
+            labels[rows[j]] = mapping[labels[rows[j]]]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def join_partition_sizes(int64_t[:] left_rows, int64_t[:] right_rows,
+                         int64_t[:] left_labels, int64_t[:] right_labels,
+                         int64_t[:] left_count, int64_t[:] right_count,
+                         int64_t[:] left_sorter, int64_t[:] right_sorter,
+                         int64_t[:] left_starts, int64_t[:] right_starts):
+    """
+    Count the rows of each label of a partition of both sides and order
+    them by label, with the GIL released.
+
+    Parameters
+    ----------
+    left_rows, right_rows : int64 ndarray
+        the rows of the partition, in order
+    left_labels, right_labels : int64 ndarray
+        the labels of the rows, in ``range(len(left_count))``
+    left_count, right_count : int64 ndarray
+        the number of rows of each label, filled
+    left_sorter, right_sorter : int64 ndarray
+        the rows of the partition ordered by label, filled
+    left_starts, right_starts : int64 ndarray
+        the location in the sorters of the rows of each label, filled
+    """
+    cdef:
+        Py_ssize_t side, j, g, n, ngroups = len(left_count)
+        int64_t[:] rows, labels, counts, sorter, starts
+
+    for side in range(2):
+        if side == 0:
+            rows = left_rows
+            labels = left_labels
+            counts = left_count
+            sorter = left_sorter
+            starts = left_starts
+        else:
+            rows = right_rows
+            labels = right_labels
+            counts = right_count
+            sorter = right_sorter
+            starts = right_starts
+        n = len(rows)
+
+        with nogil:
+            for g in range(ngroups):
+                counts[g] = 0
+            for j in range(n):
+                counts[labels[rows[j]]] += 1
+            if ngroups > 0:
+                starts[0] = 0
+            for g in range(1, ngroups):
+                starts[g] = starts[g - 1] + counts[g - 1]
+            for j in range(n):
+                g = labels[rows[j]]
+                sorter[starts[g]] = rows[j]
+                starts[g] += 1
+            for g in range(ngroups):
+                starts[g] -= counts[g]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_partition_by_label(int64_t[:] left_count, int64_t[:] right_count,
+                            int64_t[:] left_sorter, int64_t[:] right_sorter,
+                            int64_t[:] left_starts, int64_t[:] right_starts,
+                            int64_t[:] positions, int64_t[:] left_indexer,
+                            int64_t[:] right_indexer, bint keep_left,
+                            bint keep_right):
+    """
+    Fill the part of the join indexers made of the labels of a partition,
+    laid out as in inner_join, left_outer_join and full_outer_join, with
+    the GIL released.
+
+    Parameters
+    ----------
+    left_count, right_count, left_sorter, right_sorter,
+    left_starts, right_starts : int64 ndarray
+        as filled by join_partition_sizes
+    positions : int64 ndarray
+        the location in the join indexers of the rows of each label
+    left_indexer, right_indexer : int64 ndarray
+        the join indexers to fill
+    keep_left, keep_right : boolean
+        whether to keep the unmatched left / right rows
+    """
+    cdef:
+        Py_ssize_t g, j, k, position, lpos, rpos
+        Py_ssize_t ngroups = len(left_count)
+        int64_t lc, rc
+
+    with nogil:
+        for g in range(ngroups):
+            lc = left_count[g]
+            rc = right_count[g]
+            position = positions[g]
+            lpos = left_starts[g]
+            rpos = right_starts[g]
+
+            if rc == 0:
+                if keep_left:
+                    for j in range(lc):
+                        left_indexer[position + j] = left_sorter[lpos + j]
+                        right_indexer[position + j] = -1
+            elif lc == 0:
+                if keep_right:
+                    for j in range(rc):
+                        left_indexer[position + j] = -1
+                        right_indexer[position + j] = right_sorter[rpos + j]
+            else:
+                for j in range(lc):
+                    for k in range(rc):
+                        left_indexer[position + j * rc + k] = \
+                            left_sorter[lpos + j]
+                        right_indexer[position + j * rc + k] = \
+                            right_sorter[rpos + k]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_partition_by_left_row(int64_t[:] left_rows, int64_t[:] left_labels,
+                               int64_t[:] right_count,
+                               int64_t[:] right_sorter,
+                               int64_t[:] right_starts,
+                               int64_t[:] positions,
+                               int64_t[:] left_indexer,
+                               int64_t[:] right_indexer):
+    """
+    Fill the part of the indexers of a left join made of the left rows of a
+    partition, laid out in the order of the left rows as in
+    left_outer_join with sort=False, with the GIL released.
+
+    Parameters
+    ----------
+    left_rows, left_labels : int64 ndarray
+        the left rows of the partition and the labels of the rows
+    right_count, right_sorter, right_starts : int64 ndarray
+        as filled by join_partition_sizes
+    positions : int64 ndarray
+        the location in the join indexers of each left row
+    left_indexer, right_indexer : int64 ndarray
+        the join indexers to fill
+    """
+    cdef:
+        Py_ssize_t i, j, k, g, position, n = len(left_rows)
+        int64_t rc
+
+    with nogil:
+        for j in range(n):
+            i = left_rows[j]
+            g = left_labels[i]
+            rc = right_count[g]
+            position = positions[i]
+            if rc == 0:
+                left_indexer[position] = i
+                right_indexer[position] = -1
+            else:
+                for k in range(rc):
+                    left_indexer[position + k] = i
+                    right_indexer[position + k] = \
+                        right_sorter[right_starts[g] + k]
+
+
 def _get_result_indexer(sorter, indexer):
     if len(sorter) > 0:
         res = take_nd(sorter, indexer, fill_value=-1)
@@ -413,10 +413,10 @@ def convert_timestamps(ndarray values):
     return out
 
 
-def maybe_indices_to_slice(ndarray[int64_t] indices, int max_len):
+def maybe_indices_to_slice(ndarray[int64_t] indices, Py_ssize_t max_len):
     cdef:
         Py_ssize_t i, n = len(indices)
-        int k, vstart, vlast, v
+        Py_ssize_t k, vstart, vlast, v
 
     if n == 0:
         return slice(0, 0)
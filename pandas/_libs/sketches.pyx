@@ -0,0 +1,187 @@
+# cython: profile=False
+# cython: boundscheck=False, wraparound=False, cdivision=True
+
+"""
+Kernels of the HyperLogLog and t-digest sketches of pandas.core.sketches
+"""
+
+from cython cimport Py_ssize_t
+
+cimport numpy as cnp
+import numpy as np
+
+from numpy cimport ndarray, uint8_t, uint64_t, int64_t, float64_t
+
+from libc.math cimport asin, sin, log, ldexp, M_PI
+
+cnp.import_array()
+
+
+# ----------------------------------------------------------------------
+# HyperLogLog
+
+cdef inline uint8_t _hll_rank(uint64_t h, int p) nogil:
+    # one plus the number of leading zeros of the bits of h after the
+    # register index, a guard bit bounds it by 64 - p + 1
+    cdef:
+        uint64_t w = (h << p) | ((<uint64_t>1) << (p - 1))
+        uint8_t rank = 1
+
+    while not (w & ((<uint64_t>1) << 63)):
+        w <<= 1
+        rank += 1
+    return rank
+
+
+def hll_update(uint8_t[:] registers, uint64_t[:] hashes, int p):
+    """
+    Add the ``hashes`` to the ``2 ** p`` HyperLogLog ``registers`` in place
+    """
+    cdef:
+        Py_ssize_t i, n = len(hashes)
+        uint64_t h, idx
+        uint8_t rank
+
+    with nogil:
+        for i in range(n):
+            h = hashes[i]
+            idx = h >> (64 - p)
+            rank = _hll_rank(h, p)
+            if rank > registers[idx]:
+                registers[idx] = rank
+
+
+def group_hll_update(uint8_t[:, :] registers, uint64_t[:] hashes,
+                     int64_t[:] labels, int p):
+    """
+    Add the ``hashes`` to the HyperLogLog registers of their group, the row
+    of ``registers`` given by ``labels``, in place. Labels of -1 are skipped.
+    """
+    cdef:
+        Py_ssize_t i, lab, n = len(hashes)
+        uint64_t h, idx
+        uint8_t rank
+
+    with nogil:
+        for i in range(n):
+            lab = labels[i]
+            if lab < 0:
+                continue
+            h = hashes[i]
+            idx = h >> (64 - p)
+            rank = _hll_rank(h, p)
+            if rank > registers[lab, idx]:
+                registers[lab, idx] = rank
+
+
+def hll_estimate(uint8_t[:, :] registers):
+    """
+    Estimate the number of distinct hashes added to each row of HyperLogLog
+    ``registers``, with the linear counting correction of small counts
+    """
+    cdef:
+        Py_ssize_t i, j, k = registers.shape[0], m = registers.shape[1]
+        Py_ssize_t zeros
+        float64_t alpha, total, estimate
+        ndarray[float64_t] result = np.empty(k, dtype=np.float64)
+
+    if m == 16:
+        alpha = 0.673
+    elif m == 32:
+        alpha = 0.697
+    elif m == 64:
+        alpha = 0.709
+    else:
+        alpha = 0.7213 / (1 + 1.079 / m)
+
+    with nogil:
+        for i in range(k):
+            total = 0
+            zeros = 0
+            for j in range(m):
+                total += ldexp(1.0, -<int> registers[i, j])
+                if registers[i, j] == 0:
+                    zeros += 1
+
+            estimate = alpha * m * m / total
+            if estimate <= 2.5 * m and zeros > 0:
+                estimate = m * log(<float64_t> m / zeros)
+            result[i] = estimate
+
+    return result
+
+
+# ----------------------------------------------------------------------
+# t-digest
+
+cdef inline float64_t _tdigest_q_limit(float64_t q,
+                                       float64_t normalizer) nogil:
+    # the quantile up to which a centroid starting at q may grow, one unit
+    # of the k1 scale function k(q) = normalizer * asin(2 * q - 1) away
+    cdef float64_t k = asin(2 * q - 1) + 1 / normalizer
+    if k >= M_PI / 2:
+        return 1
+    return (sin(k) + 1) / 2
+
+
+def tdigest_merge(float64_t[:] means_a, float64_t[:] weights_a,
+                  float64_t[:] means_b, float64_t[:] weights_b,
+                  float64_t compression):
+    """
+    Merge two lists of t-digest centroids, each sorted by mean, into a
+    single sorted and compressed list of centroids
+
+    Parameters
+    ----------
+    means_a, weights_a : float64 ndarray
+        the first centroids
+    means_b, weights_b : float64 ndarray
+        the second centroids
+    compression : float
+        bounds the number of centroids
+
+    Returns
+    -------
+    tuple of (means, weights) float64 ndarrays
+    """
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = -1
+        Py_ssize_t na = len(means_a), nb = len(means_b)
+        float64_t total = 0, weight_so_far = 0, q_limit = 0
+        float64_t normalizer = compression / (2 * M_PI)
+        float64_t mean, weight, proposed
+        ndarray[float64_t] out_means = np.empty(na + nb, dtype=np.float64)
+        ndarray[float64_t] out_weights = np.empty(na + nb, dtype=np.float64)
+
+    with nogil:
+        for i in range(na):
+            total += weights_a[i]
+        for j in range(nb):
+            total += weights_b[j]
+
+        i = 0
+        j = 0
+        while i < na or j < nb:
+            if j == nb or (i < na and means_a[i] <= means_b[j]):
+                mean = means_a[i]
+                weight = weights_a[i]
+                i += 1
+            else:
+                mean = means_b[j]
+                weight = weights_b[j]
+                j += 1
+
+            if k >= 0:
+                proposed = out_weights[k] + weight
+                if (weight_so_far + proposed) / total <= q_limit:
+                    out_weights[k] = proposed
+                    out_means[k] += (mean - out_means[k]) * weight / proposed
+                    continue
+                weight_so_far += out_weights[k]
+
+            k += 1
+            out_means[k] = mean
+            out_weights[k] = weight
+            q_limit = _tdigest_q_limit(weight_so_far / total, normalizer)
+
+    return out_means[:k + 1].copy(), out_weights[:k + 1].copy()
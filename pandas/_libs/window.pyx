@@ -16,8 +16,7 @@ from libc.stdlib cimport malloc, free
 
 from numpy cimport ndarray, double_t, int64_t, float64_t
 
-from skiplist cimport (IndexableSkiplist,
-                       node_t, skiplist_t,
+from skiplist cimport (node_t, skiplist_t,
                        skiplist_init, skiplist_destroy,
                        skiplist_get, skiplist_insert, skiplist_remove)
 
@@ -437,20 +436,15 @@ cdef inline void remove_sum(double val, int64_t *nobs, double *sum_x) nogil:
         sum_x[0] = sum_x[0] - val
 
 
-def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
-             object index, object closed):
+cdef void _roll_sum_column(double_t[:, :] input, double_t[:, :] output,
+                           Py_ssize_t k, int64_t[:] start, int64_t[:] end,
+                           int64_t N, int64_t win, int64_t minp,
+                           bint is_variable) nogil:
+    """ rolling sum of the k-th column of input into output """
     cdef:
         double val, prev_x, sum_x = 0
         int64_t s, e
-        int64_t nobs = 0, i, j, N
-        bint is_variable
-        ndarray[int64_t] start, end
-        ndarray[double_t] output
-
-    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
+        int64_t nobs = 0, i, j
 
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we have 2 paths
@@ -459,51 +453,81 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
     if is_variable:
 
         # variable window
-        with nogil:
-
-            for i in range(0, N):
-                s = start[i]
-                e = end[i]
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-                if i == 0:
+            if i == 0:
 
-                    # setup
-                    sum_x = 0.0
-                    nobs = 0
-                    for j in range(s, e):
-                        add_sum(input[j], &nobs, &sum_x)
+                # setup
+                sum_x = 0.0
+                nobs = 0
+                for j in range(s, e):
+                    add_sum(input[j, k], &nobs, &sum_x)
 
-                else:
+            else:
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_sum(input[j], &nobs, &sum_x)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    remove_sum(input[j, k], &nobs, &sum_x)
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_sum(input[j], &nobs, &sum_x)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    add_sum(input[j, k], &nobs, &sum_x)
 
-                output[i] = calc_sum(minp, nobs, sum_x)
+            output[i, k] = calc_sum(minp, nobs, sum_x)
 
     else:
 
         # fixed window
+        for i in range(0, minp - 1):
+            add_sum(input[i, k], &nobs, &sum_x)
+            output[i, k] = NaN
 
-        with nogil:
+        for i in range(minp - 1, N):
+            val = input[i, k]
+            add_sum(val, &nobs, &sum_x)
 
-            for i in range(0, minp - 1):
-                add_sum(input[i], &nobs, &sum_x)
-                output[i] = NaN
+            if i > win - 1:
+                prev_x = input[i - win, k]
+                remove_sum(prev_x, &nobs, &sum_x)
 
-            for i in range(minp - 1, N):
-                val = input[i]
-                add_sum(val, &nobs, &sum_x)
+            output[i, k] = calc_sum(minp, nobs, sum_x)
 
-                if i > win - 1:
-                    prev_x = input[i - win]
-                    remove_sum(prev_x, &nobs, &sum_x)
 
-                output[i] = calc_sum(minp, nobs, sum_x)
+def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
+             object index, object closed):
+    return roll_sum_2d(input[:, None], win, minp, index, closed)[:, 0]
+
+
+def roll_sum_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                object index, object closed):
+    """
+    Rolling sum of each column of a 2d array along axis=0, computed
+    in a single call with the GIL released.
+    """
+    cdef:
+        int64_t N
+        bint is_variable
+        Py_ssize_t k, K
+        int64_t[:] start, end
+        ndarray[double_t, ndim=2] output
+        double_t[:, :] values, out
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               closed)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float, order='F')
+
+    # walk the columns contiguously
+    values = np.asfortranarray(input)
+    out = output
+
+    with nogil:
+        for k in range(K):
+            _roll_sum_column(values, out, k, start, end, N, win, minp,
+                             is_variable)
 
     return output
 
@@ -553,20 +577,15 @@ cdef inline void remove_mean(double val, Py_ssize_t *nobs, double *sum_x,
             neg_ct[0] = neg_ct[0] - 1
 
 
-def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
-              object index, object closed):
+cdef void _roll_mean_column(double_t[:, :] input, double_t[:, :] output,
+                            Py_ssize_t k, int64_t[:] start, int64_t[:] end,
+                            int64_t N, int64_t win, int64_t minp,
+                            bint is_variable) nogil:
+    """ rolling mean of the k-th column of input into output """
     cdef:
-        double val, prev_x, result, sum_x = 0
+        double val, prev_x, sum_x = 0
         int64_t s, e
-        bint is_variable
-        Py_ssize_t nobs = 0, i, j, neg_ct = 0, N
-        ndarray[int64_t] start, end
-        ndarray[double_t] output
-
-    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
+        Py_ssize_t nobs = 0, i, j, neg_ct = 0
 
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we have 2 paths
@@ -574,52 +593,84 @@ def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
 
     if is_variable:
 
-        with nogil:
-
-            for i in range(0, N):
-                s = start[i]
-                e = end[i]
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-                if i == 0:
+            if i == 0:
 
-                    # setup
-                    sum_x = 0.0
-                    nobs = 0
-                    for j in range(s, e):
-                        val = input[j]
-                        add_mean(val, &nobs, &sum_x, &neg_ct)
+                # setup
+                sum_x = 0.0
+                nobs = 0
+                for j in range(s, e):
+                    val = input[j, k]
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                else:
+            else:
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        val = input[j]
-                        remove_mean(val, &nobs, &sum_x, &neg_ct)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = input[j, k]
+                    remove_mean(val, &nobs, &sum_x, &neg_ct)
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        val = input[j]
-                        add_mean(val, &nobs, &sum_x, &neg_ct)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = input[j, k]
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+            output[i, k] = calc_mean(minp, nobs, neg_ct, sum_x)
 
     else:
 
-        with nogil:
-            for i from 0 <= i < minp - 1:
-                val = input[i]
-                add_mean(val, &nobs, &sum_x, &neg_ct)
-                output[i] = NaN
+        for i from 0 <= i < minp - 1:
+            val = input[i, k]
+            add_mean(val, &nobs, &sum_x, &neg_ct)
+            output[i, k] = NaN
 
-            for i from minp - 1 <= i < N:
-                val = input[i]
-                add_mean(val, &nobs, &sum_x, &neg_ct)
+        for i from minp - 1 <= i < N:
+            val = input[i, k]
+            add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                if i > win - 1:
-                    prev_x = input[i - win]
-                    remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
+            if i > win - 1:
+                prev_x = input[i - win, k]
+                remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
+
+            output[i, k] = calc_mean(minp, nobs, neg_ct, sum_x)
 
-                output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+
+def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
+              object index, object closed):
+    return roll_mean_2d(input[:, None], win, minp, index, closed)[:, 0]
+
+
+def roll_mean_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                 object index, object closed):
+    """
+    Rolling mean of each column of a 2d array along axis=0, computed
+    in a single call with the GIL released.
+    """
+    cdef:
+        int64_t N
+        bint is_variable
+        Py_ssize_t k, K
+        int64_t[:] start, end
+        ndarray[double_t, ndim=2] output
+        double_t[:, :] values, out
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               closed)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float, order='F')
+
+    # walk the columns contiguously
+    values = np.asfortranarray(input)
+    out = output
+
+    with nogil:
+        for k in range(K):
+            _roll_mean_column(values, out, k, start, end, N, win, minp,
+                              is_variable)
 
     return output
 
@@ -682,26 +733,15 @@ cdef inline void remove_var(double val, double *nobs, double *mean_x,
             ssqdm_x[0] = 0
 
 
-def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
-             object index, object closed, int ddof=1):
-    """
-    Numerically stable implementation using Welford's method.
-    """
+cdef void _roll_var_column(double_t[:, :] input, double_t[:, :] output,
+                           Py_ssize_t k, int64_t[:] start, int64_t[:] end,
+                           int64_t N, int64_t win, int64_t minp,
+                           bint is_variable, int ddof) nogil:
+    """ rolling variance of the k-th column of input into output """
     cdef:
         double val, prev, mean_x = 0, ssqdm_x = 0, nobs = 0, delta, mean_x_old
         int64_t s, e
-        bint is_variable
-        Py_ssize_t i, j, N
-        ndarray[int64_t] start, end
-        ndarray[double_t] output
-
-    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
-
-    # Check for windows larger than array, addresses #7297
-    win = min(win, N)
+        Py_ssize_t i, j
 
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we
@@ -709,72 +749,110 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
 
     if is_variable:
 
-        with nogil:
-
-            for i in range(0, N):
+        for i in range(0, N):
 
-                s = start[i]
-                e = end[i]
+            s = start[i]
+            e = end[i]
 
-                # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+            # Over the first window, observations can only be added
+            # never removed
+            if i == 0:
 
-                    for j in range(s, e):
-                        add_var(input[j], &nobs, &mean_x, &ssqdm_x)
+                for j in range(s, e):
+                    add_var(input[j, k], &nobs, &mean_x, &ssqdm_x)
 
-                else:
+            else:
 
-                    # After the first window, observations can both be added
-                    # and removed
+                # After the first window, observations can both be added
+                # and removed
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_var(input[j], &nobs, &mean_x, &ssqdm_x)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    add_var(input[j, k], &nobs, &mean_x, &ssqdm_x)
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_var(input[j], &nobs, &mean_x, &ssqdm_x)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    remove_var(input[j, k], &nobs, &mean_x, &ssqdm_x)
 
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+            output[i, k] = calc_var(minp, ddof, nobs, ssqdm_x)
 
     else:
 
-        with nogil:
+        # Over the first window, observations can only be added, never
+        # removed
+        for i from 0 <= i < win:
+            add_var(input[i, k], &nobs, &mean_x, &ssqdm_x)
+            output[i, k] = calc_var(minp, ddof, nobs, ssqdm_x)
 
-            # Over the first window, observations can only be added, never
-            # removed
-            for i from 0 <= i < win:
-                add_var(input[i], &nobs, &mean_x, &ssqdm_x)
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+        # a part of Welford's method for the online variance-calculation
+        # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
 
-            # a part of Welford's method for the online variance-calculation
-            # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+        # After the first window, observations can both be added and
+        # removed
+        for i from win <= i < N:
+            val = input[i, k]
+            prev = input[i - win, k]
 
-            # After the first window, observations can both be added and
-            # removed
-            for i from win <= i < N:
-                val = input[i]
-                prev = input[i - win]
+            if val == val:
+                if prev == prev:
+
+                    # Adding one observation and removing another one
+                    delta = val - prev
+                    mean_x_old = mean_x
 
-                if val == val:
-                    if prev == prev:
+                    mean_x += delta / nobs
+                    ssqdm_x += ((nobs - 1) * val
+                                + (nobs + 1) * prev
+                                - 2 * nobs * mean_x_old) * delta / nobs
 
-                        # Adding one observation and removing another one
-                        delta = val - prev
-                        mean_x_old = mean_x
+                else:
+                    add_var(val, &nobs, &mean_x, &ssqdm_x)
+            elif prev == prev:
+                remove_var(prev, &nobs, &mean_x, &ssqdm_x)
 
-                        mean_x += delta / nobs
-                        ssqdm_x += ((nobs - 1) * val
-                                    + (nobs + 1) * prev
-                                    - 2 * nobs * mean_x_old) * delta / nobs
+            output[i, k] = calc_var(minp, ddof, nobs, ssqdm_x)
+
+
+def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
+             object index, object closed, int ddof=1):
+    """
+    Numerically stable implementation using Welford's method.
+    """
+    return roll_var_2d(input[:, None], win, minp, index, closed,
+                       ddof=ddof)[:, 0]
 
-                    else:
-                        add_var(val, &nobs, &mean_x, &ssqdm_x)
-                elif prev == prev:
-                    remove_var(prev, &nobs, &mean_x, &ssqdm_x)
 
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+def roll_var_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                object index, object closed, int ddof=1):
+    """
+    Rolling variance of each column of a 2d array along axis=0, computed
+    in a single call with the GIL released.
+    """
+    cdef:
+        int64_t N
+        bint is_variable
+        Py_ssize_t k, K
+        int64_t[:] start, end
+        ndarray[double_t, ndim=2] output
+        double_t[:, :] values, out
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               closed)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float, order='F')
+
+    # Check for windows larger than array, addresses #7297
+    win = min(win, N)
+
+    # walk the columns contiguously
+    values = np.asfortranarray(input)
+    out = output
+
+    with nogil:
+        for k in range(K):
+            _roll_var_column(values, out, k, start, end, N, win, minp,
+                             is_variable, ddof)
 
     return output
 
@@ -1068,7 +1146,8 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
         use_mock=False)
     output = np.empty(N, dtype=float)
 
-    sl = skiplist_init(<int>win)
+    # a variable window may be empty everywhere
+    sl = skiplist_init(<int>int_max(win, 1))
     if sl == NULL:
         raise MemoryError("skiplist_init failed")
 
@@ -1080,13 +1159,15 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
 
             if i == 0:
 
-                # setup
-                val = input[i]
-                if val == val:
-                    nobs += 1
-                    err = skiplist_insert(sl, val) != 1
-                    if err:
-                        break
+                # setup, the first window of a variable window
+                # may be empty (closed='left' or 'neither')
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
             else:
 
@@ -1106,7 +1187,10 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
                         if err:
                             break
 
-            if nobs >= minp:
+            if err:
+                break
+
+            if nobs >= minp and nobs > 0:
                 midpoint = <int>(nobs / 2)
                 if nobs % 2:
                     res = skiplist_get(sl, midpoint, &ret)
@@ -1190,7 +1274,9 @@ def roll_max(ndarray[numeric] input, int64_t win, int64_t minp,
             make the interval closed on the right, left,
             both or neither endpoints
     """
-    return _roll_min_max(input, win, minp, index, closed=closed, is_max=1)
+    cdef ndarray[numeric, ndim=2] values = input[:, None]
+    return _roll_min_max(values, win, minp, index,
+                         closed=closed, is_max=1)[:, 0]
 
 
 def roll_min(ndarray[numeric] input, int64_t win, int64_t minp,
@@ -1207,26 +1293,42 @@ def roll_min(ndarray[numeric] input, int64_t win, int64_t minp,
     index: ndarray, optional
        index for window computation
     """
-    return _roll_min_max(input, win, minp, index, is_max=0, closed=closed)
+    cdef ndarray[numeric, ndim=2] values = input[:, None]
+    return _roll_min_max(values, win, minp, index,
+                         is_max=0, closed=closed)[:, 0]
 
 
-cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
-                   object index, object closed, bint is_max):
+def roll_max_2d(ndarray[numeric, ndim=2] input, int64_t win, int64_t minp,
+                object index, object closed):
+    """
+    Moving max of each column of a 2d array along axis=0 ignoring NaNs,
+    computed in a single call with the GIL released.
+    """
+    return _roll_min_max(input, win, minp, index, closed=closed, is_max=1)
+
+
+def roll_min_2d(ndarray[numeric, ndim=2] input, int64_t win, int64_t minp,
+                object index, object closed):
     """
-    Moving min/max of 1d array of any numeric type along axis=0
-    ignoring NaNs.
+    Moving min of each column of a 2d array along axis=0 ignoring NaNs,
+    computed in a single call with the GIL released.
     """
+    return _roll_min_max(input, win, minp, index, closed=closed, is_max=0)
+
+
+cdef void _roll_min_max_column(numeric[:, :] input, numeric[:, :] output,
+                               Py_ssize_t k, int64_t[:] starti,
+                               int64_t[:] endi, int64_t N, int64_t win,
+                               int64_t minp, bint is_variable, bint is_max,
+                               numeric* ring, int64_t* death) nogil:
+    """ moving min/max of the k-th column of input into output """
 
     cdef:
         numeric ai
-        bint is_variable, should_replace
-        int64_t s, e, N, i, j, removed
+        bint should_replace
+        int64_t s, e, i, j
         Py_ssize_t nobs = 0
-        ndarray[int64_t] starti, endi
-        ndarray[numeric, ndim=1] output
     cdef:
-        int64_t* death
-        numeric* ring
         numeric* minvalue
         numeric* end
         numeric* last
@@ -1234,106 +1336,133 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
     cdef:
         cdef numeric r
 
-    starti, endi, N, win, minp, is_variable = get_window_indexer(
-        input, win,
-        minp, index, closed)
-
-    output = np.empty(N, dtype=input.dtype)
-
     if is_variable:
 
-        with nogil:
-
-            for i in range(N):
-                s = starti[i]
-                e = endi[i]
+        for i in range(N):
+            s = starti[i]
+            e = endi[i]
 
-                r = input[s]
-                nobs = 0
-                for j in range(s, e):
+            r = input[s, k]
+            nobs = 0
+            for j in range(s, e):
 
-                    # adds, death at the i offset
-                    ai = init_mm(input[j], &nobs, is_max)
+                # adds, death at the i offset
+                ai = init_mm(input[j, k], &nobs, is_max)
 
-                    if is_max:
-                        if ai > r:
-                            r = ai
-                    else:
-                        if ai < r:
-                            r = ai
+                if is_max:
+                    if ai > r:
+                        r = ai
+                else:
+                    if ai < r:
+                        r = ai
 
-                output[i] = calc_mm(minp, nobs, r)
+            output[i, k] = calc_mm(minp, nobs, r)
 
     else:
 
-        # setup the rings of death!
-        ring = <numeric *>malloc(win * sizeof(numeric))
-        death = <int64_t *>malloc(win * sizeof(int64_t))
-
         end = ring + win
         last = ring
         minvalue = ring
-        ai = input[0]
-        minvalue[0] = init_mm(input[0], &nobs, is_max)
+        ai = input[0, k]
+        minvalue[0] = init_mm(input[0, k], &nobs, is_max)
         death[0] = win
         nobs = 0
 
-        with nogil:
+        for i in range(N):
+            ai = init_mm(input[i, k], &nobs, is_max)
 
-            for i in range(N):
-                ai = init_mm(input[i], &nobs, is_max)
+            if i >= win:
+                remove_mm(input[i - win, k], &nobs)
 
-                if i >= win:
-                    remove_mm(input[i - win], &nobs)
+            if death[minvalue - ring] == i:
+                minvalue = minvalue + 1
+                if minvalue >= end:
+                    minvalue = ring
 
-                if death[minvalue - ring] == i:
-                    minvalue = minvalue + 1
-                    if minvalue >= end:
-                        minvalue = ring
+            if is_max:
+                should_replace = ai >= minvalue[0]
+            else:
+                should_replace = ai <= minvalue[0]
+            if should_replace:
 
-                if is_max:
-                    should_replace = ai >= minvalue[0]
-                else:
-                    should_replace = ai <= minvalue[0]
-                if should_replace:
+                minvalue[0] = ai
+                death[minvalue - ring] = i + win
+                last = minvalue
 
-                    minvalue[0] = ai
-                    death[minvalue - ring] = i + win
-                    last = minvalue
+            else:
 
+                if is_max:
+                    should_replace = last[0] <= ai
                 else:
-
+                    should_replace = last[0] >= ai
+                while should_replace:
+                    if last == ring:
+                        last = end
+                    last -= 1
                     if is_max:
                         should_replace = last[0] <= ai
                     else:
                         should_replace = last[0] >= ai
-                    while should_replace:
-                        if last == ring:
-                            last = end
-                        last -= 1
-                        if is_max:
-                            should_replace = last[0] <= ai
-                        else:
-                            should_replace = last[0] >= ai
-
-                    last += 1
-                    if last == end:
-                        last = ring
-                    last[0] = ai
-                    death[last - ring] = i + win
-
-                output[i] = calc_mm(minp, nobs, minvalue[0])
-
-            for i in range(minp - 1):
-                if numeric in cython.floating:
-                    output[i] = NaN
-                else:
-                    output[i] = 0
 
-            free(ring)
-            free(death)
+                last += 1
+                if last == end:
+                    last = ring
+                last[0] = ai
+                death[last - ring] = i + win
+
+            output[i, k] = calc_mm(minp, nobs, minvalue[0])
+
+        for i in range(minp - 1):
+            if numeric in cython.floating:
+                output[i, k] = NaN
+            else:
+                output[i, k] = 0
+
+
+cdef _roll_min_max(ndarray[numeric, ndim=2] input, int64_t win, int64_t minp,
+                   object index, object closed, bint is_max):
+    """
+    Moving min/max of each column of a 2d array of any numeric type
+    along axis=0 ignoring NaNs.
+    """
+
+    cdef:
+        bint is_variable
+        int64_t N
+        Py_ssize_t k, K
+        int64_t[:] starti, endi
+        ndarray[numeric, ndim=2] output
+        numeric[:, :] values, out
+    cdef:
+        int64_t* death = NULL
+        numeric* ring = NULL
+
+    starti, endi, N, win, minp, is_variable = get_window_indexer(
+        input, win,
+        minp, index, closed)
+
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=input.dtype, order='F')
+    if N == 0:
+        return output
+
+    # walk the columns contiguously
+    values = np.asfortranarray(input)
+    out = output
+
+    if not is_variable:
+        # setup the rings of death!, shared by all of the columns
+        ring = <numeric *>malloc(win * sizeof(numeric))
+        death = <int64_t *>malloc(win * sizeof(int64_t))
+
+    with nogil:
+        for k in range(K):
+            _roll_min_max_column(values, out, k, starti, endi, N, win,
+                                 minp, is_variable, is_max, ring, death)
+
+    free(ring)
+    free(death)
 
-    # print("output: {0}".format(output))
     return output
 
 
@@ -1344,14 +1473,15 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
     O(N log(window)) implementation using skip list
     """
     cdef:
-        double val, prev, midpoint
-        IndexableSkiplist skiplist
+        double val, res, vlow, vhigh
+        bint err = 0
+        int ret = 0
+        skiplist_t *sl
         int64_t nobs = 0, i, j, s, e, N
         Py_ssize_t idx
         bint is_variable
         ndarray[int64_t] start, end
         ndarray[double_t] output
-        double vlow, vhigh
 
     if quantile <= 0.0 or quantile >= 1.0:
         raise ValueError("quantile value {0} not in [0, 1]".format(quantile))
@@ -1363,52 +1493,71 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
         minp, index, closed,
         use_mock=False)
     output = np.empty(N, dtype=float)
-    skiplist = IndexableSkiplist(win)
 
-    for i in range(0, N):
-        s = start[i]
-        e = end[i]
+    # a variable window may be empty everywhere
+    sl = skiplist_init(<int>int_max(win, 1))
+    if sl == NULL:
+        raise MemoryError("skiplist_init failed")
 
-        if i == 0:
+    with nogil:
 
-            # setup
-            val = input[i]
-            if val == val:
-                nobs += 1
-                skiplist.insert(val)
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-        else:
+            if i == 0:
+
+                # setup, the first window of a variable window
+                # may be empty (closed='left' or 'neither')
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
-            # calculate deletes
-            for j in range(start[i - 1], s):
-                val = input[j]
-                if val == val:
-                    skiplist.remove(val)
-                    nobs -= 1
+            else:
 
-            # calculate adds
-            for j in range(end[i - 1], e):
-                val = input[j]
-                if val == val:
-                    nobs += 1
-                    skiplist.insert(val)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = input[j]
+                    if val == val:
+                        skiplist_remove(sl, val)
+                        nobs -= 1
 
-        if nobs >= minp:
-            idx = int(quantile * <double>(nobs - 1))
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
-            # Single value in skip list
-            if nobs == 1:
-                output[i] = skiplist.get(0)
+            if err:
+                break
 
-            # Interpolated quantile
+            if nobs >= minp and nobs > 0:
+                idx = <Py_ssize_t>(quantile * <double>(nobs - 1))
+
+                # Single value in skip list
+                if nobs == 1:
+                    res = skiplist_get(sl, 0, &ret)
+
+                # Interpolated quantile
+                else:
+                    vlow = skiplist_get(sl, idx, &ret)
+                    vhigh = skiplist_get(sl, idx + 1, &ret)
+                    res = vlow + (vhigh - vlow) * (quantile * (nobs - 1) - idx)
             else:
-                vlow = skiplist.get(idx)
-                vhigh = skiplist.get(idx + 1)
-                output[i] = ((vlow + (vhigh - vlow) *
-                             (quantile * (nobs - 1) - idx)))
-        else:
-            output[i] = NaN
+                res = NaN
+
+            output[i] = res
 
+    skiplist_destroy(sl)
+    if err:
+        raise MemoryError("skiplist_insert failed")
     return output
 
 
@@ -1576,31 +1725,32 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     -------
     y : ndarray
     """
+    return ewma_2d(input[:, None], com, adjust, ignore_na, minp)[:, 0]
 
-    cdef Py_ssize_t N = len(input)
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
-    if N == 0:
-        return output
 
-    minp = max(minp, 1)
+cdef void _ewma_column(double_t[:, :] input, double_t[:, :] output,
+                       Py_ssize_t k, Py_ssize_t N, double_t com, int adjust,
+                       int ignore_na, int minp) nogil:
+    """ ewma of the k-th column of input into output """
 
     cdef double alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
     cdef Py_ssize_t i, nobs
+    cdef bint is_observation
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = input[0]
+    weighted_avg = input[0, k]
     is_observation = (weighted_avg == weighted_avg)
-    nobs = int(is_observation)
-    output[0] = weighted_avg if (nobs >= minp) else NaN
+    nobs = is_observation
+    output[0, k] = weighted_avg if (nobs >= minp) else NaN
     old_wt = 1.
 
     for i from 1 <= i < N:
-        cur = input[i]
+        cur = input[i, k]
         is_observation = (cur == cur)
-        nobs += int(is_observation)
+        nobs += is_observation
         if weighted_avg == weighted_avg:
 
             if is_observation or (not ignore_na):
@@ -1619,7 +1769,46 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
         elif is_observation:
             weighted_avg = cur
 
-        output[i] = weighted_avg if (nobs >= minp) else NaN
+        output[i, k] = weighted_avg if (nobs >= minp) else NaN
+
+
+def ewma_2d(ndarray[double_t, ndim=2] input, double_t com, int adjust,
+            int ignore_na, int minp):
+    """
+    Compute exponentially-weighted moving average of each column of a
+    2d array along axis=0, in a single call with the GIL released.
+
+    Parameters
+    ----------
+    input : 2d ndarray (float64 type)
+    com : float64
+    adjust: int
+    ignore_na: int
+    minp: int
+
+    Returns
+    -------
+    y : 2d ndarray
+    """
+
+    cdef:
+        Py_ssize_t k, N = input.shape[0], K = input.shape[1]
+        ndarray[double_t, ndim=2] output
+        double_t[:, :] values, out
+
+    output = np.empty((N, K), dtype=float, order='F')
+    if N == 0:
+        return output
+
+    minp = max(minp, 1)
+
+    # walk the columns contiguously
+    values = np.asfortranarray(input)
+    out = output
+
+    with nogil:
+        for k in range(K):
+            _ewma_column(values, out, k, N, com, adjust, ignore_na, minp)
 
     return output
 
@@ -1627,6 +1816,72 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 # Exponentially weighted moving covariance
 
 
+cdef inline void add_ewmcov(double cur_x, double cur_y, double old_wt_factor,
+                            double new_wt, int adjust, int ignore_na,
+                            Py_ssize_t *nobs, double *mean_x, double *mean_y,
+                            double *cov, double *sum_wt, double *sum_wt2,
+                            double *old_wt) nogil:
+    """ add an observation to the ewmcov calc """
+    cdef:
+        bint is_observation
+        double old_mean_x, old_mean_y
+
+    is_observation = ((cur_x == cur_x) and (cur_y == cur_y))
+    nobs[0] = nobs[0] + is_observation
+    if mean_x[0] == mean_x[0]:
+        if is_observation or (not ignore_na):
+            sum_wt[0] *= old_wt_factor
+            sum_wt2[0] *= (old_wt_factor * old_wt_factor)
+            old_wt[0] *= old_wt_factor
+            if is_observation:
+                old_mean_x = mean_x[0]
+                old_mean_y = mean_y[0]
+
+                # avoid numerical errors on constant series
+                if mean_x[0] != cur_x:
+                    mean_x[0] = ((old_wt[0] * old_mean_x) +
+                                 (new_wt * cur_x)) / (old_wt[0] + new_wt)
+
+                # avoid numerical errors on constant series
+                if mean_y[0] != cur_y:
+                    mean_y[0] = ((old_wt[0] * old_mean_y) +
+                                 (new_wt * cur_y)) / (old_wt[0] + new_wt)
+                cov[0] = ((old_wt[0] * (cov[0] + ((old_mean_x - mean_x[0]) *
+                                                  (old_mean_y - mean_y[0])))) +
+                          (new_wt * ((cur_x - mean_x[0]) *
+                                     (cur_y - mean_y[0])))) / (old_wt[0] +
+                                                               new_wt)
+                sum_wt[0] += new_wt
+                sum_wt2[0] += (new_wt * new_wt)
+                old_wt[0] += new_wt
+                if not adjust:
+                    sum_wt[0] /= old_wt[0]
+                    sum_wt2[0] /= (old_wt[0] * old_wt[0])
+                    old_wt[0] = 1.
+    elif is_observation:
+        mean_x[0] = cur_x
+        mean_y[0] = cur_y
+
+
+cdef inline double calc_ewmcov(int minp, int bias, Py_ssize_t nobs,
+                               double cov, double sum_wt,
+                               double sum_wt2) nogil:
+    cdef double numerator, denominator
+
+    if nobs >= minp:
+        if not bias:
+            numerator = sum_wt * sum_wt
+            denominator = numerator - sum_wt2
+            if (denominator > 0.):
+                return ((numerator / denominator) * cov)
+            else:
+                return NaN
+        else:
+            return cov
+    else:
+        return NaN
+
+
 def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
            double_t com, int adjust, int ignore_na, int minp, int bias):
     """
@@ -1658,75 +1913,335 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
     minp = max(minp, 1)
 
     cdef double alpha, old_wt_factor, new_wt, mean_x, mean_y, cov
-    cdef double sum_wt, sum_wt2, old_wt, cur_x, cur_y, old_mean_x, old_mean_y
+    cdef double sum_wt, sum_wt2, old_wt
     cdef Py_ssize_t i, nobs
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    mean_x = input_x[0]
-    mean_y = input_y[0]
-    is_observation = ((mean_x == mean_x) and (mean_y == mean_y))
-    nobs = int(is_observation)
-    if not is_observation:
-        mean_x = NaN
-        mean_y = NaN
-    output[0] = (0. if bias else NaN) if (nobs >= minp) else NaN
+    # the first observation only sets the means
+    mean_x = NaN
+    mean_y = NaN
+    nobs = 0
     cov = 0.
     sum_wt = 1.
     sum_wt2 = 1.
     old_wt = 1.
 
-    for i from 1 <= i < N:
-        cur_x = input_x[i]
-        cur_y = input_y[i]
-        is_observation = ((cur_x == cur_x) and (cur_y == cur_y))
-        nobs += int(is_observation)
-        if mean_x == mean_x:
-            if is_observation or (not ignore_na):
-                sum_wt *= old_wt_factor
-                sum_wt2 *= (old_wt_factor * old_wt_factor)
-                old_wt *= old_wt_factor
-                if is_observation:
-                    old_mean_x = mean_x
-                    old_mean_y = mean_y
+    with nogil:
+        for i in range(N):
+            add_ewmcov(input_x[i], input_y[i], old_wt_factor, new_wt,
+                       adjust, ignore_na, &nobs, &mean_x, &mean_y, &cov,
+                       &sum_wt, &sum_wt2, &old_wt)
+            output[i] = calc_ewmcov(minp, bias, nobs, cov, sum_wt, sum_wt2)
 
-                    # avoid numerical errors on constant series
-                    if mean_x != cur_x:
-                        mean_x = ((old_wt * old_mean_x) +
-                                  (new_wt * cur_x)) / (old_wt + new_wt)
+    return output
 
-                    # avoid numerical errors on constant series
-                    if mean_y != cur_y:
-                        mean_y = ((old_wt * old_mean_y) +
-                                  (new_wt * cur_y)) / (old_wt + new_wt)
-                    cov = ((old_wt * (cov + ((old_mean_x - mean_x) *
-                                             (old_mean_y - mean_y)))) +
-                           (new_wt * ((cur_x - mean_x) *
-                                      (cur_y - mean_y)))) / (old_wt + new_wt)
-                    sum_wt += new_wt
-                    sum_wt2 += (new_wt * new_wt)
-                    old_wt += new_wt
-                    if not adjust:
-                        sum_wt /= old_wt
-                        sum_wt2 /= (old_wt * old_wt)
-                        old_wt = 1.
-        elif is_observation:
-            mean_x = cur_x
-            mean_y = cur_y
+# ----------------------------------------------------------------------
+# Online window state
 
-        if nobs >= minp:
-            if not bias:
-                numerator = sum_wt * sum_wt
-                denominator = numerator - sum_wt2
-                if (denominator > 0.):
-                    output[i] = ((numerator / denominator) * cov)
-                else:
-                    output[i] = NaN
-            else:
-                output[i] = cov
-        else:
-            output[i] = NaN
 
-    return output
+cdef class RollingState:
+    """
+    The state of the fixed window rolling sum, mean and variance of the
+    columns of a 2d array, which is carried forward as rows are added.
+
+    ``update`` costs O(rows) and gives the same results as roll_sum,
+    roll_mean and roll_var over the whole history.
+
+    Parameters
+    ----------
+    K: int
+        number of columns
+    win: int64_t
+        window size
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    """
+
+    cdef:
+        readonly Py_ssize_t K
+        readonly int64_t win, minp, N
+        ndarray ring, nobs, neg_ct, sum_x, nobs_var, mean_x, ssqdm_x
+
+        # the moments at each of the rows of the last update
+        ndarray last_sum, last_mean, last_nobs_var, last_ssqdm_x
+
+    def __init__(self, Py_ssize_t K, int64_t win, object minp):
+        if win <= 0:
+            raise ValueError("window must be positive")
+
+        self.K = K
+        self.win = win
+        self.minp = _check_minp(win, minp, win)
+        self.N = 0
+
+        # the last win rows, row i lives in ring[i % win]
+        self.ring = np.empty((win, K), dtype=np.float64)
+
+        self.nobs = np.zeros(K, dtype=np.int64)
+        self.neg_ct = np.zeros(K, dtype=np.int64)
+        self.sum_x = np.zeros(K, dtype=np.float64)
+        self.nobs_var = np.zeros(K, dtype=np.float64)
+        self.mean_x = np.zeros(K, dtype=np.float64)
+        self.ssqdm_x = np.zeros(K, dtype=np.float64)
+
+        self.last_sum = np.empty((0, K), dtype=np.float64)
+        self.last_mean = np.empty((0, K), dtype=np.float64)
+        self.last_nobs_var = np.empty((0, K), dtype=np.float64)
+        self.last_ssqdm_x = np.empty((0, K), dtype=np.float64)
+
+    def update(self, ndarray[double_t, ndim=2] input):
+        """ add the rows of input, a (rows, K) array """
+        cdef:
+            Py_ssize_t i, k, slot, n = input.shape[0]
+            Py_ssize_t nobs, neg_ct
+            int64_t row, win = self.win, minp = self.minp
+            double val, prev, delta, mean_x_old
+            double sum_x, nobs_var, mean_x, ssqdm_x
+            double_t[:, :] values = input, ring = self.ring
+            int64_t[:] nobs_k = self.nobs, neg_ct_k = self.neg_ct
+            double_t[:] sum_x_k = self.sum_x, nobs_var_k = self.nobs_var
+            double_t[:] mean_x_k = self.mean_x, ssqdm_x_k = self.ssqdm_x
+            ndarray[double_t, ndim=2] out_sum, out_mean
+            ndarray[double_t, ndim=2] out_nobs_var, out_ssqdm_x
+
+        if input.shape[1] != self.K:
+            raise ValueError("expected {0} columns, got "
+                             "{1}".format(self.K, input.shape[1]))
+
+        out_sum = np.empty((n, self.K), dtype=np.float64)
+        out_mean = np.empty((n, self.K), dtype=np.float64)
+        out_nobs_var = np.empty((n, self.K), dtype=np.float64)
+        out_ssqdm_x = np.empty((n, self.K), dtype=np.float64)
+
+        with nogil:
+            for k in range(self.K):
+                nobs = nobs_k[k]
+                neg_ct = neg_ct_k[k]
+                sum_x = sum_x_k[k]
+                nobs_var = nobs_var_k[k]
+                mean_x = mean_x_k[k]
+                ssqdm_x = ssqdm_x_k[k]
+
+                for i in range(n):
+                    row = self.N + i
+                    slot = row % win
+                    val = values[i, k]
+
+                    # the same sequence of adds & removes as the fixed
+                    # window paths of roll_sum, roll_mean and roll_var
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
+                    if row < win:
+                        add_var(val, &nobs_var, &mean_x, &ssqdm_x)
+                    else:
+                        prev = ring[slot, k]
+                        remove_mean(prev, &nobs, &sum_x, &neg_ct)
+
+                        if val == val:
+                            if prev == prev:
+
+                                # Adding one observation and removing
+                                # another one
+                                delta = val - prev
+                                mean_x_old = mean_x
+
+                                mean_x += delta / nobs_var
+                                ssqdm_x += ((nobs_var - 1) * val
+                                            + (nobs_var + 1) * prev
+                                            - 2 * nobs_var * mean_x_old
+                                            ) * delta / nobs_var
+
+                            else:
+                                add_var(val, &nobs_var, &mean_x, &ssqdm_x)
+                        elif prev == prev:
+                            remove_var(prev, &nobs_var, &mean_x, &ssqdm_x)
+
+                    ring[slot, k] = val
+
+                    out_sum[i, k] = calc_sum(minp, nobs, sum_x)
+                    out_mean[i, k] = calc_mean(minp, nobs, neg_ct, sum_x)
+                    out_nobs_var[i, k] = nobs_var
+                    out_ssqdm_x[i, k] = ssqdm_x
+
+                nobs_k[k] = nobs
+                neg_ct_k[k] = neg_ct
+                sum_x_k[k] = sum_x
+                nobs_var_k[k] = nobs_var
+                mean_x_k[k] = mean_x
+                ssqdm_x_k[k] = ssqdm_x
+
+        self.N += n
+        self.last_sum = out_sum
+        self.last_mean = out_mean
+        self.last_nobs_var = out_nobs_var
+        self.last_ssqdm_x = out_ssqdm_x
+
+    def sum(self):
+        """ the rolling sum at the rows of the last update """
+        return self.last_sum
+
+    def mean(self):
+        """ the rolling mean at the rows of the last update """
+        return self.last_mean
+
+    def var(self, int ddof=1):
+        """ the rolling variance at the rows of the last update """
+        cdef:
+            Py_ssize_t i, k, n = len(self.last_ssqdm_x)
+            int64_t minp = self.minp
+            ndarray[double_t, ndim=2] nobs_var = self.last_nobs_var
+            ndarray[double_t, ndim=2] ssqdm_x = self.last_ssqdm_x
+            ndarray[double_t, ndim=2] output
+
+        output = np.empty((n, self.K), dtype=np.float64)
+        with nogil:
+            for i in range(n):
+                for k in range(self.K):
+                    output[i, k] = calc_var(minp, ddof, nobs_var[i, k],
+                                            ssqdm_x[i, k])
+        return output
+
+
+cdef class EWMState:
+    """
+    The state of the exponentially weighted moving average and variance
+    of the columns of a 2d array, which is carried forward as rows are
+    added.
+
+    ``update`` costs O(rows) and gives the same results as ewma and
+    ewmcov(x, x) over the whole history.
+
+    Parameters
+    ----------
+    K: int
+        number of columns
+    com : float64
+    adjust: int
+    ignore_na: int
+    minp: int
+    """
+
+    cdef:
+        readonly Py_ssize_t K
+        readonly int64_t N
+        double old_wt_factor, new_wt
+        int adjust, ignore_na, minp
+        ndarray nobs, mean_x, cov, sum_wt, sum_wt2, old_wt
+
+        # the moments at each of the rows of the last update
+        ndarray last_nobs, last_mean_x, last_cov, last_sum_wt, last_sum_wt2
+
+    def __init__(self, Py_ssize_t K, double_t com, int adjust, int ignore_na,
+                 int minp):
+        cdef double alpha = 1. / (1. + com)
+
+        self.K = K
+        self.N = 0
+        self.old_wt_factor = 1. - alpha
+        self.new_wt = 1. if adjust else alpha
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+        self.minp = max(minp, 1)
+
+        # before the first observation
+        self.nobs = np.zeros(K, dtype=np.int64)
+        self.mean_x = np.empty(K, dtype=np.float64)
+        self.mean_x.fill(NaN)
+        self.cov = np.zeros(K, dtype=np.float64)
+        self.sum_wt = np.ones(K, dtype=np.float64)
+        self.sum_wt2 = np.ones(K, dtype=np.float64)
+        self.old_wt = np.ones(K, dtype=np.float64)
+
+        self.last_nobs = np.empty((0, K), dtype=np.int64)
+        self.last_mean_x = np.empty((0, K), dtype=np.float64)
+        self.last_cov = np.empty((0, K), dtype=np.float64)
+        self.last_sum_wt = np.empty((0, K), dtype=np.float64)
+        self.last_sum_wt2 = np.empty((0, K), dtype=np.float64)
+
+    def update(self, ndarray[double_t, ndim=2] input):
+        """ add the rows of input, a (rows, K) array """
+        cdef:
+            Py_ssize_t i, k, nobs, n = input.shape[0]
+            double val, mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt
+            double_t[:, :] values = input
+            int64_t[:] nobs_k = self.nobs
+            double_t[:] mean_x_k = self.mean_x, cov_k = self.cov
+            double_t[:] sum_wt_k = self.sum_wt, sum_wt2_k = self.sum_wt2
+            double_t[:] old_wt_k = self.old_wt
+            ndarray[int64_t, ndim=2] out_nobs
+            ndarray[double_t, ndim=2] out_mean_x, out_cov
+            ndarray[double_t, ndim=2] out_sum_wt, out_sum_wt2
+
+        if input.shape[1] != self.K:
+            raise ValueError("expected {0} columns, got "
+                             "{1}".format(self.K, input.shape[1]))
+
+        out_nobs = np.empty((n, self.K), dtype=np.int64)
+        out_mean_x = np.empty((n, self.K), dtype=np.float64)
+        out_cov = np.empty((n, self.K), dtype=np.float64)
+        out_sum_wt = np.empty((n, self.K), dtype=np.float64)
+        out_sum_wt2 = np.empty((n, self.K), dtype=np.float64)
+
+        with nogil:
+            for k in range(self.K):
+                nobs = nobs_k[k]
+                mean_x = mean_x_k[k]
+                mean_y = mean_x
+                cov = cov_k[k]
+                sum_wt = sum_wt_k[k]
+                sum_wt2 = sum_wt2_k[k]
+                old_wt = old_wt_k[k]
+
+                for i in range(n):
+                    val = values[i, k]
+                    add_ewmcov(val, val, self.old_wt_factor, self.new_wt,
+                               self.adjust, self.ignore_na, &nobs, &mean_x,
+                               &mean_y, &cov, &sum_wt, &sum_wt2, &old_wt)
+
+                    out_nobs[i, k] = nobs
+                    out_mean_x[i, k] = mean_x
+                    out_cov[i, k] = cov
+                    out_sum_wt[i, k] = sum_wt
+                    out_sum_wt2[i, k] = sum_wt2
+
+                nobs_k[k] = nobs
+                mean_x_k[k] = mean_x
+                cov_k[k] = cov
+                sum_wt_k[k] = sum_wt
+                sum_wt2_k[k] = sum_wt2
+                old_wt_k[k] = old_wt
+
+        self.N += n
+        self.last_nobs = out_nobs
+        self.last_mean_x = out_mean_x
+        self.last_cov = out_cov
+        self.last_sum_wt = out_sum_wt
+        self.last_sum_wt2 = out_sum_wt2
+
+    def mean(self):
+        """ the ewma at the rows of the last update """
+        result = self.last_mean_x.copy()
+        result[self.last_nobs < self.minp] = NaN
+        return result
+
+    def var(self, int bias=0):
+        """ the ewm variance at the rows of the last update """
+        cdef:
+            Py_ssize_t i, k, n = len(self.last_cov)
+            int minp = self.minp
+            ndarray[int64_t, ndim=2] nobs = self.last_nobs
+            ndarray[double_t, ndim=2] cov = self.last_cov
+            ndarray[double_t, ndim=2] sum_wt = self.last_sum_wt
+            ndarray[double_t, ndim=2] sum_wt2 = self.last_sum_wt2
+            ndarray[double_t, ndim=2] output
+
+        output = np.empty((n, self.K), dtype=np.float64)
+        with nogil:
+            for i in range(n):
+                for k in range(self.K):
+                    output[i, k] = calc_ewmcov(minp, bias, nobs[i, k],
+                                               cov[i, k], sum_wt[i, k],
+                                               sum_wt2[i, k])
+        return output
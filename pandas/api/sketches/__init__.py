@@ -0,0 +1,3 @@
+""" public toolkit API of mergeable approximate sketches """
+
+from pandas.core.sketches import HyperLogLog, TDigest  # noqa
@@ -10,7 +10,7 @@ from pandas.core.dtypes.cast import (
     maybe_promote, construct_1d_object_array_from_listlike)
 from pandas.core.dtypes.generic import (
     ABCSeries, ABCIndex,
-    ABCIndexClass, ABCCategorical)
+    ABCIndexClass, ABCMultiIndex, ABCCategorical)
 from pandas.core.dtypes.common import (
     is_unsigned_integer_dtype, is_signed_integer_dtype,
     is_integer_dtype, is_complex_dtype,
@@ -22,7 +22,7 @@ from pandas.core.dtypes.common import (
     is_categorical, is_datetimetz,
     is_datetime64_any_dtype, is_datetime64tz_dtype,
     is_timedelta64_dtype, is_interval_dtype,
-    is_scalar, is_list_like,
+    is_scalar, is_list_like, is_dtype_equal,
     _ensure_platform_int, _ensure_object,
     _ensure_float64, _ensure_uint64,
     _ensure_int64)
@@ -378,6 +378,97 @@ def unique(values):
 unique1d = unique
 
 
+# value sets of at least this size are hashed in a Bloom filter first
+# by isin, so that only the candidates probe their large hash table
+_BLOOM_MIN_SIZE = 1 << 20
+
+
+def _bloom_keys(values):
+    """
+    Return the uint64 bit patterns of the int64, uint64, float64 or
+    datetimelike ndarray ``values``, equal where the values are equal,
+    or None for other dtypes.
+    """
+    if not isinstance(values, np.ndarray):
+        return None
+    if needs_i8_conversion(values) or values.dtype == np.int64:
+        return values.view('i8').view('u8')
+    elif values.dtype == np.uint64:
+        return values
+    elif values.dtype == np.float64:
+        # normalize -0.0 and the nan payloads
+        values = values + 0.
+        values[np.isnan(values)] = np.nan
+        return values.view('u8')
+    return None
+
+
+def _bloom_mask(comps, values):
+    """
+    Compute a boolean mask of the ``comps`` which may be in ``values``
+    with a Bloom filter of ``values``. There are no false negatives and
+    about 1% of false positives.
+
+    Parameters
+    ----------
+    comps : ndarray
+    values : ndarray of the same dtype as ``comps``
+
+    Returns
+    -------
+    boolean ndarray the length of ``comps``, or None if the dtypes are
+    not supported
+    """
+    if comps.dtype != values.dtype:
+        return None
+    comp_keys = _bloom_keys(comps)
+    value_keys = _bloom_keys(values)
+    if comp_keys is None or value_keys is None:
+        return None
+
+    bloom = htable.BloomFilter(len(value_keys))
+    bloom.add(value_keys)
+    return bloom.contains(comp_keys)
+
+
+# isin looks integers up in a boolean table indexed by value when the
+# values span at most _ISIN_TABLE_RATIO times as many integers as there
+# are comps and values, and binary searches sorted integer values of at
+# least _ISIN_SEARCH_MIN_SIZE which outnumber the comps
+_ISIN_TABLE_RATIO = 4
+_ISIN_SEARCH_MIN_SIZE = 1 << 16
+
+
+def _isin_integers(comps, values):
+    """
+    Compute the isin boolean array of the int64 or uint64 ``comps`` and
+    non-empty ``values`` of the same dtype without hashing the values,
+    when this is faster:
+
+    - dense values are looked up in a boolean table indexed by value
+    - large sorted values are binary searched
+
+    Returns None if the values should be hashed instead.
+    """
+    vmin, vmax = values.min(), values.max()
+    span = int(vmax) - int(vmin) + 1
+    if span <= _ISIN_TABLE_RATIO * (len(comps) + len(values)):
+        table = np.zeros(span, dtype=bool)
+        table[values - vmin] = True
+        result = (comps >= vmin) & (comps <= vmax)
+        result[result] = table[comps[result] - vmin]
+        return result
+
+    if len(values) >= max(_ISIN_SEARCH_MIN_SIZE, len(comps)):
+        is_monotonic = getattr(algos, 'is_monotonic_' + values.dtype.name)
+        if is_monotonic(values, False)[0]:
+            indexer = values.searchsorted(comps)
+            indexer[indexer == len(values)] = 0
+            return values.take(indexer) == comps
+
+    return None
+
+
 def isin(comps, values):
     """
     Compute the isin boolean array
@@ -401,12 +492,27 @@ def isin(comps, values):
                         " to isin(), you passed a [{values_type}]"
                         .format(values_type=type(values).__name__))
 
+    if (isinstance(values, ABCIndexClass) and
+            not isinstance(values, ABCMultiIndex) and
+            not is_categorical_dtype(values) and
+            not is_interval_dtype(values) and
+            is_dtype_equal(getattr(comps, 'dtype', None), values.dtype) and
+            values.is_unique and not values.hasnans):
+        # reuse the hash table of the index engine
+        return values.get_indexer(comps) != -1
+
     if not isinstance(values, (ABCIndex, ABCSeries, np.ndarray)):
         values = construct_1d_object_array_from_listlike(list(values))
 
     comps, dtype, _ = _ensure_data(comps)
     values, _, _ = _ensure_data(values, dtype=dtype)
 
+    if (comps.dtype == values.dtype and
+            comps.dtype in [np.int64, np.uint64] and len(values)):
+        result = _isin_integers(comps, values)
+        if result is not None:
+            return result
+
     # faster for larger cases to use np.in1d
     f = lambda x, y: htable.ismember_object(x, values)
 
@@ -433,6 +539,12 @@ def isin(comps, values):
             values = values.astype(object)
             comps = comps.astype(object)
 
+    if len(values) >= _BLOOM_MIN_SIZE:
+        mask = _bloom_mask(comps, values)
+        if mask is not None:
+            mask[mask] = f(comps[mask], values)
+            return mask
+
     return f(comps, values)
 
 
@@ -1013,7 +1125,6 @@ class SelectNFrame(SelectN):
 
     def compute(self, method):
 
-        from pandas import Int64Index
         n = self.n
         frame = self.obj
         columns = self.columns
@@ -1026,57 +1137,80 @@ class SelectNFrame(SelectN):
                     "{method!r} with this dtype"
                 ).format(column=column, dtype=dtype, method=method))
 
-        def get_indexer(current_indexer, other_indexer):
-            """Helper function to concat `current_indexer` and `other_indexer`
-            depending on `method`
-            """
-            if method == 'nsmallest':
-                return current_indexer.append(other_indexer)
-            else:
-                return other_indexer.append(current_indexer)
-
-        # Below we save and reset the index in case index contains duplicates
-        original_index = frame.index
-        cur_frame = frame = frame.reset_index(drop=True)
-        cur_n = n
-        indexer = Int64Index([])
-
-        for i, column in enumerate(columns):
-
-            # For each column we apply method to cur_frame[column].
-            # If it is the last column in columns, or if the values
-            # returned are unique in frame[column] we save this index
-            # and break
-            # Otherwise we must save the index of the non duplicated values
-            # and set the next cur_frame to cur_frame filtered on all
-            # duplcicated values (#GH15297)
-            series = cur_frame[column]
-            values = getattr(series, method)(cur_n, keep=self.keep)
-            is_last_column = len(columns) - 1 == i
-            if is_last_column or values.nunique() == series.isin(values).sum():
-
-                # Last column in columns or values are unique in
-                # series => values
-                # is all that matters
-                indexer = get_indexer(indexer, values.index)
-                break
-
-            duplicated_filter = series.duplicated(keep=False)
-            duplicated = values[duplicated_filter]
-            non_duplicated = values[~duplicated_filter]
-            indexer = get_indexer(indexer, non_duplicated.index)
-
-            # Must set cur frame to include all duplicated values
-            # to consider for the next column, we also can reduce
-            # cur_n by the current length of the indexer
-            cur_frame = cur_frame[series.isin(duplicated)]
-            cur_n = n - len(indexer)
-
-        frame = frame.take(indexer)
-
-        # Restore the index on frame
-        frame.index = original_index.take(indexer)
-        return frame
+        # rows missing the first column are dropped, as by Series.nlargest
+        values, mask = _select_n_keys(frame[columns[0]].values, method)
+        candidates = None
+        if mask.any():
+            candidates, = np.nonzero(~mask)
+            values = values[candidates]
+
+        n = max(min(n, len(values)), 0)
+        if 0 < n < len(values):
+            # only the rows up to the n-th value of the first column
+            # can be among the first n rows
+            kth_val = np.partition(values, n - 1)[n - 1]
+            ns, = np.nonzero(values <= kth_val)
+            candidates = ns if candidates is None else candidates[ns]
+            values = values[ns]
+
+        keys = [values]
+        for column in columns[1:]:
+            arr = frame[column].values
+            if candidates is not None:
+                arr = arr.take(candidates)
+            values, mask = _select_n_keys(arr, method)
+            if mask.any():
+                # missing values come last
+                keys.append(mask.astype(np.uint64))
+            keys.append(values)
+
+        keys = np.column_stack(keys)
+        if self.keep == 'last':
+            keys = np.ascontiguousarray(keys[::-1])
+
+        # find the first n rows of all the columns at once
+        indexer = algos.lex_nsmallest_indexer(keys, n)
+        if self.keep == 'last':
+            indexer = len(keys) - 1 - indexer
+        if candidates is not None:
+            indexer = candidates.take(indexer)
+
+        return frame.take(indexer, is_copy=False)
+
+
+def _select_n_keys(values, method):
+    """
+    Map the values of a column of SelectNFrame to uint64 keys, such that
+    the keys of the n smallest values (nsmallest) or n largest values
+    (nlargest) are the n smallest keys
+
+    Parameters
+    ----------
+    values : ndarray
+    method : {'nsmallest', 'nlargest'}
+
+    Returns
+    -------
+    keys : uint64 ndarray
+    mask : boolean ndarray of the missing values
+    """
+    mask = isna(values)
+    values, _, _ = _ensure_data(values)
+
+    sign = np.uint64(1 << 63)
+    if is_float_dtype(values):
+        # flip the negative floats and set the sign bit of the others,
+        # -0.0 compares equal to 0.0
+        keys = (values + 0.).view(np.uint64)
+        keys = np.where(keys & sign, ~keys, keys | sign)
+    elif is_signed_integer_dtype(values):
+        keys = values.view(np.uint64) ^ sign
+    else:
+        keys = values.astype(np.uint64)
+
+    if method == 'nlargest':
+        keys = ~keys
+    return keys, mask
 
 
 # ------- ## ---- #
@@ -43,11 +43,45 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+num_threads_doc = """
+: int
+    Number of threads used by the groupby aggregations, the rolling
+    and ewm reductions and the ``engine='parallel_hash'`` merges of large
+    inputs, 0 (the default) to use the number of CPUs and 1 to always
+    compute serially. Inputs of fewer than a million values are always
+    computed serially.
+"""
+
+
+def num_threads_cb(key):
+    from pandas.core import parallel
+    parallel.set_num_threads(cf.get_option(key))
+
+
+index_hashtable_max_size_doc = """
+: int or None
+    Largest number of labels of an index whose label lookup hash table is
+    kept after use, None for no limit. Scalar lookups in the indexes over
+    the limit scan their values instead.
+"""
+
+
+def index_hashtable_max_size_cb(key):
+    from pandas._libs import index as libindex
+    libindex.set_hashtable_max_size(cf.get_option(key))
+
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('num_threads', 0, num_threads_doc,
+                       validator=is_int, cb=num_threads_cb)
+    cf.register_option('index_hashtable_max_size', None,
+                       index_hashtable_max_size_doc,
+                       validator=is_instance_factory([type(None), int]),
+                       cb=index_hashtable_max_size_cb)
 #
 # options from the "display" namespace
 
@@ -423,6 +457,65 @@ cf.deprecate_option('mode.use_inf_as_null', msg=use_inf_as_null_doc,
                     rkey='mode.use_inf_as_na')
 
 
+consolidate_max_blocks_doc = """
+: int
+    Minimum number of blocks a DataFrame may hold before incremental
+    operations such as column insertion consolidate blocks of the same
+    dtype. The budget grows with the number of columns, so building a wide
+    frame column by column stays linear. Operations that need 2-D values
+    always consolidate.
+"""
+
+consolidate_max_bytes_doc = """
+: int or None
+    Consolidate blocks of the same dtype during incremental operations once
+    the fragmented blocks hold more than this many bytes. None disables the
+    byte budget.
+"""
+
+
+def consolidate_max_blocks_cb(key):
+    from pandas.core import internals
+    internals.set_consolidate_max_blocks(cf.get_option(key))
+
+
+def consolidate_max_bytes_cb(key):
+    from pandas.core import internals
+    internals.set_consolidate_max_bytes(cf.get_option(key))
+
+
+with cf.config_prefix('mode'):
+    cf.register_option('consolidate_max_blocks', 100,
+                       consolidate_max_blocks_doc, validator=is_int,
+                       cb=consolidate_max_blocks_cb)
+    cf.register_option('consolidate_max_bytes', None,
+                       consolidate_max_bytes_doc,
+                       validator=is_instance_factory([type(None), int]),
+                       cb=consolidate_max_bytes_cb)
+
+
+copy_on_write_doc = """
+: boolean
+    When True, deep copies of a DataFrame or Series (and the methods that
+    copy defensively, e.g. ``rename``, ``astype(copy=True)`` or ``reindex``
+    with an identical index) share their data with the original until one
+    of them is modified through ``setitem``, ``putmask``, inplace
+    ``fillna`` or scalar assignment, at which point the modified object
+    copies its data. Writes to arrays obtained from ``.values`` are not
+    tracked. The default is False.
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core import internals
+    internals.set_copy_on_write(cf.get_option(key))
+
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
+
 # user warnings
 chained_assignment = """
 : string
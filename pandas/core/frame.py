@@ -197,6 +197,14 @@ validate : string, default None
 
     .. versionadded:: 0.21.0
 
+engine : {None, 'parallel_hash'}, default None
+    The join algorithm. ``'parallel_hash'`` splits the rows of both sides
+    into partitions by the hash of their keys, and factorizes and joins the
+    partitions on the threads set by the ``compute.num_threads`` option.
+    The result is the same as with the default engine.
+
+    .. versionadded:: 0.23.0
+
 Notes
 -----
 Support for specifying index levels as the `on`, `left_on`, and
@@ -2042,6 +2050,11 @@ class DataFrame(NDFrame):
 
     def _set_value(self, index, col, value, takeable=False):
         try:
+            # copy data shared under copy-on-write before writing to it
+            loc = col if takeable is True else self.columns.get_loc(col)
+            if is_integer(loc) and self._data._maybe_copy_on_write(loc):
+                self._clear_item_cache()
+
             if takeable is True:
                 series = self._iget_item_cache(col)
                 return series._set_value(index, value, takeable=True)
@@ -2841,37 +2854,108 @@ class DataFrame(NDFrame):
             for row, col in zip(row_labels, col_labels):
                 result.append(df.get_value(row, col))
 
+        The labels are looked up with one ``get_indexer`` per axis and the
+        values taken with one fancy indexing per block of the frame.
+
         Examples
         --------
         values : ndarray
             The found values
 
+        See also
+        --------
+        DataFrame.set_lookup : set the values of (row, col) pairs
         """
-        n = len(row_labels)
-        if n != len(col_labels):
-            raise ValueError('Row labels must have same size as column labels')
-
-        thresh = 1000
-        if not self._is_mixed_type or n > thresh:
-            values = self.values
-            ridx = self.index.get_indexer(row_labels)
-            cidx = self.columns.get_indexer(col_labels)
-            if (ridx == -1).any():
-                raise KeyError('One or more row labels was not found')
-            if (cidx == -1).any():
-                raise KeyError('One or more column labels was not found')
-            flat_index = ridx * len(self.columns) + cidx
-            result = values.flat[flat_index]
-        else:
-            result = np.empty(n, dtype='O')
-            for i, (r, c) in enumerate(zip(row_labels, col_labels)):
-                result[i] = self._get_value(r, c)
+        ridx, cidx = self._get_lookup_indexers(row_labels, col_labels)
+        result = self._data.take_pairs(cidx, ridx)
 
         if is_object_dtype(result):
             result = lib.maybe_convert_objects(result)
 
         return result
 
+    def set_lookup(self, row_labels, col_labels, value):
+        """Label-based "fancy" setting function for DataFrame.
+        Given equal-length arrays of row and column labels, set in place
+        the value of each (row, col) pair.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        row_labels : sequence
+            The row labels to set
+        col_labels : sequence
+            The column labels to set
+        value : scalar or sequence
+            The value to set at all the pairs, or the values of each pair
+
+        Notes
+        -----
+        Akin to::
+
+            for row, col, val in zip(row_labels, col_labels, value):
+                df.at[row, col] = val
+
+        The labels must already be in the frame. The values are set with
+        one fancy assignment per block of the frame, and the columns which
+        cannot hold their new values are upcast.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'A': [1., 2., 3.], 'B': ['x', 'y', 'z']},
+        ...                   index=['a', 'b', 'c'])
+        >>> df.set_lookup(['a', 'c', 'b'], ['A', 'A', 'B'], [10., 30., 'w'])
+        >>> df
+              A  B
+        a  10.0  x
+        b   2.0  w
+        c  30.0  z
+
+        See also
+        --------
+        DataFrame.lookup : get the values of (row, col) pairs
+        """
+        ridx, cidx = self._get_lookup_indexers(row_labels, col_labels)
+        if not is_scalar(value):
+            value = com._asarray_tuplesafe(value)
+            if len(value) != len(ridx):
+                raise ValueError('Values must have same size as the labels')
+
+        unset = self._data.put_pairs(cidx, ridx, value)
+        self._clear_item_cache()
+
+        if unset.any():
+            # set the pairs of the columns to upcast column by column
+            ridx, cidx = ridx[unset], cidx[unset]
+            if not is_scalar(value):
+                value = value[unset]
+
+            for loc in algorithms.unique(cidx):
+                mask = cidx == loc
+                if is_scalar(value):
+                    values = value
+                else:
+                    values = value[mask]
+                    if is_object_dtype(values):
+                        values = lib.maybe_convert_objects(values)
+                self.iloc[ridx[mask], loc] = values
+
+    def _get_lookup_indexers(self, row_labels, col_labels):
+        """
+        Return the positions of the row and column labels of a lookup
+        """
+        if len(row_labels) != len(col_labels):
+            raise ValueError('Row labels must have same size as column labels')
+
+        ridx = _ensure_int64(self.index.get_indexer(row_labels))
+        cidx = _ensure_int64(self.columns.get_indexer(col_labels))
+        if (ridx == -1).any():
+            raise KeyError('One or more row labels was not found')
+        if (cidx == -1).any():
+            raise KeyError('One or more column labels was not found')
+        return ridx, cidx
+
     # ----------------------------------------------------------------------
     # Reindexing and alignment
 
@@ -5222,12 +5306,13 @@ class DataFrame(NDFrame):
     def merge(self, right, how='inner', on=None, left_on=None, right_on=None,
               left_index=False, right_index=False, sort=False,
               suffixes=('_x', '_y'), copy=True, indicator=False,
-              validate=None):
+              validate=None, engine=None):
         from pandas.core.reshape.merge import merge
         return merge(self, right, how=how, on=on, left_on=left_on,
                      right_on=right_on, left_index=left_index,
                      right_index=right_index, sort=sort, suffixes=suffixes,
-                     copy=copy, indicator=indicator, validate=validate)
+                     copy=copy, indicator=indicator, validate=validate,
+                     engine=engine)
 
     def round(self, decimals=0, *args, **kwargs):
         """
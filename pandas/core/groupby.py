@@ -1,5 +1,5 @@
 import types
-from functools import wraps
+from functools import wraps, partial
 import numpy as np
 import datetime
 import collections
@@ -24,6 +24,7 @@ from pandas.core.dtypes.common import (
     is_datetimelike,
     is_datetime64_any_dtype,
     is_bool, is_integer_dtype,
+    is_float_dtype,
     is_complex_dtype,
     is_bool_dtype,
     is_scalar,
@@ -53,9 +54,12 @@ from pandas.core.generic import NDFrame, _shared_docs
 from pandas.core.internals import BlockManager, make_block
 from pandas.core.series import Series
 from pandas.core.panel import Panel
+from pandas.core.parallel import get_num_threads, run_threaded, split_range
 from pandas.core.sorting import (get_group_index_sorter, get_group_index,
-                                 compress_group_index, get_flattened_iterator,
-                                 decons_obs_group_ids, get_indexer_dict)
+                                 compress_group_index, hash_group_index,
+                                 get_flattened_iterator,
+                                 decons_obs_group_ids, get_indexer_dict,
+                                 is_int64_overflow_possible)
 from pandas.util._decorators import (cache_readonly, Substitution,
                                      Appender, make_signature)
 from pandas.io.formats.printing import pprint_thing
@@ -292,6 +296,29 @@ _dataframe_apply_whitelist = ((_common_apply_whitelist |
 _cython_transforms = frozenset(['cumprod', 'cumsum', 'shift',
                                 'cummin', 'cummax'])
 
+# cython functions whose result should not be cast back to the input dtype
+_cython_cast_blacklist = frozenset(['rank'])
+
+# reductions which a list aggregation can compute in a single pass
+_cython_fused_aggregations = frozenset(['sum', 'prod', 'mean', 'var', 'std',
+                                        'min', 'max', 'count'])
+
+# cython aggregations whose kernels release the GIL and compute each column
+# independently, these may run on a thread pool
+_cython_threaded_aggregations = frozenset(['add', 'prod', 'min', 'max',
+                                           'mean', 'var', 'median', 'first',
+                                           'last'])
+
+# for a single column, the fused reductions computing partial aggregates of
+# a chunk of rows which can be combined into the aggregate of all the rows
+_cython_partial_aggregations = {
+    'add': ['count', 'sum'],
+    'mean': ['count', 'sum'],
+    'prod': ['count', 'prod'],
+    'min': ['count', 'min'],
+    'max': ['count', 'max'],
+    'var': ['count', 'mean', 'var'],
+}
 
 class Grouper(object):
     """
@@ -889,7 +916,7 @@ class _GroupBy(PandasObject, SelectionMixin):
 
         return result
 
-    def _cython_transform(self, how, numeric_only=True):
+    def _cython_transform(self, how, numeric_only=True, **kwargs):
         output = collections.OrderedDict()
         for name, obj in self._iterate_slices():
             is_numeric = is_numeric_dtype(obj.dtype)
@@ -897,12 +924,16 @@ class _GroupBy(PandasObject, SelectionMixin):
                 continue
 
             try:
-                result, names = self.grouper.transform(obj.values, how)
+                result, names = self.grouper.transform(obj.values, how,
+                                                       **kwargs)
             except NotImplementedError:
                 continue
             except AssertionError as e:
                 raise GroupByError(str(e))
-            output[name] = self._try_cast(result, obj)
+            if how in _cython_cast_blacklist:
+                output[name] = result
+            else:
+                output[name] = self._try_cast(result, obj)
 
         if len(output) == 0:
             raise DataError('No numeric types to aggregate')
@@ -927,6 +958,155 @@ class _GroupBy(PandasObject, SelectionMixin):
 
         return self._wrap_aggregated_output(output, names)
 
+    def _cython_agg_fused(self, arg):
+        """
+        Aggregate with a list of cython reductions in a single pass over
+        each block of the object, instead of one pass per reduction.
+
+        Returns None if the fast path does not apply, e.g. ``arg`` contains
+        functions which cannot be fused or some column is not numeric, in
+        which case the caller should aggregate each function separately.
+        The result is otherwise identical to the one of aggregating each
+        function separately.
+        """
+        if (self.axis != 0 or not is_list_like(arg) or isinstance(arg, dict)
+                or len(arg) < 2):
+            return None
+        arg = list(arg)
+        if not all(isinstance(how, compat.string_types) and
+                   how in _cython_fused_aggregations for how in arg):
+            return None
+        if len(set(arg)) != len(arg):
+            # let the regular path raise
+            return None
+
+        obj = self._obj_with_exclusions
+        if not len(obj):
+            return None
+        if obj.ndim == 1:
+            blocks = [(obj._values, [0])]
+        elif obj.ndim == 2 and len(obj.columns) and obj.columns.is_unique:
+            blocks = [(blk.values, blk.mgr_locs.as_array)
+                      for blk in obj._data.blocks]
+        else:
+            return None
+
+        # a var result is needed to compute the std
+        hows = [how if how != 'std' else 'var' for how in arg]
+        hows = list(collections.OrderedDict.fromkeys(hows))
+
+        results = {}
+        for values, locs in blocks:
+            if not isinstance(values, np.ndarray):
+                # categorical, sparse or datetimetz values
+                return None
+            values = values.reshape(len(locs), -1)
+
+            if values.dtype.kind == 'f':
+                pass
+            elif values.dtype.kind in 'iu':
+                # the int64 kernels are exact beyond 2**53, float64 is not
+                if not (values.min() > -2**53 and values.max() < 2**53):
+                    return None
+            else:
+                return None
+
+            result, counts = self.grouper.aggregate_fused(
+                _ensure_float64(values.T), hows)
+            if self.grouper._filter_empty_groups and not counts.all():
+                # the single reductions drop the empty groups, but count
+                # does not
+                return None
+
+            for j, loc in enumerate(locs):
+                res = dict(zip(hows, result[:, :, j]))
+                output = collections.OrderedDict()
+                for how in arg:
+                    if how == 'count':
+                        output[how] = res[how].astype('int64')
+                    elif how == 'std':
+                        output[how] = np.sqrt(maybe_downcast_to_dtype(
+                            res['var'], values.dtype))
+                    else:
+                        output[how] = maybe_downcast_to_dtype(res[how],
+                                                              values.dtype)
+                results[loc] = output
+
+        index = self.grouper.result_index
+        if obj.ndim == 1:
+            return DataFrame(results[0], index=index, columns=arg)
+
+        from pandas.core.reshape.concat import concat
+        frames = [DataFrame(results[loc], index=index, columns=arg)
+                  for loc in range(len(obj.columns))]
+        return concat(frames, keys=list(obj.columns), axis=1)
+
+    def _get_cythonized_result(self, how, aggregate=False, cython_dtype=None,
+                               needs_mask=False, pre_processing=None,
+                               post_processing=None, **kwargs):
+        """
+        Get the result of a Cython function called with the group labels and
+        the values of each slice
+
+        Parameters
+        ----------
+        how : str, Cythonized function name to be called
+        aggregate : bool, default False
+            Whether the result should be aggregated to match the number of
+            groups
+        cython_dtype : default None
+            Type of the array that will be modified by the Cython call. If
+            `None`, the type will be inferred from the values of each slice
+        needs_mask : bool, default False
+            Whether the missing-value mask is part of the Cython call
+            signature
+        pre_processing : function, default None
+            Function to be applied to the values prior to passing to Cython
+        post_processing : function, default None
+            Function to be applied to the result of the Cython function
+        **kwargs : dict
+            Extra arguments to be passed to the Cython function
+
+        Returns
+        -------
+        `Series` or `DataFrame`
+        """
+        labels, _, ngroups = self.grouper.group_info
+        output = collections.OrderedDict()
+        base_func = getattr(libgroupby, how)
+
+        for name, obj in self._iterate_slices():
+            values = obj.values
+            if aggregate:
+                result_sz = ngroups
+            else:
+                result_sz = len(values)
+
+            result = np.zeros(result_sz, dtype=cython_dtype or values.dtype)
+            func = partial(base_func, result, labels)
+
+            if pre_processing is not None:
+                func = partial(func, pre_processing(values))
+            else:
+                func = partial(func, values)
+
+            if needs_mask:
+                mask = isna(values).view(np.uint8)
+                func = partial(func, mask)
+
+            # modifies result in place
+            func(**kwargs)
+
+            if post_processing is not None:
+                result = post_processing(result)
+
+            output[name] = result
+
+        if aggregate:
+            return self._wrap_aggregated_output(output)
+        else:
+            return self._wrap_transformed_output(output)
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = self._is_builtin_func(func)
         f = lambda x: func(x, *args, **kwargs)
@@ -1114,6 +1294,53 @@ class GroupBy(_GroupBy):
         # defined here for API doc
         raise NotImplementedError
 
+    def _bool_agg(self, val_test, skipna):
+        """Shared func to call any / all Cython GroupBy implementations"""
+
+        def objs_to_bool(vals):
+            try:
+                vals = vals.astype(np.bool)
+            except ValueError:  # for objects
+                vals = np.array([bool(x) for x in vals])
+
+            return vals.view(np.uint8)
+
+        def result_to_bool(result):
+            return result.astype(np.bool, copy=False)
+
+        return self._get_cythonized_result('group_any_all', aggregate=True,
+                                           cython_dtype=np.uint8,
+                                           needs_mask=True,
+                                           pre_processing=objs_to_bool,
+                                           post_processing=result_to_bool,
+                                           val_test=val_test, skipna=skipna)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def any(self, skipna=True):
+        """
+        Returns True if any value in the group is truthful, else False
+
+        Parameters
+        ----------
+        skipna : bool, default True
+            Flag to ignore nan values during truth testing
+        """
+        return self._bool_agg('any', skipna)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def all(self, skipna=True):
+        """
+        Returns True if all values in the group are truthful, else False
+
+        Parameters
+        ----------
+        skipna : bool, default True
+            Flag to ignore nan values during truth testing
+        """
+        return self._bool_agg('all', skipna)
+
     @Substitution(name='groupby')
     @Appender(_doc_template)
     def mean(self, *args, **kwargs):
@@ -1658,6 +1885,80 @@ class GroupBy(_GroupBy):
         cumcounts = self._cumcount_array(ascending=ascending)
         return Series(cumcounts, index)
 
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def quantile(self, q=0.5, interpolation='linear', **kwargs):
+        """
+        Return group values at the given quantile, a la numpy.percentile
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+        interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
+            Method to use when the desired quantile falls between two points
+        """
+        # the Cython implementation handles a scalar q on float and
+        # integer data, defer to the per-group method otherwise
+        if (is_list_like(q) or kwargs or
+                not all(is_integer_dtype(obj.dtype) or
+                        is_float_dtype(obj.dtype)
+                        for _, obj in self._iterate_slices())):
+            return self._make_wrapper('quantile')(
+                q=q, interpolation=interpolation, **kwargs)
+
+        return self._get_cythonized_result('group_quantile', aggregate=True,
+                                           cython_dtype=np.float64,
+                                           needs_mask=True,
+                                           pre_processing=_ensure_float64,
+                                           q=q, interpolation=interpolation)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def rank(self, method='average', ascending=True, na_option='keep',
+             pct=False, axis=0):
+        """
+        Provides the rank of values within each group
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'first', 'dense'}, default 'average'
+            * average: average rank of group
+            * min: lowest rank in group
+            * max: highest rank in group
+            * first: ranks assigned in order they appear in the array
+            * dense: like 'min', but rank always increases by 1 between groups
+        ascending : boolean, default True
+            False for ranks by high (1) to low (N)
+        na_option :  {'keep', 'top', 'bottom'}, default 'keep'
+            * keep: leave NA values where they are
+            * top: smallest rank if ascending
+            * bottom: smallest rank if descending
+        pct : boolean, default False
+            Compute percentage rank of data within each group
+        axis : int, default 0
+            The axis of the object over which to compute the rank
+
+        Returns
+        -----
+        DataFrame with ranking of values within each group
+        """
+        # the Cython implementation handles numeric and datetimelike data,
+        # defer to the per-group method otherwise
+        if (axis != 0 or
+                not all((is_numeric_dtype(obj.dtype) or
+                         needs_i8_conversion(obj.dtype)) and
+                        not is_complex_dtype(obj.dtype) and
+                        not is_categorical_dtype(obj.dtype)
+                        for _, obj in self._iterate_slices())):
+            return self._make_wrapper('rank')(
+                method=method, ascending=ascending, na_option=na_option,
+                pct=pct, axis=axis)
+
+        return self._cython_transform('rank', numeric_only=False,
+                                      ties_method=method, ascending=ascending,
+                                      na_option=na_option, pct=pct)
+
     @Substitution(name='groupby')
     @Appender(_doc_template)
     def cumprod(self, axis=0, *args, **kwargs):
@@ -2053,6 +2354,12 @@ class BaseGrouper(object):
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
         if len(all_labels) > 1:
+            if not self.sort or is_int64_overflow_possible(self.shape):
+                # skip building and compressing the offsets into the
+                # cartesian product of the levels
+                return hash_group_index(all_labels, self.shape,
+                                        sort=self.sort)
+
             group_index = get_group_index(all_labels, self.shape,
                                           sort=True, xnull=True)
             return compress_group_index(group_index, sort=self.sort)
@@ -2121,6 +2428,16 @@ class BaseGrouper(object):
             'cumsum': 'group_cumsum',
             'cummin': 'group_cummin',
             'cummax': 'group_cummax',
+            'rank': {
+                'name': 'group_rank',
+                'f': lambda func, a, b, c, d, **kwargs: func(
+                    a, b, c, d,
+                    kwargs.get('ties_method', 'average'),
+                    kwargs.get('ascending', True),
+                    kwargs.get('pct', False),
+                    kwargs.get('na_option', 'keep')
+                )
+            }
         }
     }
 
@@ -2180,7 +2497,7 @@ class BaseGrouper(object):
                                       (how, dtype_str))
         return func, dtype_str
 
-    def _cython_operation(self, kind, values, how, axis):
+    def _cython_operation(self, kind, values, how, axis, **kwargs):
         assert kind in ['transform', 'aggregate']
 
         # can we do this operation with our cython functions
@@ -2252,7 +2569,9 @@ class BaseGrouper(object):
             else:
                 raise
 
-        if is_numeric:
+        if how == 'rank':
+            out_dtype = 'float'
+        elif is_numeric:
             out_dtype = '%s%d' % (values.dtype.kind, values.dtype.itemsize)
         else:
             out_dtype = 'object'
@@ -2265,13 +2584,14 @@ class BaseGrouper(object):
             counts = np.zeros(self.ngroups, dtype=np.int64)
             result = self._aggregate(
                 result, counts, values, labels, func, is_numeric,
-                is_datetimelike)
+                is_datetimelike, how=how)
         elif kind == 'transform':
             result = _maybe_fill(np.empty_like(values, dtype=out_dtype),
                                  fill_value=np.nan)
 
             result = self._transform(
-                result, values, labels, func, is_numeric, is_datetimelike)
+                result, values, labels, func, is_numeric, is_datetimelike,
+                **kwargs)
 
         if is_integer_dtype(result):
             mask = result == iNaT
@@ -2309,11 +2629,33 @@ class BaseGrouper(object):
     def aggregate(self, values, how, axis=0):
         return self._cython_operation('aggregate', values, how, axis)
 
-    def transform(self, values, how, axis=0):
-        return self._cython_operation('transform', values, how, axis)
+    def transform(self, values, how, axis=0, **kwargs):
+        return self._cython_operation('transform', values, how, axis,
+                                      **kwargs)
+
+    def aggregate_fused(self, values, hows):
+        """
+        Compute several reductions of the 2-d float64 ``values`` in a
+        single pass over the group labels
+
+        Returns
+        -------
+        result : ndarray of shape (len(hows), ngroups, values.shape[1])
+        counts : ndarray of the size of each group
+        """
+        comp_ids, _, ngroups = self.group_info
+        ops = np.array([libgroupby.fused_aggregations[how] for how in hows],
+                       dtype=np.int64)
+
+        result = np.empty((len(ops), ngroups, values.shape[1]),
+                          dtype=np.float64)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        libgroupby.group_fused_agg_float64(result, counts, values,
+                                           _ensure_int64(comp_ids), ops)
+        return result, counts
 
     def _aggregate(self, result, counts, values, comp_ids, agg_func,
-                   is_numeric, is_datetimelike):
+                   is_numeric, is_datetimelike, how=None):
         if values.ndim > 3:
             # punting for now
             raise NotImplementedError("number of dimensions is currently "
@@ -2323,13 +2665,94 @@ class BaseGrouper(object):
 
                 chunk = chunk.squeeze()
                 agg_func(result[:, :, i], counts, chunk, comp_ids)
+        elif (is_numeric and how in _cython_threaded_aggregations and
+                get_num_threads(values.size) > 1):
+            self._aggregate_threaded(result, counts, values, comp_ids,
+                                     agg_func, how,
+                                     get_num_threads(values.size))
         else:
             agg_func(result, counts, values, comp_ids)
 
         return result
 
+    def _aggregate_threaded(self, result, counts, values, comp_ids,
+                            agg_func, how, nthreads):
+        """
+        Run the aggregation on a thread pool, the kernels release the GIL.
+
+        The columns are split among the threads. A single float64 column
+        is split in chunks of rows instead, whose partial aggregates are
+        then combined.
+        """
+        N, K = values.shape
+
+        if K > 1:
+            slices = split_range(K, min(nthreads, K))
+            partial_counts = [np.zeros_like(counts) for sl in slices]
+
+            def f(i):
+                sl = slices[i]
+                agg_func(result[:, sl], partial_counts[i], values[:, sl],
+                         comp_ids)
+
+            run_threaded(f, len(slices))
+            counts[:] = partial_counts[0]
+            return
+
+        if (how not in _cython_partial_aggregations or
+                values.dtype != np.float64):
+            agg_func(result, counts, values, comp_ids)
+            return
+
+        hows = _cython_partial_aggregations[how]
+        ops = np.array([libgroupby.fused_aggregations[h] for h in hows],
+                       dtype=np.int64)
+        slices = split_range(N, nthreads)
+        partials = np.empty((len(slices), len(ops)) + result.shape,
+                            dtype=np.float64)
+        partial_counts = np.zeros((len(slices), len(counts)),
+                                  dtype=np.int64)
+        comp_ids = _ensure_int64(comp_ids)
+
+        def f(i):
+            sl = slices[i]
+            libgroupby.group_fused_agg_float64(
+                partials[i], partial_counts[i], values[sl], comp_ids[sl], ops)
+
+        run_threaded(f, len(slices))
+        counts[:] = partial_counts.sum(axis=0)
+
+        # the first partial is always the number of non-na values
+        nobs = partials[:, 0]
+        total = nobs.sum(axis=0)
+        has_obs = nobs > 0
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if how in ['add', 'mean']:
+                agg = np.where(has_obs, partials[:, 1], 0).sum(axis=0)
+                if how == 'mean':
+                    agg = agg / total
+            elif how == 'prod':
+                agg = np.where(has_obs, partials[:, 1], 1).prod(axis=0)
+            elif how == 'min':
+                agg = np.where(has_obs, partials[:, 1], np.inf).min(axis=0)
+            elif how == 'max':
+                agg = np.where(has_obs, partials[:, 1], -np.inf).max(axis=0)
+            else:
+                # combine the sums of squared deviations of each chunk
+                means = np.where(has_obs, partials[:, 1], 0)
+                ssqdm = np.where(nobs > 1, partials[:, 2] * (nobs - 1), 0)
+                mean = (nobs * means).sum(axis=0) / total
+                ssqdm = (ssqdm.sum(axis=0) +
+                         (nobs * (means - mean) ** 2).sum(axis=0))
+                agg = ssqdm / (total - 1)
+                agg[total < 2] = np.nan
+
+        agg[total == 0] = np.nan
+        result[:] = agg
+
     def _transform(self, result, values, comp_ids, transform_func,
-                   is_numeric, is_datetimelike):
+                   is_numeric, is_datetimelike, **kwargs):
 
         comp_ids, _, ngroups = self.group_info
         if values.ndim > 3:
@@ -2341,9 +2764,10 @@ class BaseGrouper(object):
 
                 chunk = chunk.squeeze()
                 transform_func(result[:, :, i], values,
-                               comp_ids, is_datetimelike)
+                               comp_ids, is_datetimelike, **kwargs)
         else:
-            transform_func(result, values, comp_ids, is_datetimelike)
+            transform_func(result, values, comp_ids, is_datetimelike,
+                           **kwargs)
 
         return result
 
@@ -2756,6 +3180,10 @@ class Grouping(object):
             if isinstance(self.grouper, BaseGrouper):
                 labels = self.grouper.label_info
                 uniques = self.grouper.result_index
+            elif isinstance(self.grouper, Index):
+                labels, uniques = self.grouper._factorize_cached(
+                    sort=self.sort)
+                uniques = Index(uniques, name=self.name)
             else:
                 labels, uniques = algorithms.factorize(
                     self.grouper, sort=self.sort)
@@ -3162,6 +3590,10 @@ class SeriesGroupBy(GroupBy):
     agg = aggregate
 
     def _aggregate_multiple_funcs(self, arg, _level):
+        result = self._cython_agg_fused(arg)
+        if result is not None:
+            return result
+
         if isinstance(arg, dict):
 
             # show the deprecation, but only if we
@@ -3447,6 +3879,87 @@ class SeriesGroupBy(GroupBy):
                       index=ri,
                       name=self._selection_name)
 
+    def approx_nunique(self, dropna=True, precision=14):
+        """
+        Returns the approximate number of unique elements in the group,
+        estimated with a HyperLogLog sketch per group
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include NaN in the counts.
+        precision : int, default 14
+            log2 of the number of registers of each sketch, between 4 and 18.
+            The relative standard error of the counts is about
+            ``1.04 / sqrt(2 ** precision)``. Groups of at most
+            ``2 ** precision`` values are counted exactly, the others take a
+            sketch of ``2 ** precision`` bytes each.
+        """
+        from pandas._libs import sketches as libsketches
+        from pandas.core.sketches import _hash_values
+
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+
+        ids, _, _ = self.grouper.group_info
+        hashes = _hash_values(self.obj, dropna=False)
+        if dropna:
+            ids = np.where(isna(self.obj.values), -1, ids)
+        ids = _ensure_int64(ids)
+
+        # only the groups with more values than a sketch has registers get
+        # a sketch, so that the sketches take fewer bytes than the values
+        ri = self.grouper.result_index
+        m = 1 << precision
+        mask = ids >= 0
+        large = np.bincount(ids[mask], minlength=len(ri)) > m
+        in_large = np.zeros(len(ids), dtype=bool)
+        in_large[mask] = large.take(ids[mask])
+
+        # the distinct hashes of the small groups
+        small = mask & ~in_large
+        lab, h = ids[small], hashes[small]
+        sorter = np.lexsort((h, lab))
+        lab, h = lab.take(sorter), h.take(sorter)
+        first = np.ones(len(lab), dtype=bool)
+        first[1:] = (lab[1:] != lab[:-1]) | (h[1:] != h[:-1])
+        res = np.bincount(lab[first], minlength=len(ri)).astype(np.int64)
+
+        if large.any():
+            slots = np.cumsum(large) - 1
+            labels = np.where(in_large, slots.take(np.where(in_large, ids, 0)),
+                              -1)
+            registers = np.zeros((large.sum(), m), dtype=np.uint8)
+            libsketches.group_hll_update(registers, hashes,
+                                         _ensure_int64(labels), precision)
+            res[large] = np.round(
+                libsketches.hll_estimate(registers)).astype(np.int64)
+
+        return Series(res,
+                      index=ri,
+                      name=self._selection_name)
+
+    def approx_quantile(self, q=0.5, compression=100):
+        """
+        Return approximate group values at the given quantile, estimated
+        with a t-digest per group
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+        compression : float, default 100
+            Bounds the number of centroids of each digest
+        """
+        f = lambda x: x.approx_quantile(q, compression=compression)
+        if is_list_like(q):
+            return self.apply(f)
+        return self.aggregate(f)
+
     @Appender(Series.describe.__doc__)
     def describe(self, **kwargs):
         self._set_group_selection()
@@ -3760,6 +4273,13 @@ class NDFrameGroupBy(GroupBy):
 
     agg = aggregate
 
+    def _aggregate_multiple_funcs(self, arg, _level, _axis):
+        result = self._cython_agg_fused(arg)
+        if result is not None:
+            return result
+        return super(NDFrameGroupBy, self)._aggregate_multiple_funcs(
+            arg, _level=_level, _axis=_axis)
+
     def _aggregate_generic(self, func, *args, **kwargs):
         if self.grouper.nkeys != 1:
             raise AssertionError('Number of keys must be 1')
@@ -4547,6 +5067,87 @@ class DataFrameGroupBy(NDFrameGroupBy):
             results.index = _default_index(len(results))
         return results
 
+    def approx_nunique(self, dropna=True, precision=14):
+        """
+        Return DataFrame with the approximate number of distinct
+        observations per group for each column, estimated with HyperLogLog
+        sketches.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include NaN in the counts.
+        precision : int, default 14
+            log2 of the number of registers of each sketch, between 4 and 18
+
+        Returns
+        -------
+        approx_nunique: DataFrame
+
+        See Also
+        --------
+        DataFrameGroupBy.nunique : exact number of distinct observations
+        """
+        obj = self._selected_obj
+
+        def groupby_series(obj, col=None):
+            return SeriesGroupBy(obj,
+                                 selection=col,
+                                 grouper=self.grouper).approx_nunique(
+                dropna=dropna, precision=precision)
+
+        if isinstance(obj, Series):
+            results = groupby_series(obj)
+        else:
+            from pandas.core.reshape.concat import concat
+            results = [groupby_series(obj[col], col) for col in obj.columns]
+            results = concat(results, axis=1)
+
+        if not self.as_index:
+            results.index = _default_index(len(results))
+        return results
+
+    def approx_quantile(self, q=0.5, compression=100):
+        """
+        Return DataFrame with the approximate group values at the given
+        quantile of each numeric column, estimated with t-digests.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+        compression : float, default 100
+            Bounds the number of centroids of each digest
+
+        Returns
+        -------
+        approx_quantile: DataFrame
+
+        See Also
+        --------
+        DataFrameGroupBy.quantile : exact quantiles
+        """
+        from pandas.core.reshape.concat import concat
+
+        obj = self._obj_with_exclusions
+        if isinstance(obj, Series):
+            obj = obj.to_frame()
+
+        def groupby_series(obj, col):
+            return SeriesGroupBy(obj,
+                                 selection=col,
+                                 grouper=self.grouper).approx_quantile(
+                q, compression=compression)
+
+        results = [groupby_series(obj[col], col) for col in obj.columns
+                   if is_numeric_dtype(obj[col]) and
+                   not is_bool_dtype(obj[col])]
+        return concat(results, axis=1)
+
     boxplot = boxplot_frame_groupby
 
 
@@ -4758,3 +5359,178 @@ def get_splitter(data, *args, **kwargs):
         klass = NDFrameSplitter
 
     return klass(data, *args, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Aggregating the chunks of an iterator
+
+# the reductions which can be computed from partial results over chunks of
+# rows, mapped to those partial results
+_chunk_combinable_reductions = {
+    'sum': ['sum'],
+    'count': ['count'],
+    'mean': ['sum', 'count'],
+    'var': ['moments'],
+    'std': ['moments'],
+    'min': ['min'],
+    'max': ['max'],
+    'first': ['first'],
+    'last': ['last'],
+    'nunique': ['nunique'],
+}
+
+
+def _chunk_partial(chunk, grouped, keys, name, columns):
+    """ the partial result ``name`` of the groups of a single chunk """
+    if name == 'moments':
+        # count, mean and sum of squared deviations from the mean
+        mean = grouped.mean()
+        n = grouped.count()[mean.columns]
+        m2 = (grouped.var() * (n - 1)).where(n > 1, 0)
+        return n, mean, m2
+    elif name == 'nunique':
+        # the distinct values of each group
+        return collections.OrderedDict(
+            (col, chunk[keys if col in keys else keys + [col]]
+             .drop_duplicates()) for col in columns)
+    return getattr(grouped, name)()
+
+
+def _combine_partials(left, right, name):
+    """ combine the partial results ``name`` of two sets of chunks """
+    if name == 'moments':
+        # pairwise update of the sums of squared deviations
+        index = left[0].index.append(
+            right[0].index[~right[0].index.isin(left[0].index)])
+        (n1, mean1, m21), (n2, mean2, m22) = [
+            [part.reindex(index).fillna(0) for part in parts]
+            for parts in (left, right)]
+        n = n1 + n2
+        delta = mean2 - mean1
+        mean = mean1 + delta * n2 / n
+        m2 = m21 + m22 + delta ** 2 * n1 * n2 / n
+        return n, mean, m2
+    elif name == 'nunique':
+        from pandas.core.reshape.concat import concat
+        return collections.OrderedDict(
+            (col, concat([left[col], right[col]]).drop_duplicates())
+            for col in left)
+
+    from pandas.core.reshape.concat import concat
+    combined = concat([left, right])
+    level = list(range(combined.index.nlevels))
+    return getattr(combined.groupby(level=level, sort=False), name)()
+
+
+def aggregate_chunks(chunks, by, func, sort=True):
+    """
+    Group and aggregate the DataFrames of an iterator, e.g. the chunks of
+    ``read_csv(..., chunksize=...)``, keeping only the partial results of
+    each group in memory.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+    by : label or list of labels
+        The columns to group by
+    func : str or list of str
+        Reductions whose partial results over each chunk can be combined:
+        'sum', 'count', 'mean', 'var', 'std', 'min', 'max', 'first', 'last'
+        and 'nunique'
+    sort : boolean, default True
+        Sort the group keys
+
+    Returns
+    -------
+    aggregated : DataFrame
+        The same as ``concat(chunks).groupby(by, sort=sort).agg(func)``
+
+    Notes
+    -----
+    ``var`` and ``std`` are combined from the count, mean and sum of
+    squared deviations from the mean of each group, ``nunique`` keeps the
+    distinct values of each group. With a list of reductions, only the
+    columns supporting all of them are aggregated.
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('data.csv', chunksize=10**6)
+    >>> aggregate_chunks(reader, 'key', ['sum', 'mean'])  # doctest: +SKIP
+    """
+    keys = by if isinstance(by, list) else [by]
+    if isinstance(func, compat.string_types):
+        hows = [func]
+    else:
+        hows = list(func)
+    for how in hows:
+        if how not in _chunk_combinable_reductions:
+            raise ValueError("cannot combine {} over chunks".format(how))
+
+    names = []
+    for how in hows:
+        for name in _chunk_combinable_reductions[how]:
+            if name not in names:
+                names.append(name)
+
+    state = {}
+    columns = dtypes = None
+    for chunk in chunks:
+        if columns is None:
+            # like DataFrameGroupBy.nunique, a single nunique includes the
+            # keys
+            dtypes = chunk.dtypes
+            columns = [col for col in chunk.columns
+                       if col not in keys or func == 'nunique']
+
+        grouped = chunk.groupby(by, sort=False)
+        for name in names:
+            partial = _chunk_partial(chunk, grouped, keys, name, columns)
+            if name in state:
+                partial = _combine_partials(state[name], partial, name)
+            state[name] = partial
+
+    if columns is None:
+        raise ValueError('No chunks to aggregate')
+
+    results = {}
+    for how in hows:
+        if how == 'mean':
+            total = state['sum']
+            result = total / state['count'][total.columns]
+        elif how in ['var', 'std']:
+            n, _, m2 = state['moments']
+            result = (m2 / (n - 1)).where(n > 1)
+        elif how == 'nunique':
+            pairs = state['nunique']
+            result = DataFrame(collections.OrderedDict(
+                (col, pairs[col].groupby(by, sort=False)[col].nunique())
+                for col in columns), columns=columns)
+        else:
+            result = state[how]
+
+        if how in ['mean', 'var', 'std']:
+            # cast back like the single reductions
+            result = DataFrame(collections.OrderedDict(
+                (col, maybe_downcast_to_dtype(result[col].values,
+                                              dtypes[col]))
+                for col in result.columns), index=result.index,
+                columns=result.columns)
+            if how == 'std':
+                result = np.sqrt(result)
+        results[how] = result
+
+    if isinstance(func, compat.string_types):
+        result = results[func]
+    else:
+        from pandas.core.reshape.concat import concat
+        agg_columns = [col for col in columns
+                       if all(col in results[how] for how in hows)]
+        result = concat([DataFrame(collections.OrderedDict(
+            (how, results[how][col]) for how in hows), columns=hows)
+            for col in agg_columns], keys=agg_columns, axis=1)
+
+    if sort:
+        result = result.sort_index()
+    return result
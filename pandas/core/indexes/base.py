@@ -1581,6 +1581,55 @@ class Index(IndexOpsMixin, PandasObject):
     def _cleanup(self):
         self._engine.clear_mapping()
 
+        # the labels kept by _factorize_cached
+        cache = getattr(self, '_cache', None)
+        if cache:
+            for sort in [False, True]:
+                cache.pop(('factorize', sort), None)
+
+    def clear_engine_cache(self):
+        """
+        Free the hash table built to look up labels in the Index, and the
+        labels kept for groupbys on the Index.
+
+        The table is populated again, if needed, by later lookups. See the
+        ``compute.index_hashtable_max_size`` option to never keep the tables
+        of large indexes.
+
+        .. versionadded:: 0.23.0
+
+        Examples
+        --------
+        >>> idx = pd.Index([3, 1, 2])
+        >>> idx.get_indexer([1, 2])
+        array([1, 2])
+        >>> idx.memory_usage() > idx.nbytes
+        True
+        >>> idx.clear_engine_cache()
+        >>> idx.memory_usage() == idx.nbytes
+        True
+        """
+        self._cleanup()
+
+    def _factorize_cached(self, sort=False):
+        """
+        Return ``self.factorize(sort=sort)``, which is only computed once
+        as an index is immutable, so that repeated groupbys on the same
+        index do not hash it again.
+
+        The labels, 8 bytes per row for each value of ``sort``, are kept
+        with the uniques until ``clear_engine_cache`` is called.
+        """
+        cache = getattr(self, '_cache', None)
+        if cache is None:
+            cache = self._cache = {}
+
+        key = ('factorize', sort)
+        if key not in cache:
+            cache[key] = self.factorize(sort=sort)
+        labels, uniques = cache[key]
+        return labels.copy(), uniques
+
     @cache_readonly
     def _constructor(self):
         return type(self)
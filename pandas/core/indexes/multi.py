@@ -5,7 +5,8 @@ import warnings
 from sys import getsizeof
 
 import numpy as np
-from pandas._libs import index as libindex, lib, Timestamp
+from pandas._libs import (index as libindex, lib, Timestamp,
+                          algos as libalgos)
 
 from pandas.compat import range, zip, lrange, lzip, map
 from pandas.compat.numpy import function as nv
@@ -15,6 +16,7 @@ from pandas.core.dtypes.common import (
     _ensure_int64,
     _ensure_platform_int,
     is_categorical_dtype,
+    is_integer,
     is_object_dtype,
     is_iterator,
     is_list_like,
@@ -50,6 +52,138 @@ _index_doc_kwargs.update(
          target_klass='MultiIndex or list of tuples'))
 
 
+class MultiIndexUIntEngine(libindex.UInt64Engine):
+    """
+    Engine of a MultiIndex on the labels of its levels, which never builds
+    the tuples of the index.
+
+    The labels of each row are packed into a single uint64 key: level ``i``
+    holds the code ``2 * (rank + 1)``, ``rank`` being the position of the
+    label in the sorted level (the code is 0 for NaN), at the bits above
+    ``offsets[i]``, the first level in the highest bits. The keys then sort
+    like the tuples, and the odd codes in between stand for values of a
+    target that are missing from a level, which never match but keep their
+    order for pad/backfill.
+
+    Raises OverflowError when the keys do not fit in 64 bits and TypeError
+    when a level cannot be sorted.
+    """
+
+    def __init__(self, levels, labels):
+        offsets = []
+        offset = 0
+        for lev in reversed(levels):
+            offsets.append(offset)
+            offset += (2 * len(lev) + 1).bit_length()
+        if offset > 64:
+            raise OverflowError('the labels of the levels do not fit in '
+                                '64 bits')
+        self.offsets = offsets[::-1]
+
+        # the levels in sorted order, and the ranks of their labels
+        self.levels = []
+        ranks = []
+        for lev in levels:
+            if lev.is_monotonic_increasing:
+                self.levels.append(lev)
+                ranks.append(None)
+            else:
+                order = lev.argsort()
+                rank = np.empty(len(lev), dtype=np.int64)
+                rank[order] = np.arange(len(lev))
+                self.levels.append(lev.take(order))
+                ranks.append(rank)
+
+        def level_codes(lab, rank):
+            lab = _ensure_int64(lab)
+            if rank is not None:
+                lab = algos.take_1d(rank, lab, fill_value=-1)
+            return 2 * (lab + 1)
+
+        codes = (level_codes(lab, rank) for lab, rank in zip(labels, ranks))
+        keys = self._pack(codes, len(labels[0]))
+        super(MultiIndexUIntEngine, self).__init__(lambda: keys, len(keys))
+
+    def _pack(self, codes, n):
+        # codes is an iterable, so that only one level is held at a time
+        keys = np.zeros(n, dtype=np.uint64)
+        for code, offset in zip(codes, self.offsets):
+            keys |= code.astype(np.uint64) << np.uint64(offset)
+        return keys
+
+    def _target_keys(self, target):
+        """ pack the values of a MultiIndex (or of tuples) into keys """
+        # an odd code in the first level never matches
+        never = np.full(len(target), 1 << self.offsets[0], dtype=np.uint64)
+        if not isinstance(target, MultiIndex):
+            try:
+                target = MultiIndex.from_tuples(target)
+            except (TypeError, ValueError):
+                # values which are not tuples, as in get_indexer_for
+                return never
+        if target.nlevels != len(self.levels):
+            return never
+
+        def level_codes(lev, tlev, tlab):
+            # map the level of the target once, then take by its labels
+            rank = lev.get_indexer(tlev)
+            codes = 2 * (rank + 1)
+            missing = rank == -1
+            if missing.any():
+                try:
+                    pos = lev.searchsorted(tlev[missing])
+                except (TypeError, ValueError):
+                    pos = 0
+                codes[missing] = 2 * pos + 1
+            return algos.take_1d(codes, _ensure_int64(tlab), fill_value=0)
+
+        codes = (level_codes(lev, tlev, tlab) for lev, tlev, tlab in
+                 zip(self.levels, target.levels, target.labels))
+        return self._pack(codes, len(target))
+
+    def get_loc(self, key):
+        hash(key)
+        if not isinstance(key, tuple) or len(key) != len(self.levels):
+            raise KeyError(key)
+
+        packed = 0
+        for lev, k, offset in zip(self.levels, key, self.offsets):
+            if is_scalar(k) and isna(k):
+                code = 0
+            else:
+                try:
+                    loc = lev.get_loc(k)
+                except (KeyError, TypeError, ValueError):
+                    raise KeyError(key)
+                if not is_integer(loc):
+                    raise KeyError(key)
+                code = 2 * (int(loc) + 1)
+            packed |= code << offset
+
+        return super(MultiIndexUIntEngine, self).get_loc(np.uint64(packed))
+
+    def get_indexer(self, target):
+        return super(MultiIndexUIntEngine, self).get_indexer(
+            self._target_keys(target))
+
+    def get_indexer_non_unique(self, target):
+        return super(MultiIndexUIntEngine, self).get_indexer_non_unique(
+            self._target_keys(target))
+
+    def get_fill_indexer(self, target, method, limit=None):
+        """ pad/backfill the target, both sorted, on the packed keys """
+        f = (libalgos.pad_uint64 if method == 'pad' else
+             libalgos.backfill_uint64)
+        return f(self.vgetter(), self._target_keys(target), limit=limit)
+
+    def __contains__(self, key):
+        try:
+            self.get_loc(key)
+            return True
+        except (KeyError, TypeError):
+            return False
+
+
 class MultiIndex(Index):
     """
     A multi-level, or hierarchical, index object for pandas objects
@@ -691,7 +825,13 @@ class MultiIndex(Index):
     @cache_readonly
     def _engine(self):
 
-        # choose our engine based on our size
+        # look up the packed labels of the levels when they fit in 64 bits
+        try:
+            return MultiIndexUIntEngine(self.levels, self.labels)
+        except (OverflowError, TypeError):
+            pass
+
+        # otherwise choose our engine based on our size
         # the hashing based MultiIndex for larger
         # sizes, and the MultiIndexOjbect for smaller
         # xref: https://github.com/pandas-dev/pandas/pull/16324
@@ -774,6 +914,8 @@ class MultiIndex(Index):
 
     @cache_readonly
     def is_unique(self):
+        if isinstance(self._engine, MultiIndexUIntEngine):
+            return self._engine.is_unique
         return not self.duplicated().any()
 
     @cache_readonly
@@ -1904,8 +2046,23 @@ class MultiIndex(Index):
 
     @Appender(_index_shared_docs['get_indexer_non_unique'] % _index_doc_kwargs)
     def get_indexer_non_unique(self, target):
+        target = _ensure_index(target)
+        if (isinstance(target, MultiIndex) and
+                isinstance(self._engine, MultiIndexUIntEngine)):
+            indexer, missing = self._engine.get_indexer_non_unique(target)
+            return _ensure_platform_int(indexer), missing
         return super(MultiIndex, self).get_indexer_non_unique(target)
 
+    def _get_fill_indexer(self, target, method, limit=None, tolerance=None):
+        if not isinstance(self._engine, MultiIndexUIntEngine):
+            return super(MultiIndex, self)._get_fill_indexer(
+                target, method, limit=limit, tolerance=tolerance)
+
+        if self.is_monotonic_increasing and target.is_monotonic_increasing:
+            # the packed labels sort like the tuples
+            return self._engine.get_fill_indexer(target, method, limit)
+        return self._get_fill_indexer_searchsorted(target, method, limit)
+
     def reindex(self, target, method=None, level=None, limit=None,
                 tolerance=None):
         """
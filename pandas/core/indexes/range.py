@@ -2,16 +2,20 @@ from sys import getsizeof
 import operator
 
 import numpy as np
-from pandas._libs import index as libindex
+from pandas._libs import index as libindex, lib
 
 from pandas.core.dtypes.common import (
     is_integer,
     is_scalar,
-    is_int64_dtype)
+    is_list_like,
+    is_integer_dtype,
+    is_int64_dtype,
+    _ensure_int64)
 
 from pandas import compat
 from pandas.compat import lrange, range, get_range_parameters
 from pandas.compat.numpy import function as nv
+import pandas.core.common as com
 from pandas.core.common import _all_none
 from pandas.core.indexes.base import Index, _index_shared_docs
 from pandas.util._decorators import Appender, cache_readonly
@@ -266,6 +270,32 @@ class RangeIndex(Int64Index):
         return RangeIndex(name=name, fastpath=True,
                           **dict(self._get_data_as_items()))
 
+    @Appender(_index_shared_docs['take'] % ibase._index_doc_kwargs)
+    def take(self, indices, axis=0, allow_fill=True,
+             fill_value=None, **kwargs):
+        if kwargs:
+            nv.validate_take(tuple(), kwargs)
+        if not (allow_fill and fill_value is not None):
+            # conserve RangeIndex type for evenly spaced positions
+            slc = self._maybe_indices_to_slice(indices)
+            if isinstance(slc, slice):
+                return self[slc]
+        return super(RangeIndex, self).take(indices, axis=axis,
+                                            allow_fill=allow_fill,
+                                            fill_value=fill_value)
+
+    def _maybe_indices_to_slice(self, indices):
+        """
+        Return the slice of the positions ``indices`` if these are in bounds
+        and evenly spaced, else ``indices`` unchanged
+        """
+        arr = np.asarray(indices)
+        if arr.ndim == 1 and is_integer_dtype(arr):
+            slc = lib.maybe_indices_to_slice(_ensure_int64(arr), len(self))
+            if isinstance(slc, slice):
+                return slc
+        return indices
+
     def _minmax(self, meth):
         no_steps = len(self) - 1
         if no_steps == -1:
@@ -417,7 +447,10 @@ class RangeIndex(Int64Index):
             return self
         if len(self) == 0:
             return other
-        if isinstance(other, RangeIndex):
+        other_range = _maybe_as_range(other)
+        if other_range is not None:
+            other = other_range
+            name = self.name if self.name == other.name else None
             start_s, step_s = self._start, self._step
             end_s = self._start + self._step * (len(self) - 1)
             start_o, step_o = other._start, other._step
@@ -438,21 +471,25 @@ class RangeIndex(Int64Index):
                 if ((start_s - start_o) % step_s == 0 and
                         (start_s - end_o) <= step_s and
                         (start_o - end_s) <= step_s):
-                    return RangeIndex(start_r, end_r + step_s, step_s)
+                    return RangeIndex(start_r, end_r + step_s, step_s,
+                                      name=name)
                 if ((step_s % 2 == 0) and
                         (abs(start_s - start_o) <= step_s / 2) and
                         (abs(end_s - end_o) <= step_s / 2)):
-                    return RangeIndex(start_r, end_r + step_s / 2, step_s / 2)
+                    return RangeIndex(start_r, end_r + step_s / 2,
+                                      step_s / 2, name=name)
             elif step_o % step_s == 0:
                 if ((start_o - start_s) % step_s == 0 and
                         (start_o + step_s >= start_s) and
                         (end_o - step_s <= end_s)):
-                    return RangeIndex(start_r, end_r + step_s, step_s)
+                    return RangeIndex(start_r, end_r + step_s, step_s,
+                                      name=name)
             elif step_s % step_o == 0:
                 if ((start_s - start_o) % step_o == 0 and
                         (start_s + step_o >= start_o) and
                         (end_s - step_o <= end_o)):
-                    return RangeIndex(start_r, end_r + step_o, step_o)
+                    return RangeIndex(start_r, end_r + step_o, step_o,
+                                      name=name)
 
         return self._int64index.union(other)
 
@@ -467,6 +504,13 @@ class RangeIndex(Int64Index):
         return super(RangeIndex, self).join(other, how, level, return_indexers,
                                             sort)
 
+    def _concat(self, indexes, name):
+        # integer indexes of evenly spaced values may continue the ranges
+        ranges = [_maybe_as_range(obj) for obj in indexes]
+        if all(obj is not None for obj in ranges):
+            return self._concat_same_dtype(ranges, name)
+        return super(RangeIndex, self)._concat(indexes, name)
+
     def _concat_same_dtype(self, indexes, name):
         return _concat._concat_rangeindex_same_dtype(indexes).rename(name)
 
@@ -544,6 +588,20 @@ class RangeIndex(Int64Index):
 
             return RangeIndex(start, stop, step, self.name, fastpath=True)
 
+        # conserve RangeIndex type for boolean masks selecting a single run
+        # and for evenly spaced positions
+        if is_list_like(key) and not isinstance(key, tuple):
+            if com.is_bool_indexer(key):
+                mask = np.asarray(key, dtype=bool)
+                if mask.ndim == 1 and len(mask) == len(self):
+                    slc = lib.maybe_booleans_to_slice(mask.view(np.uint8))
+                    if isinstance(slc, slice):
+                        return self[slc]
+            else:
+                slc = self._maybe_indices_to_slice(key)
+                if isinstance(slc, slice):
+                    return self[slc]
+
         # fall back to Int64Index
         return super_getitem(key)
 
@@ -670,3 +728,30 @@ class RangeIndex(Int64Index):
 
 RangeIndex._add_numeric_methods()
 RangeIndex._add_logical_methods()
+
+
+def _maybe_as_range(index):
+    """
+    Return ``index`` as a RangeIndex if it is an Int64Index of evenly spaced
+    values, else None
+    """
+    if isinstance(index, RangeIndex):
+        return index
+    if type(index) is not Int64Index:
+        return None
+
+    values = index._values
+    if len(values) < 2:
+        start = int(values[0]) if len(values) else 0
+        return RangeIndex(start, start + len(values), name=index.name)
+    # the step and span are computed in Python ints, as the differences of
+    # int64 values can wrap around
+    start, stop = int(values[0]), int(values[-1])
+    step = int(values[1]) - start
+    if (step == 0 or not -2**63 <= step < 2**63 or
+            start + step * (len(values) - 1) != stop):
+        return None
+    # with the span checked, a wrapped difference cannot equal the step
+    if not (np.diff(values) == step).all():
+        return None
+    return RangeIndex(start, stop + step, step, name=index.name)
@@ -7,7 +7,7 @@ import pandas.compat as compat
 from pandas.core.dtypes.generic import ABCDataFrame, ABCPanel, ABCSeries
 from pandas.core.dtypes.common import (
     is_integer_dtype,
-    is_integer, is_float,
+    is_integer, is_float, is_bool,
     is_list_like,
     is_sequence,
     is_iterator,
@@ -17,12 +17,14 @@ from pandas.core.dtypes.common import (
     _ensure_platform_int)
 from pandas.core.dtypes.missing import isna, _infer_fill_value
 
-from pandas.core.index import Index, MultiIndex
+from pandas.core.index import (Index, MultiIndex, Int64Index, UInt64Index,
+                               Float64Index, RangeIndex)
 
 import pandas.core.common as com
 from pandas.core.common import (is_bool_indexer, _asarray_tuplesafe,
                                 is_null_slice, is_full_slice,
                                 _values_from_object)
+from pandas._libs import index as libindex
 from pandas._libs.indexing import _NDFrameIndexerBase
 
 
@@ -1351,6 +1353,7 @@ class _IXIndexer(_NDFrameIndexer):
 
 class _LocationIndexer(_NDFrameIndexer):
     _exception = Exception
+    _takeable = False
 
     def __getitem__(self, key):
         if type(key) is tuple:
@@ -1367,6 +1370,11 @@ class _LocationIndexer(_NDFrameIndexer):
             axis = self.axis or 0
 
             maybe_callable = com._apply_if_callable(key, self.obj)
+            if self.ndim == 1:
+                found, value = fast_scalar_lookup(self.obj, maybe_callable,
+                                                  takeable=self._takeable)
+                if found:
+                    return value
             return self._getitem_axis(maybe_callable, axis=axis)
 
     def _is_scalar_access(self, key):
@@ -1651,6 +1659,7 @@ class _iLocIndexer(_LocationIndexer):
     _valid_types = ("integer, integer slice (START point is INCLUDED, END "
                     "point is EXCLUDED), listlike of integers, boolean array")
     _exception = IndexError
+    _takeable = True
 
     def _has_valid_type(self, key, axis):
         if is_bool_indexer(key):
@@ -2006,6 +2015,64 @@ def is_index_slice(obj):
     return not both_none and (_crit(obj.start) and _crit(obj.stop))
 
 
+# index classes whose scalar label lookups are answered by their engine
+# alone, with the scalar types the engine holds
+_fast_label_index_types = {
+    Index: lambda key: not is_float(key),
+    Int64Index: is_integer,
+    RangeIndex: is_integer,
+    UInt64Index: is_integer,
+    Float64Index: lambda key: is_integer(key) or (is_float(key) and
+                                                  key == key),
+}
+
+
+def fast_scalar_lookup(obj, key, takeable=False):
+    """
+    Look up a scalar key in a Series backed by an ndarray, going straight to
+    the values and the index engine.
+
+    Only the unique-label and in-bounds position cases are handled here,
+    anything else is left to the generic indexing machinery.
+
+    Parameters
+    ----------
+    obj : Series
+    key : object
+    takeable : bool, default False
+        interpret the key as a position rather than as a label
+
+    Returns
+    -------
+    found : bool
+        whether the lookup was handled
+    value : object
+        the (boxed) element, None when not found
+    """
+    values = obj._values
+    if type(values) is not np.ndarray or is_bool(key):
+        return False, None
+
+    if takeable:
+        if not is_integer(key) or not -len(values) <= key < len(values):
+            return False, None
+        return True, libindex.get_value_at(values, key)
+
+    ax = obj.index
+    holds_key = _fast_label_index_types.get(type(ax))
+    if holds_key is None or not is_scalar(key) or not holds_key(key):
+        return False, None
+
+    try:
+        loc = ax._engine.get_loc(key)
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return False, None
+    if not is_integer(loc):
+        # non-unique label
+        return False, None
+    return True, libindex.get_value_at(values, loc)
+
+
 def check_bool_indexer(ax, key):
     # boolean indexing, need to check that the data are aligned, otherwise
     # disallowed
@@ -1,5 +1,6 @@
 import warnings
 import copy
+import weakref
 from warnings import catch_warnings
 import inspect
 import itertools
@@ -12,6 +13,7 @@ from functools import partial
 import numpy as np
 
 from pandas.core.base import PandasObject
+from pandas.core.config import get_option
 
 from pandas.core.dtypes.dtypes import (
     ExtensionDtype, DatetimeTZDtype,
@@ -44,6 +46,7 @@ from pandas.core.dtypes.cast import (
     infer_dtype_from_scalar,
     soft_convert_objects,
     maybe_convert_objects,
+    maybe_infer_to_datetimelike,
     astype_nansafe,
     find_common_type,
     maybe_infer_dtype_type)
@@ -65,7 +68,7 @@ from pandas.io.formats.printing import pprint_thing
 
 import pandas.core.missing as missing
 from pandas.core.sparse.array import _maybe_to_sparse, SparseArray
-from pandas._libs import lib, tslib
+from pandas._libs import lib, tslib, algos as libalgos
 from pandas._libs.tslib import Timedelta
 from pandas._libs.lib import BlockPlacement
 from pandas._libs.tslibs import conversion
@@ -76,6 +79,70 @@ from pandas import compat
 from pandas.compat import range, map, zip, u
 
 
+# consolidation budget for incremental operations (``insert``), see the
+# ``mode.consolidate_max_blocks`` and ``mode.consolidate_max_bytes`` options
+_CONSOLIDATE_MAX_BLOCKS = 100
+_CONSOLIDATE_MAX_BYTES = None
+
+
+def set_consolidate_max_blocks(v=100):
+    # set the number of blocks tolerated before incremental consolidation
+    global _CONSOLIDATE_MAX_BLOCKS
+    _CONSOLIDATE_MAX_BLOCKS = v
+
+
+def set_consolidate_max_bytes(v=None):
+    # set the number of fragmented bytes tolerated before consolidation
+    global _CONSOLIDATE_MAX_BYTES
+    _CONSOLIDATE_MAX_BYTES = v
+
+
+set_consolidate_max_blocks(get_option('mode.consolidate_max_blocks'))
+set_consolidate_max_bytes(get_option('mode.consolidate_max_bytes'))
+
+
+# when set, deep copies of blocks share their values until written to, see
+# the ``mode.copy_on_write`` option
+_COPY_ON_WRITE = False
+
+
+def set_copy_on_write(v=False):
+    # set/unset copy-on-write for deep copies of blocks
+    global _COPY_ON_WRITE
+    _COPY_ON_WRITE = v
+
+
+set_copy_on_write(get_option('mode.copy_on_write'))
+
+
+class BlockRefs(object):
+    """
+    Track the blocks sharing a values buffer under copy-on-write
+
+    Blocks are held through weak references, so a buffer stops being
+    shared as soon as all other blocks referring to it are garbage
+    collected.
+    """
+    __slots__ = ['_refs']
+
+    def __init__(self, block):
+        self._refs = []
+        self.add(block)
+
+    def add(self, block):
+        self._refs.append(weakref.ref(block))
+        block._refs = self
+
+    def remove(self, block):
+        self._refs = [ref for ref in self._refs
+                      if ref() is not None and ref() is not block]
+        block._refs = None
+
+    def has_other_refs(self, block):
+        self._refs = [ref for ref in self._refs if ref() is not None]
+        return any(ref() is not block for ref in self._refs)
+
+
 class Block(PandasObject):
     """
     Canonical n-dimensional unit of homogeneous dtype contained in a pandas
@@ -83,7 +150,7 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['_mgr_locs', 'values', 'ndim']
+    __slots__ = ['_mgr_locs', 'values', 'ndim', '_refs', '__weakref__']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -114,6 +181,7 @@ class Block(PandasObject):
 
         self.mgr_locs = placement
         self.values = values
+        self._refs = None
 
         if ndim and len(self.mgr_locs) != len(self.values):
             raise ValueError(
@@ -259,6 +327,7 @@ class Block(PandasObject):
         self.mgr_locs = BlockPlacement(state[0])
         self.values = state[1]
         self.ndim = self.values.ndim
+        self._refs = None
 
     def _slice(self, slicer):
         """ return a slice of my values """
@@ -353,6 +422,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._maybe_copy_on_write()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -741,9 +811,35 @@ class Block(PandasObject):
         """ copy constructor """
         values = self.values
         if deep:
+            if _COPY_ON_WRITE and type(values) is np.ndarray:
+                return self._copy_on_write()
             values = values.copy()
         return self.make_block_same_class(values)
 
+    def _copy_on_write(self):
+        """ return a block sharing my values until either is written to """
+        block = self.make_block_same_class(self.values)
+        if self._refs is None:
+            BlockRefs(self)
+        self._refs.add(block)
+        return block
+
+    def _maybe_copy_on_write(self):
+        """
+        copy my values if they are shared with another block under
+        copy-on-write; must be called before writing to the values
+
+        Returns
+        -------
+        boolean, True if the values were copied
+        """
+        refs = self._refs
+        if refs is None or not refs.has_other_refs(self):
+            return False
+        refs.remove(self)
+        self.values = self.values.copy()
+        return True
+
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False, convert=True, mgr=None):
         """ replace the to_replace value with value, possible to create new
@@ -795,6 +891,7 @@ class Block(PandasObject):
                 value = np.nan
 
         # coerce if block dtype can store value
+        self._maybe_copy_on_write()
         values = self.values
         try:
             values, _, value, _ = self._try_coerce_args(values, value)
@@ -935,6 +1032,8 @@ class Block(PandasObject):
         a list of new blocks, the result of the putmask
         """
 
+        if inplace:
+            self._maybe_copy_on_write()
         new_values = self.values if inplace else self.values.copy()
 
         if hasattr(new, 'reindex_axis'):
@@ -1154,6 +1253,8 @@ class Block(PandasObject):
                 else:
                     return [self.copy()]
 
+        if inplace:
+            self._maybe_copy_on_write()
         values = self.values if inplace else self.values.copy()
         values, _, fill_value, _ = self._try_coerce_args(values, fill_value)
         values = missing.interpolate_2d(values, method=method, axis=axis,
@@ -1171,6 +1272,8 @@ class Block(PandasObject):
         """ interpolate using scipy wrappers """
 
         inplace = validate_bool_kwarg(inplace, 'inplace')
+        if inplace:
+            self._maybe_copy_on_write()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -1676,6 +1779,7 @@ class ScalarBlock(Block):
         self.ndim = 0
         self.mgr_locs = [0]
         self.values = values
+        self._refs = None
 
     @property
     def dtype(self):
@@ -1715,6 +1819,7 @@ class NonConsolidatableMixIn(object):
             raise TypeError("values must be {0}".format(self._holder.__name__))
 
         self.values = values
+        self._refs = None
 
     @property
     def shape(self):
@@ -1769,6 +1874,9 @@ class NonConsolidatableMixIn(object):
         """
         inplace = validate_bool_kwarg(inplace, 'inplace')
 
+        if inplace:
+            self._maybe_copy_on_write()
+
         # use block's copy logic.
         # .values may be an Index which does shallow copy by default
         new_values = self.values if inplace else self.copy().values
@@ -2293,6 +2401,8 @@ class ObjectBlock(Block):
                                                     filter=filter, regex=regex,
                                                     mgr=mgr)
 
+        if inplace:
+            self._maybe_copy_on_write()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -3008,11 +3118,12 @@ class BlockManager(PandasObject):
     This is *not* a public API class
     """
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_blknos', '_blklocs']
+                 '_is_consolidated', '_blknos', '_blklocs', '_fragmentation']
 
     def __init__(self, blocks, axes, do_integrity_check=True, fastpath=True):
         self.axes = [_ensure_index(ax) for ax in axes]
         self.blocks = tuple(blocks)
+        self._fragmentation = None
 
         for block in blocks:
             if block.is_sparse:
@@ -3824,6 +3935,101 @@ class BlockManager(PandasObject):
 
         return result
 
+    def _iter_pairs_by_block(self, locs):
+        """
+        Group the positions of the item locations ``locs`` by block,
+        yielding the block, the positions and their locations in the block
+        """
+        blknos = self._blknos[locs]
+        indexer, counts = libalgos.groupsort_indexer(blknos, len(self.blocks))
+
+        start = counts[0]
+        for blkno, blk in enumerate(self.blocks):
+            end = start + counts[blkno + 1]
+            if end > start:
+                pos = indexer[start:end]
+                yield blk, pos, self._blklocs[locs[pos]]
+            start = end
+
+    def take_pairs(self, locs, rows):
+        """
+        Return the values at the pairs of item and row positions
+        ``(locs[i], rows[i])``, taken with one fancy indexing per block
+
+        Parameters
+        ----------
+        locs, rows : int64 ndarrays of the same length
+
+        Returns
+        -------
+        values : ndarray of the interleaved dtype of the blocks involved
+        """
+        groups = list(self._iter_pairs_by_block(locs))
+        blocks = [blk for blk, _, _ in groups] or self.blocks
+        dtype = _interleaved_dtype(blocks)
+        result = np.empty(len(locs), dtype=dtype)
+
+        for blk, pos, blklocs in groups:
+            if blk._can_consolidate:
+                values = blk.values[blklocs, rows[pos]]
+            else:
+                values = blk.values[rows[pos]]
+
+            # box the values as the interleaved values of the block would be
+            values = blk.make_block_same_class(
+                values, placement=slice(0, len(values)), ndim=1)
+            result[pos] = values.get_values(dtype)
+
+        return result
+
+    def put_pairs(self, locs, rows, value):
+        """
+        Set the values at the pairs of item and row positions
+        ``(locs[i], rows[i])`` in place, with one fancy assignment per block
+
+        Parameters
+        ----------
+        locs, rows : int64 ndarrays of the same length
+        value : scalar or ndarray of the same length
+
+        Returns
+        -------
+        unset : boolean ndarray, True for the pairs which were not set as
+            their block cannot hold the value without changing its dtype
+        """
+        unset = np.zeros(len(locs), dtype=bool)
+
+        for blk, pos, blklocs in self._iter_pairs_by_block(locs):
+            if is_scalar(value):
+                element = value
+            else:
+                # infer the values of mixed types going to a typed block
+                element = value[pos]
+                if is_object_dtype(element) and not blk.is_object:
+                    element = lib.maybe_convert_objects(element)
+                    if is_object_dtype(element):
+                        element = maybe_infer_to_datetimelike(element)
+
+            if not blk._can_consolidate or not blk._can_hold_element(element):
+                unset[pos] = True
+                continue
+
+            # coerce against an empty slice, not to check all the values
+            try:
+                _, _, element, _ = blk._try_coerce_args(blk.values[:, :0],
+                                                        element)
+            except (TypeError, ValueError):
+                unset[pos] = True
+                continue
+
+            blk._maybe_copy_on_write()
+            values = blk.values
+            if is_datetime64_dtype(values) or is_timedelta64_dtype(values):
+                values = values.view('i8')
+            values[blklocs, rows[pos]] = element
+
+        return unset
+
     def consolidate(self):
         """
         Join together blocks having same dtype
@@ -3843,10 +4049,77 @@ class BlockManager(PandasObject):
     def _consolidate_inplace(self):
         if not self.is_consolidated():
             self.blocks = tuple(_consolidate(self.blocks))
+            self._fragmentation = None
             self._is_consolidated = True
             self._known_consolidated = True
             self._rebuild_blknos_and_blklocs()
 
+    def _maybe_consolidate_inplace(self, previous=None, added=None):
+        """
+        Consolidate only when the fragmentation exceeds the consolidation
+        budget.
+
+        Used by incremental operations such as ``insert``; operations that
+        need the 2-D values of a block call ``_consolidate_inplace``.
+
+        The block budget is at least ``mode.consolidate_max_blocks`` and
+        grows with the number of items, so that building a wide frame one
+        column at a time copies each column an amortized constant number of
+        times instead of once per ``mode.consolidate_max_blocks`` inserts.
+
+        Parameters
+        ----------
+        previous : tuple of Blocks, optional
+            the blocks before ``added`` was appended to them
+        added : Block, optional
+            the block appended by an ``insert``
+        """
+        if len(self.blocks) > max(_CONSOLIDATE_MAX_BLOCKS,
+                                  len(self.items) // 2):
+            self._consolidate_inplace()
+        elif (_CONSOLIDATE_MAX_BYTES is not None and
+                self._fragmented_nbytes(previous, added) >
+                _CONSOLIDATE_MAX_BYTES):
+            self._consolidate_inplace()
+
+    def _fragmented_nbytes(self, previous=None, added=None):
+        """
+        The bytes held in the blocks which share their consolidation key
+        with another block.
+
+        The counts behind it are kept with the blocks they were computed
+        for, and dropped when the blocks are replaced otherwise than by an
+        ``insert``; when ``added`` was appended to those blocks, giving the
+        current ones, the counts are updated for it rather than computed
+        again from all the blocks, so that repeated inserts stay linear.
+        """
+        state = getattr(self, '_fragmentation', None)
+        if (state is not None and added is not None and
+                state[0] is previous):
+            _, counts, nbytes, fragmented = state
+            if added._can_consolidate:
+                key = added._consolidate_key
+                size = added.values.nbytes
+                counts[key] += 1
+                nbytes[key] += size
+                if counts[key] == 2:
+                    fragmented += nbytes[key]
+                elif counts[key] > 2:
+                    fragmented += size
+        else:
+            counts = defaultdict(int)
+            nbytes = defaultdict(int)
+            for blk in self.blocks:
+                if blk._can_consolidate:
+                    counts[blk._consolidate_key] += 1
+                    nbytes[blk._consolidate_key] += blk.values.nbytes
+            fragmented = sum(nbytes[key]
+                             for key, count in compat.iteritems(counts)
+                             if count > 1)
+
+        self._fragmentation = (self.blocks, counts, nbytes, fragmented)
+        return fragmented
+
     def get(self, item, fastpath=True):
         """
         Return values for selected item (ndarray or BlockManager).
@@ -3888,11 +4161,38 @@ class BlockManager(PandasObject):
             return values
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
-        return SingleBlockManager(
-            [block.make_block_same_class(values,
-                                         placement=slice(0, len(values)),
-                                         ndim=1, fastpath=True)],
-            self.axes[1])
+        new_block = block.make_block_same_class(
+            values, placement=slice(0, len(values)), ndim=1, fastpath=True)
+
+        # the view shares the buffer of a copy-on-write block
+        if block._refs is not None:
+            block._refs.add(new_block)
+
+        return SingleBlockManager([new_block], self.axes[1])
+
+    def _maybe_copy_on_write(self, loc=None):
+        """
+        Copy the values of the blocks shared under copy-on-write before
+        writing to them directly
+
+        Parameters
+        ----------
+        loc : int, optional
+            only check the block holding the item at this position
+
+        Returns
+        -------
+        boolean, True if any values were copied
+        """
+        if loc is None:
+            blocks = self.blocks
+        else:
+            blocks = [self.blocks[self._blknos[loc]]]
+
+        copied = False
+        for blk in blocks:
+            copied = blk._maybe_copy_on_write() or copied
+        return copied
 
     def get_scalar(self, tup):
         """
@@ -3944,6 +4244,7 @@ class BlockManager(PandasObject):
         self.axes[0] = self.items[~is_deleted]
         self.blocks = tuple(b for blkno, b in enumerate(self.blocks)
                             if not is_blk_deleted[blkno])
+        self._fragmentation = None
         self._shape = None
         self._rebuild_blknos_and_blklocs()
 
@@ -4025,6 +4326,7 @@ class BlockManager(PandasObject):
                                          allow_fill=False)
             self.blocks = tuple(blk for i, blk in enumerate(self.blocks)
                                 if i not in set(removed_blknos))
+            self._fragmentation = None
 
         if unfit_val_locs:
             unfit_mgr_locs = np.concatenate(unfit_mgr_locs)
@@ -4055,6 +4357,7 @@ class BlockManager(PandasObject):
                 self._blklocs[unfit_mgr_locs] = np.arange(unfit_count)
 
             self.blocks += tuple(new_blocks)
+            self._fragmentation = None
 
             # Newly created block's dtype may already be present.
             self._known_consolidated = False
@@ -4104,13 +4407,13 @@ class BlockManager(PandasObject):
             self._blknos = np.insert(self._blknos, loc, len(self.blocks))
 
         self.axes[0] = new_axis
+        previous = self.blocks
         self.blocks += (block,)
         self._shape = None
 
         self._known_consolidated = False
 
-        if len(self.blocks) > 100:
-            self._consolidate_inplace()
+        self._maybe_consolidate_inplace(previous, block)
 
     def reindex_axis(self, new_index, axis, method=None, limit=None,
                      fill_value=None, copy=True):
@@ -5344,6 +5647,12 @@ def concatenate_join_units(join_units, concat_axis, copy):
 
     empty_dtype, upcasted_na = get_empty_dtype_and_na(join_units)
 
+    if concat_axis == 1 and len(join_units) > 1:
+        concat_values = concatenate_join_units_into(join_units, empty_dtype,
+                                                    upcasted_na)
+        if concat_values is not None:
+            return concat_values
+
     to_concat = [ju.get_reindexed_values(empty_dtype=empty_dtype,
                                          upcasted_na=upcasted_na)
                  for ju in join_units]
@@ -5359,6 +5668,66 @@ def concatenate_join_units(join_units, concat_axis, copy):
     return concat_values
 
 
+def concatenate_join_units_into(join_units, empty_dtype, upcasted_na):
+    """
+    Concatenate the values of several join units along axis 1 by allocating
+    the result once and copying each unit into its slice of it, rather than
+    making an upcasted copy of each unit and concatenating those.
+
+    Returns None when the result could differ from that of
+    ``_concat._concat_compat``, i.e. for extension blocks, empty results,
+    datetimelike values upcasted to object and dtypes which numpy would
+    promote differently.
+    """
+    nitems = join_units[0].shape[0]
+    lengths = [ju.shape[1] for ju in join_units]
+    if nitems == 0 or sum(lengths) == 0:
+        return None
+
+    dtypes = []
+    for ju in join_units:
+        if ju.block is not None and (not ju.block._can_consolidate or
+                                     ju.block.ndim != 2):
+            return None
+
+        if upcasted_na is not None and ju.is_na:
+            dtype = empty_dtype
+        elif upcasted_na is not None and ju.block.is_bool:
+            dtype = np.dtype(np.object_)
+        else:
+            dtype = ju.dtype
+        dtypes.append(dtype)
+
+    if any(is_datetime64_dtype(dtype) or is_timedelta64_dtype(dtype)
+           for dtype in dtypes):
+        if any(dtype != empty_dtype for dtype in dtypes):
+            return None
+    elif np.result_type(*dtypes) != empty_dtype:
+        return None
+
+    out = np.empty((nitems, sum(lengths)), dtype=empty_dtype)
+    start = 0
+    for ju, length in zip(join_units, lengths):
+        dest = out[:, start:start + length]
+        start += length
+
+        if upcasted_na is not None and ju.is_na:
+            fill_value = upcasted_na
+            if getattr(ju.block, 'is_object', False):
+                # keep None if that is what the all-null block holds
+                values = ju.block.values.ravel(order='K')
+                if len(values) and values[0] is None:
+                    fill_value = None
+            dest.fill(fill_value)
+        elif ju.indexers:
+            dest[...] = ju.get_reindexed_values(empty_dtype=empty_dtype,
+                                                upcasted_na=upcasted_na)
+        else:
+            dest[...] = ju.block.get_values()
+
+    return out
+
+
 def get_mgr_concatenation_plan(mgr, indexers):
     """
     Construct concatenation plan for given block manager and indexers.
@@ -0,0 +1,82 @@
+"""
+thread pool shared by the cython kernels which release the GIL
+"""
+import os
+import threading
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from pandas.compat import range, zip
+from pandas.core.config import get_option
+
+# inputs with fewer values than this are always computed serially
+_MIN_THREADED_SIZE = 10**6
+
+_NUM_THREADS = 0
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def set_num_threads(n=0):
+    # set the number of threads used by the threaded kernels,
+    # 0 to use the number of cpus
+    global _NUM_THREADS
+    _NUM_THREADS = n
+
+
+set_num_threads(get_option('compute.num_threads'))
+
+
+def _cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def get_num_threads(size):
+    """ the number of threads to compute over ``size`` values with """
+    if size < _MIN_THREADED_SIZE:
+        return 1
+
+    n = _NUM_THREADS
+    if n <= 0:
+        n = _cpu_count()
+    return n
+
+
+def _get_pool(n):
+    """
+    the thread pool of this process, created on first use with at least
+    ``n`` threads
+
+    The pool is never closed or replaced while the process runs, as other
+    threads may be mapping on it; larger requests queue their tasks on it.
+    A forked child creates its own pool, the threads of the parent's pool
+    not being copied.
+    """
+    global _POOL
+    pid = os.getpid()
+    with _POOL_LOCK:
+        if _POOL is None or _POOL[0] != pid:
+            _POOL = (pid, ThreadPool(max(n, _cpu_count())))
+        return _POOL[1]
+
+
+def run_threaded(func, n):
+    """
+    call ``func(i)`` for each ``i`` in ``range(n)`` on the shared thread pool
+
+    ``func`` must not itself call ``run_threaded``, which could wait on
+    tasks queued behind it.
+    """
+    _get_pool(n).map(func, range(n))
+
+
+def split_range(n, nchunks):
+    """ slices splitting ``range(n)`` in ``nchunks`` contiguous chunks """
+    bounds = np.linspace(0, n, nchunks + 1).astype(np.int64)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1],
+                                                      bounds[1:])]
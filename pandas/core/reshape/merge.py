@@ -4,10 +4,9 @@ SQL-style merge routines
 
 import copy
 import warnings
-import string
 
 import numpy as np
-from pandas.compat import range, lzip, zip, map, filter
+from pandas.compat import range, zip, map, filter
 import pandas.compat as compat
 
 from pandas import (Categorical, Series, DataFrame,
@@ -21,6 +20,8 @@ from pandas.core.dtypes.common import (
     is_categorical_dtype,
     is_integer_dtype,
     is_float_dtype,
+    is_unsigned_integer_dtype,
+    is_object_dtype,
     is_numeric_dtype,
     is_integer,
     is_int_or_datetime_dtype,
@@ -29,8 +30,10 @@ from pandas.core.dtypes.common import (
     is_list_like,
     is_datetimelike,
     _ensure_int64,
+    _ensure_uint64,
     _ensure_float64,
     _ensure_object,
+    _ensure_platform_int,
     _get_dtype)
 from pandas.core.dtypes.missing import na_value_for_dtype
 from pandas.core.internals import (items_overlap_with_suffix,
@@ -38,10 +41,13 @@ from pandas.core.internals import (items_overlap_with_suffix,
 from pandas.util._decorators import Appender, Substitution
 
 from pandas.core.sorting import is_int64_overflow_possible
+from pandas.core.parallel import get_num_threads, run_threaded, split_range
 import pandas.core.algorithms as algos
 import pandas.core.sorting as sorting
 import pandas.core.common as com
-from pandas._libs import hashtable as libhashtable, join as libjoin, lib
+from pandas._libs import (hashtable as libhashtable, join as libjoin, lib,
+                          algos as libalgos)
+from pandas._libs.tslib import iNaT
 from pandas.errors import MergeError
 
 
@@ -50,12 +56,12 @@ from pandas.errors import MergeError
 def merge(left, right, how='inner', on=None, left_on=None, right_on=None,
           left_index=False, right_index=False, sort=False,
           suffixes=('_x', '_y'), copy=True, indicator=False,
-          validate=None):
+          validate=None, engine=None):
     op = _MergeOperation(left, right, how=how, on=on, left_on=left_on,
                          right_on=right_on, left_index=left_index,
                          right_index=right_index, sort=sort, suffixes=suffixes,
                          copy=copy, indicator=indicator,
-                         validate=validate)
+                         validate=validate, engine=engine)
     return op.get_result()
 
 
@@ -491,12 +497,18 @@ class _MergeOperation(object):
                  left_on=None, right_on=None, axis=1,
                  left_index=False, right_index=False, sort=True,
                  suffixes=('_x', '_y'), copy=True, indicator=False,
-                 validate=None):
+                 validate=None, engine=None):
         self.left = self.orig_left = left
         self.right = self.orig_right = right
         self.how = how
         self.axis = axis
 
+        if engine not in _join_engines:
+            raise ValueError('engine must be one of {engines}, got '
+                             '{engine}'.format(engines=_join_engines,
+                                               engine=engine))
+        self.engine = engine
+
         self.on = com._maybe_make_list(on)
         self.left_on = com._maybe_make_list(left_on)
         self.right_on = com._maybe_make_list(right_on)
@@ -753,7 +765,8 @@ class _MergeOperation(object):
         return _get_join_indexers(self.left_join_keys,
                                   self.right_join_keys,
                                   sort=self.sort,
-                                  how=self.how)
+                                  how=self.how,
+                                  engine=self.engine)
 
     def _get_join_info(self):
         left_ax = self.left._data.axes[self.axis]
@@ -1096,7 +1109,7 @@ class _MergeOperation(object):
 
 
 def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
-                       **kwargs):
+                       engine=None, **kwargs):
     """
 
     Parameters
@@ -1105,6 +1118,7 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
     right_keys: ndarray, Index, Series
     sort: boolean, default False
     how: string {'inner', 'outer', 'left', 'right'}, default 'inner'
+    engine: {None, 'parallel_hash'}, default None
 
     Returns
     -------
@@ -1117,8 +1131,26 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
     assert len(left_keys) == len(right_keys), \
         'left_key and right_keys must be the same length'
 
+    if len(left_keys) == 1 and engine is None:
+        indexers = _get_monotonic_join_indexers(left_keys[0], right_keys[0],
+                                                how=how, sort=sort)
+        if indexers is not None:
+            return indexers
+
+    # drop the rows which cannot match before hashing all of them
+    left_keys, right_keys, left_rows, right_rows = \
+        _semi_join_filter(left_keys, right_keys, how)
+
+    # the number of hash partitions factorized and joined in parallel
+    nparts = 1
+    if engine == 'parallel_hash':
+        nparts = get_num_threads(len(left_keys[0]) + len(right_keys[0]))
+
     # bind `sort` arg. of _factorize_keys
-    fkeys = partial(_factorize_keys, sort=sort)
+    if nparts > 1:
+        fkeys = partial(_parallel_factorize_keys, sort=sort, nparts=nparts)
+    else:
+        fkeys = partial(_factorize_keys, sort=sort)
 
     # get left & right join labels and num. of levels at each location
     llab, rlab, shape = map(list, zip(* map(fkeys, left_keys, right_keys)))
@@ -1126,18 +1158,26 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
     # get flat i8 keys from label lists
     lkey, rkey = _get_join_keys(llab, rlab, shape, sort)
 
-    # factorize keys to a dense i8 space
-    # `count` is the num. of unique keys
-    # set(lkey) | set(rkey) == range(count)
-    lkey, rkey, count = fkeys(lkey, rkey)
+    if nparts > 1:
+        left_indexer, right_indexer = _parallel_hash_join(lkey, rkey, how=how,
+                                                          sort=sort,
+                                                          nparts=nparts)
+    else:
+        # factorize keys to a dense i8 space
+        # `count` is the num. of unique keys
+        # set(lkey) | set(rkey) == range(count)
+        lkey, rkey, count = fkeys(lkey, rkey)
 
-    # preserve left frame order if how == 'left' and sort == False
-    kwargs = copy.copy(kwargs)
-    if how == 'left':
-        kwargs['sort'] = sort
-    join_func = _join_functions[how]
+        # preserve left frame order if how == 'left' and sort == False
+        kwargs = copy.copy(kwargs)
+        if how == 'left':
+            kwargs['sort'] = sort
+        join_func = _join_functions[how]
 
-    return join_func(lkey, rkey, count, **kwargs)
+        left_indexer, right_indexer = join_func(lkey, rkey, count, **kwargs)
+
+    return (_take_rows(left_indexer, left_rows),
+            _take_rows(right_indexer, right_rows))
 
 
 class _OrderedMerge(_MergeOperation):
@@ -1371,13 +1411,7 @@ class _AsOfMerge(_OrderedMerge):
 
     def _get_join_indexers(self):
         """ return the join indexers """
-
-        def flip(xs):
-            """ unlike np.transpose, this returns an array of tuples """
-            labels = list(string.ascii_lowercase[:len(xs)])
-            dtypes = [x.dtype for x in xs]
-            labeled_dtypes = list(zip(labels, dtypes))
-            return np.array(lzip(*xs), labeled_dtypes)
+        from functools import partial
 
         # values to compare
         left_values = (self.left.index.values if self.left_index else
@@ -1410,19 +1444,26 @@ class _AsOfMerge(_OrderedMerge):
                 left_by_values = self.left_join_keys[0:-1]
                 right_by_values = self.right_join_keys[0:-1]
 
-            # get tuple representation of values if more than one
-            if len(left_by_values) == 1:
+            if (len(left_by_values) == 1 and
+                    is_integer_dtype(left_by_values[0]) and
+                    is_integer_dtype(right_by_values[0])):
                 left_by_values = left_by_values[0]
                 right_by_values = right_by_values[0]
-            else:
-                left_by_values = flip(left_by_values)
-                right_by_values = flip(right_by_values)
 
-            # upcast 'by' parameter because HashTable is limited
-            by_type = _get_cython_type_upcast(left_by_values.dtype)
-            by_type_caster = _type_casters[by_type]
-            left_by_values = by_type_caster(left_by_values)
-            right_by_values = by_type_caster(right_by_values)
+                # upcast 'by' parameter because HashTable is limited
+                by_type = _get_cython_type_upcast(left_by_values.dtype)
+                by_type_caster = _type_casters[by_type]
+                left_by_values = by_type_caster(left_by_values)
+                right_by_values = by_type_caster(right_by_values)
+            else:
+                # factorize the keys to combined int64 group codes, which
+                # are equal where all of the 'by' values are
+                llab, rlab, shape = map(list, zip(*map(
+                    partial(_factorize_keys, sort=False),
+                    left_by_values, right_by_values)))
+                left_by_values, right_by_values = _get_join_keys(
+                    llab, rlab, shape, sort=False)
+                by_type = 'int64_t'
 
             # choose appropriate function by type
             on_type = _get_cython_type(left_values.dtype)
@@ -1479,6 +1520,17 @@ def _get_multiindex_indexer(join_keys, index, sort):
 
 
 def _get_single_indexer(join_key, index, sort=False):
+    if (not sort and isinstance(join_key, np.ndarray) and
+            not isinstance(index, MultiIndex) and
+            not is_categorical_dtype(index) and
+            is_dtype_equal(join_key.dtype, index.dtype) and
+            index.is_unique and not index.hasnans):
+        # reuse the hash table of the index engine rather than
+        # factorizing the index again, each row matches at most once
+        right_indexer = _ensure_int64(index.get_indexer(join_key))
+        left_indexer = np.arange(len(join_key), dtype=np.int64)
+        return left_indexer, right_indexer
+
     left_key, right_key, count = _factorize_keys(join_key, index, sort=sort)
 
     left_indexer, right_indexer = libjoin.left_outer_join(
@@ -1527,6 +1579,415 @@ _join_functions = {
     'outer': libjoin.full_outer_join,
 }
 
+_join_engines = [None, 'parallel_hash']
+
+# the rows of the side of a merge which are dropped when they do not match
+# are prefiltered when there are at least _SEMI_JOIN_MIN_SIZE of them, and
+# _SEMI_JOIN_RATIO times as many as on the other side
+_SEMI_JOIN_MIN_SIZE = 10**6
+_SEMI_JOIN_RATIO = 8
+
+
+def _semi_join_filter(left_keys, right_keys, how='inner'):
+    """
+    Drop the rows of the larger side of an inner merge, or of the right
+    (left) side of a left (right) merge, whose keys are not in the other
+    side, by a vectorized pass over a Bloom filter of the keys of the other
+    side. A few rows which do not match may be kept.
+
+    Dropping rows which do not match does not change the order of the
+    others in the result of the join.
+
+    Returns
+    -------
+    tuple of (left_keys, right_keys, left_rows, right_rows)
+        the keys of the kept rows and their locations in the original keys,
+        or None where all of the rows are kept
+    """
+    nleft, nright = len(left_keys[0]), len(right_keys[0])
+    if how == 'inner':
+        filter_left = nleft > nright
+    elif how in ['left', 'right']:
+        filter_left = how == 'right'
+    else:
+        return left_keys, right_keys, None, None
+
+    keys, other_keys = left_keys, right_keys
+    size, other_size = nleft, nright
+    if not filter_left:
+        keys, other_keys = other_keys, keys
+        size, other_size = other_size, size
+
+    if size < _SEMI_JOIN_MIN_SIZE or size < _SEMI_JOIN_RATIO * other_size:
+        return left_keys, right_keys, None, None
+
+    mask = None
+    for key, other_key in zip(keys, other_keys):
+        key_mask = algos._bloom_mask(key, other_key)
+        if key_mask is not None:
+            mask = key_mask if mask is None else mask & key_mask
+
+    if mask is None or mask.all():
+        return left_keys, right_keys, None, None
+
+    rows = np.flatnonzero(mask)
+    keys = [key.take(rows) for key in keys]
+    if filter_left:
+        return keys, right_keys, rows, None
+    return left_keys, keys, None, rows
+
+
+def _take_rows(indexer, rows):
+    """ map an indexer into the rows kept by _semi_join_filter """
+    if rows is None or len(rows) == 0:
+        # with no rows kept, the indexer is empty or all -1
+        return indexer
+    result = rows.take(indexer)
+    result[indexer == -1] = -1
+    return result
+
+
+def _get_monotonic_join_indexers(lk, rk, how='inner', sort=False):
+    """
+    Join the keys ``lk`` and ``rk`` with the ordered join routines, without
+    factorizing them, if both are already sorted.
+
+    This applies when both keys are monotonic increasing numeric or
+    datetimelike arrays of the same dtype without missing values, and at
+    least one of them is unique. The right and outer joins of unsorted
+    merges order the keys by their first appearance rather than by value,
+    so they are left to the hash join.
+
+    Returns
+    -------
+    tuple of (left_indexer, right_indexer), or None if the keys do not
+    qualify
+    """
+    if how in ['right', 'outer'] and not sort:
+        return None
+    if not (isinstance(lk, np.ndarray) and isinstance(rk, np.ndarray)):
+        return None
+    if lk.dtype != rk.dtype or lk.ndim != 1 or rk.ndim != 1:
+        return None
+
+    timelike = needs_i8_conversion(lk.dtype)
+    if timelike:
+        lk, rk = lk.view('i8'), rk.view('i8')
+    name = lk.dtype.name
+    if name not in ['int64', 'uint64', 'float64']:
+        return None
+
+    is_monotonic = getattr(libalgos, 'is_monotonic_' + name)
+    l_inc, _, l_unique = is_monotonic(lk, timelike)
+    if not l_inc:
+        return None
+    r_inc, _, r_unique = is_monotonic(rk, timelike)
+    if not r_inc:
+        return None
+
+    # the ordered join routines only handle many-to-one merges
+    if not (l_unique or r_unique):
+        return None
+
+    if how == 'right':
+        join_func = getattr(libjoin, 'left_join_indexer_' + name)
+        _, right_indexer, left_indexer = join_func(rk, lk)
+    else:
+        join_func = getattr(libjoin, '{how}_join_indexer_{name}'.format(
+            how=how, name=name))
+        _, left_indexer, right_indexer = join_func(lk, rk)
+    return left_indexer, right_indexer
+
+
+def _hash_partition(keys, masks, nparts):
+    """
+    Split the rows of each of ``keys`` in ``nparts`` partitions by the hash
+    of their key, on the thread pool. Equal keys of all the arrays fall in
+    the same partition.
+
+    Parameters
+    ----------
+    keys : list of int64 ndarray
+    masks : list of uint8 ndarray
+        the rows with a missing key, empty if there is none
+    nparts : int
+
+    Returns
+    -------
+    list of (rows, bounds), one per array of ``keys``; the rows of
+    partition ``p`` are ``rows[bounds[p]:bounds[p + 1]]``, in order
+    """
+    chunks = [(i, chunk) for i, key in enumerate(keys)
+              for chunk in split_range(len(key), nparts)]
+    counts = np.zeros((len(chunks), nparts), dtype=np.int64)
+
+    def count_chunk(j):
+        i, chunk = chunks[j]
+        libjoin.hash_partition_counts(keys[i], masks[i], nparts, chunk.start,
+                                      chunk.stop, counts[j])
+
+    run_threaded(count_chunk, len(chunks))
+
+    # each chunk writes its rows of a partition after those of the
+    # previous chunks
+    offsets = np.empty_like(counts)
+    result = []
+    for i, key in enumerate(keys):
+        loc = slice(i * nparts, (i + 1) * nparts)
+        chunk_counts = counts[loc]
+        bounds = np.zeros(nparts + 1, dtype=np.int64)
+        np.cumsum(chunk_counts.sum(axis=0), out=bounds[1:])
+        offsets[loc] = (bounds[:-1] + np.cumsum(chunk_counts, axis=0) -
+                        chunk_counts)
+        result.append((np.empty(len(key), dtype=np.int64), bounds))
+
+    def write_chunk(j):
+        i, chunk = chunks[j]
+        libjoin.hash_partition_rows(keys[i], masks[i], nparts, chunk.start,
+                                    chunk.stop, offsets[j], result[i][0])
+
+    run_threaded(write_chunk, len(chunks))
+    return result
+
+
+def _factorize_partitions(lk, rk, lmask, rmask, nparts, sort=False,
+                          lvalues=None, rvalues=None):
+    """
+    Factorize the keys ``lk`` and ``rk`` by hash partition, each partition
+    being factorized without the GIL on the thread pool.
+
+    The labels of each partition are local to it; ``mappings[p]`` maps them
+    to labels numbered as by ``_factorize_keys``, that is in the order of
+    the first appearance of the keys, left then right, or in the order of
+    ``lvalues`` / ``rvalues`` with sort, the missing key last.
+
+    Parameters
+    ----------
+    lk, rk : int64 ndarray
+    lmask, rmask : uint8 ndarray
+        the rows with a missing key, empty if there is none
+    nparts : int
+    sort : boolean, default False
+    lvalues, rvalues : ndarray, optional
+        the keys to sort the labels by, in the dtype of their values,
+        ``lk`` and ``rk`` if not given
+
+    Returns
+    -------
+    tuple of (parts, llab, rlab, mappings, count)
+        ``parts`` holds the (left rows, right rows) of each partition
+    """
+    nleft, nright = len(lk), len(rk)
+    (lrows, lbounds), (rrows, rbounds) = _hash_partition(
+        [lk, rk], [lmask, rmask], nparts)
+    parts = [(lrows[lbounds[p]:lbounds[p + 1]],
+              rrows[rbounds[p]:rbounds[p + 1]]) for p in range(nparts)]
+
+    llab = np.empty(nleft, dtype=np.int64)
+    rlab = np.empty(nright, dtype=np.int64)
+    first_rows = [np.empty(len(left) + len(right), dtype=np.int64)
+                  for left, right in parts]
+    counts = [0] * nparts
+
+    def factorize(p):
+        left, right = parts[p]
+        counts[p] = libjoin.factorize_partition(lk, lmask, rk, rmask, left,
+                                                right, llab, rlab,
+                                                first_rows[p])
+
+    run_threaded(factorize, nparts)
+
+    # number the labels in the order of the first row of their key, right
+    # rows coming after the left ones and the missing key last
+    firsts = np.concatenate([rows[:count]
+                             for rows, count in zip(first_rows, counts)])
+    mark = np.zeros(nleft + nright + 1, dtype=bool)
+    mark[firsts] = True
+    ids = _ensure_int64(np.cumsum(mark) - 1).take(firsts)
+    count = len(firsts)
+
+    if sort:
+        if lvalues is None:
+            lvalues, rvalues = lk, rk
+
+        rows = np.flatnonzero(mark[:-1])
+        is_left = rows < nleft
+        uniques = np.empty(len(rows), dtype=lvalues.dtype)
+        uniques[is_left] = lvalues.take(rows[is_left])
+        uniques[~is_left] = rvalues.take(rows[~is_left] - nleft)
+
+        order = uniques.argsort(kind='mergesort')
+        reorder = np.arange(count, dtype=np.int64)
+        reorder[order] = np.arange(len(order), dtype=np.int64)
+        ids = reorder.take(ids)
+
+    mappings = np.split(ids, np.cumsum(counts)[:-1])
+    return parts, llab, rlab, mappings, count
+
+
+def _hash_factorize_input(lk, rk):
+    """
+    The keys ``lk`` and ``rk`` coerced as by ``_factorize_keys``, with the
+    rows missing a key, if they are factorized by a 64 bit hash table.
+
+    Returns
+    -------
+    tuple of (lk, rk, lmask, rmask), or None if the keys do not qualify
+    """
+    if is_datetime64tz_dtype(lk) and is_datetime64tz_dtype(rk):
+        lk = lk.values
+        rk = rk.values
+
+    if (is_categorical_dtype(lk) and
+            is_categorical_dtype(rk) and
+            lk.is_dtype_equal(rk)):
+        lk = _ensure_int64(lk.codes)
+        rk = _ensure_int64(rk.codes)
+    elif (is_unsigned_integer_dtype(lk) and
+            is_unsigned_integer_dtype(rk)):
+        lk = _ensure_uint64(com._values_from_object(lk))
+        rk = _ensure_uint64(com._values_from_object(rk))
+        empty = np.empty(0, dtype=np.uint8)
+        return lk, rk, empty, empty
+    elif is_int_or_datetime_dtype(lk) and is_int_or_datetime_dtype(rk):
+        lk = _ensure_int64(com._values_from_object(lk))
+        rk = _ensure_int64(com._values_from_object(rk))
+    elif is_float_dtype(lk) and is_float_dtype(rk):
+        lk = _ensure_float64(com._values_from_object(lk)) + 0.
+        rk = _ensure_float64(com._values_from_object(rk)) + 0.
+        return (lk, rk, np.isnan(lk).view(np.uint8),
+                np.isnan(rk).view(np.uint8))
+    else:
+        return None
+
+    return lk, rk, (lk == iNaT).view(np.uint8), (rk == iNaT).view(np.uint8)
+
+
+def _parallel_factorize_keys(lk, rk, sort=True, nparts=1):
+    """
+    ``_factorize_keys`` by hash partition on the thread pool, for keys
+    factorized by a 64 bit hash table; the labels are the same.
+    """
+    keys = _hash_factorize_input(lk, rk)
+    if keys is None:
+        return _factorize_keys(lk, rk, sort=sort)
+
+    lvalues, rvalues, lmask, rmask = keys
+    parts, llab, rlab, mappings, count = _factorize_partitions(
+        lvalues.view('i8'), rvalues.view('i8'), lmask, rmask, nparts,
+        sort=sort, lvalues=lvalues, rvalues=rvalues)
+
+    def relabel(p):
+        left, right = parts[p]
+        libjoin.relabel_partition(left, llab, mappings[p])
+        libjoin.relabel_partition(right, rlab, mappings[p])
+
+    run_threaded(relabel, nparts)
+    return llab, rlab, count
+
+
+def _parallel_hash_join(lkey, rkey, how='inner', sort=False, nparts=1):
+    """
+    Join the keys ``lkey`` and ``rkey`` by hash partition on the thread
+    pool. Both sides are split by the hash of their keys, and each
+    partition is factorized and joined without the GIL; only the prefix
+    sums locating the groups of the partitions in the result are computed
+    serially. The indexers are the same as those of the
+    ``_join_functions`` on the factorized keys.
+
+    Parameters
+    ----------
+    lkey, rkey : int64 ndarray
+        the combined keys of the left / right rows
+    how : {'inner', 'left', 'right', 'outer'}
+    sort : boolean
+        whether to order the result by key rather than by first appearance,
+        or by the rows of the left frame for a left join
+    nparts : int
+        the number of partitions
+
+    Returns
+    -------
+    tuple of (left_indexer, right_indexer)
+    """
+    empty = np.empty(0, dtype=np.uint8)
+    parts, llab, rlab, mappings, count = _factorize_partitions(
+        lkey, rkey, empty, empty, nparts, sort=sort)
+    nleft = len(lkey)
+
+    if how == 'right':
+        # a left join of the right keys on the left ones, ordered by key,
+        # as _right_outer_join
+        parts = [(right, left) for left, right in parts]
+        llab, rlab = rlab, llab
+        nleft = len(rkey)
+
+    keep_left = how in ['left', 'right', 'outer']
+    keep_right = how == 'outer'
+    by_row = how == 'left' and not sort
+
+    if by_row:
+        sizes = np.empty(nleft, dtype=np.int64)
+    else:
+        sizes = np.empty(count, dtype=np.int64)
+    groups = [None] * nparts
+
+    def count_partition(p):
+        left, right = parts[p]
+        ngroups = len(mappings[p])
+        lc = np.empty(ngroups, dtype=np.int64)
+        rc = np.empty(ngroups, dtype=np.int64)
+        left_sorter = np.empty(len(left), dtype=np.int64)
+        right_sorter = np.empty(len(right), dtype=np.int64)
+        left_starts = np.empty(ngroups, dtype=np.int64)
+        right_starts = np.empty(ngroups, dtype=np.int64)
+        libjoin.join_partition_sizes(left, right, llab, rlab, lc, rc,
+                                     left_sorter, right_sorter,
+                                     left_starts, right_starts)
+        groups[p] = (lc, rc, left_sorter, right_sorter, left_starts,
+                     right_starts)
+
+        if by_row:
+            sizes[left] = np.maximum(rc, 1).take(llab.take(left))
+        else:
+            group_sizes = lc * rc
+            if keep_left:
+                group_sizes = np.where(rc > 0, group_sizes, lc)
+            if keep_right:
+                group_sizes = np.where(lc > 0, group_sizes, rc)
+            sizes[mappings[p]] = group_sizes
+
+    run_threaded(count_partition, nparts)
+
+    ends = np.cumsum(sizes)
+    total = ends[-1] if len(ends) else 0
+    positions = ends - sizes
+
+    left_indexer = np.empty(total, dtype=np.int64)
+    right_indexer = np.empty(total, dtype=np.int64)
+
+    def fill_partition(p):
+        lc, rc, left_sorter, right_sorter, left_starts, right_starts = \
+            groups[p]
+        if by_row:
+            libjoin.fill_partition_by_left_row(parts[p][0], llab, rc,
+                                               right_sorter, right_starts,
+                                               positions, left_indexer,
+                                               right_indexer)
+        else:
+            libjoin.fill_partition_by_label(lc, rc, left_sorter,
+                                            right_sorter, left_starts,
+                                            right_starts,
+                                            positions.take(mappings[p]),
+                                            left_indexer, right_indexer,
+                                            keep_left, keep_right)
+
+    run_threaded(fill_partition, nparts)
+
+    if how == 'right':
+        return right_indexer, left_indexer
+    return left_indexer, right_indexer
+
 
 def _factorize_keys(lk, rk, sort=True):
     if is_datetime64tz_dtype(lk) and is_datetime64tz_dtype(rk):
@@ -1540,10 +2001,28 @@ def _factorize_keys(lk, rk, sort=True):
         klass = libhashtable.Int64Factorizer
         lk = _ensure_int64(lk.codes)
         rk = _ensure_int64(rk.codes)
+    elif (is_unsigned_integer_dtype(lk) and
+            is_unsigned_integer_dtype(rk)):
+        klass = libhashtable.UInt64Factorizer
+        lk = _ensure_uint64(com._values_from_object(lk))
+        rk = _ensure_uint64(com._values_from_object(rk))
     elif is_int_or_datetime_dtype(lk) and is_int_or_datetime_dtype(rk):
         klass = libhashtable.Int64Factorizer
         lk = _ensure_int64(com._values_from_object(lk))
         rk = _ensure_int64(com._values_from_object(rk))
+    elif is_float_dtype(lk) and is_float_dtype(rk):
+        klass = libhashtable.Float64Factorizer
+
+        # -0.0 and 0.0 are equal but do not hash alike, adding 0.0
+        # turns -0.0 into 0.0
+        lk = _ensure_float64(com._values_from_object(lk)) + 0.
+        rk = _ensure_float64(com._values_from_object(rk)) + 0.
+    elif (is_object_dtype(lk) and is_object_dtype(rk) and
+            lib.infer_dtype(lk) == 'string' and
+            lib.infer_dtype(rk) == 'string'):
+        klass = libhashtable.StringFactorizer
+        lk = _ensure_object(lk)
+        rk = _ensure_object(rk)
     else:
         klass = libhashtable.Factorizer
         lk = _ensure_object(lk)
@@ -1551,8 +2030,18 @@ def _factorize_keys(lk, rk, sort=True):
 
     rizer = klass(max(len(lk), len(rk)))
 
-    llab = rizer.factorize(lk)
-    rlab = rizer.factorize(rk)
+    try:
+        llab = rizer.factorize(lk)
+        rlab = rizer.factorize(rk)
+    except ValueError:
+        if klass is not libhashtable.StringFactorizer:
+            raise
+
+        # strings with an embedded NUL or which cannot be encoded to UTF-8
+        # are only told apart as objects
+        rizer = libhashtable.Factorizer(max(len(lk), len(rk)))
+        llab = rizer.factorize(lk)
+        rlab = rizer.factorize(rk)
 
     count = rizer.get_count()
 
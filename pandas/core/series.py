@@ -49,7 +49,8 @@ from pandas.core.common import (is_bool_indexer,
                                 _any_none)
 from pandas.core.index import (Index, MultiIndex, InvalidIndexError,
                                Float64Index, _ensure_index)
-from pandas.core.indexing import check_bool_indexer, maybe_convert_indices
+from pandas.core.indexing import (check_bool_indexer, maybe_convert_indices,
+                                  fast_scalar_lookup)
 from pandas.core import generic, base
 from pandas.core.internals import SingleBlockManager
 from pandas.core.categorical import Categorical, CategoricalAccessor
@@ -658,6 +659,9 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
 
     def __getitem__(self, key):
         key = com._apply_if_callable(key, self)
+        found, value = fast_scalar_lookup(self, key)
+        if found:
+            return value
         try:
             result = self.index.get_value(self, key)
 
@@ -836,6 +840,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             self._maybe_update_cacher()
 
     def _set_with_engine(self, key, value):
+        self._data._maybe_copy_on_write()
         values = self._values
         try:
             self.index._engine.set_value(values, key, value)
@@ -1001,6 +1006,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._data._maybe_copy_on_write()
         try:
             if takeable:
                 self._values[label] = value
@@ -1505,6 +1511,80 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             # scalar
             return result
 
+    def approx_nunique(self, dropna=True, precision=14):
+        """
+        Return the approximate number of distinct values, estimated with a
+        HyperLogLog sketch of the hashed values.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include NaN in the count.
+        precision : int, default 14
+            log2 of the number of registers of the sketch, between 4 and 18.
+            The relative standard error of the count is about
+            ``1.04 / sqrt(2 ** precision)``, 0.8% by default.
+
+        Returns
+        -------
+        nunique : int
+
+        See Also
+        --------
+        Series.nunique : exact number of distinct values
+        pandas.api.sketches.HyperLogLog : mergeable sketch of distinct values
+
+        Examples
+        --------
+        >>> s = pd.Series(np.arange(100000) % 1000)
+        >>> s.approx_nunique()
+        1000
+        """
+        from pandas.core.sketches import HyperLogLog
+        return HyperLogLog(precision).update(self, dropna=dropna).count()
+
+    def approx_quantile(self, q=0.5, compression=100):
+        """
+        Return the approximate value at the given quantile, estimated with a
+        t-digest of the values.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+        compression : float, default 100
+            Bounds the number of centroids of the digest. Larger values are
+            more accurate, most of all in the tails of the distribution.
+
+        Returns
+        -------
+        quantile : float or Series
+            if ``q`` is an array, a Series will be returned where the
+            index is ``q`` and the values are the quantiles.
+
+        See Also
+        --------
+        Series.quantile : exact quantiles
+        pandas.api.sketches.TDigest : mergeable sketch of quantiles
+        """
+        from pandas.core.sketches import TDigest
+
+        self._check_percentile(q)
+
+        result = TDigest(compression).update(self).quantile(q)
+
+        if is_list_like(q):
+            return self._constructor(result,
+                                     index=Float64Index(q),
+                                     name=self.name)
+        else:
+            # scalar
+            return result
+
     def corr(self, other, method='pearson', min_periods=None):
         """
         Compute correlation with `other` Series, excluding missing values
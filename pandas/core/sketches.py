@@ -0,0 +1,252 @@
+"""
+Mergeable sketches for approximate distinct counts and quantiles
+"""
+import numpy as np
+
+from pandas._libs import sketches as libsketches
+from pandas.core.dtypes.common import (
+    is_categorical_dtype,
+    is_datetime64tz_dtype,
+    is_float_dtype,
+    is_numeric_dtype,
+    is_bool_dtype,
+    is_datetime_or_timedelta_dtype,
+    _ensure_float64)
+from pandas.core.dtypes.missing import notna
+from pandas.core.util.hashing import hash_array
+
+
+def _hash_values(values, dropna=True):
+    """
+    Hash the values of a 1d array-like to uint64 with ``hash_array``.
+    Equal values hash equally across calls, so that sketches of separate
+    chunks of data may be merged.
+
+    Parameters
+    ----------
+    values : array-like
+    dropna : boolean, default True
+        Don't hash the missing values
+
+    Returns
+    -------
+    uint64 ndarray
+    """
+    values = getattr(values, '_values', values)
+    mask = notna(values) if dropna else None
+    if is_datetime64tz_dtype(values):
+        values = values.asi8
+    elif not is_categorical_dtype(values):
+        values = np.asarray(values)
+
+    if mask is not None:
+        values = values[mask]
+    if is_float_dtype(values):
+        # -0.0 and 0.0 are the same value
+        values = values + 0.
+
+    return hash_array(values)
+
+
+class HyperLogLog(object):
+    """
+    HyperLogLog sketch of the number of distinct values.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    precision : int, default 14
+        log2 of the number of registers, between 4 and 18. The relative
+        standard error of the count is about ``1.04 / sqrt(2 ** precision)``
+        and the sketch takes ``2 ** precision`` bytes.
+
+    Examples
+    --------
+    Sketches of chunks of data may be merged to count their union
+
+    >>> from pandas.api.sketches import HyperLogLog
+    >>> a = HyperLogLog().update(pd.Series([1, 2, 3]))
+    >>> b = HyperLogLog().update(pd.Series([3, 4]))
+    >>> a.merge(b).count()
+    4
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = int(precision)
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    def __repr__(self):
+        return '{name}(precision={precision})'.format(
+            name=self.__class__.__name__, precision=self.precision)
+
+    def update(self, values, dropna=True):
+        """
+        Add the values of a 1d array-like to the sketch
+
+        Parameters
+        ----------
+        values : array-like
+        dropna : boolean, default True
+            Don't count the missing values
+
+        Returns
+        -------
+        self
+        """
+        libsketches.hll_update(self.registers, _hash_values(values, dropna),
+                               self.precision)
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch of the same precision into this one
+
+        Parameters
+        ----------
+        other : HyperLogLog
+
+        Returns
+        -------
+        self
+        """
+        if not isinstance(other, HyperLogLog):
+            raise TypeError("can only merge a HyperLogLog")
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches of different precisions")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """
+        Return the estimated number of distinct values
+
+        Returns
+        -------
+        int
+        """
+        estimate = libsketches.hll_estimate(self.registers[None, :])[0]
+        return int(round(estimate))
+
+
+class TDigest(object):
+    """
+    t-digest sketch of the distribution of numeric values.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    compression : float, default 100
+        Bounds the number of centroids of the digest. Larger values are
+        more accurate, most of all in the tails of the distribution.
+
+    Examples
+    --------
+    Sketches of chunks of data may be merged to estimate the quantiles of
+    their union
+
+    >>> from pandas.api.sketches import TDigest
+    >>> a = TDigest().update(pd.Series(np.arange(500)))
+    >>> b = TDigest().update(pd.Series(np.arange(500, 1001)))
+    >>> round(a.merge(b).quantile(0.5))
+    500
+    """
+
+    # the number of values sorted at once by update
+    _chunksize = 1 << 16
+
+    def __init__(self, compression=100):
+        if compression < 20:
+            raise ValueError("compression must be at least 20")
+        self.compression = float(compression)
+        self.means = np.array([], dtype=np.float64)
+        self.weights = np.array([], dtype=np.float64)
+        self.min = np.inf
+        self.max = -np.inf
+
+    def __repr__(self):
+        return '{name}(compression={compression})'.format(
+            name=self.__class__.__name__, compression=self.compression)
+
+    def update(self, values):
+        """
+        Add the non-missing values of a numeric 1d array-like to the digest
+
+        Parameters
+        ----------
+        values : array-like
+
+        Returns
+        -------
+        self
+        """
+        values = np.asarray(getattr(values, '_values', values))
+        if (is_bool_dtype(values) or is_datetime_or_timedelta_dtype(values) or
+                not is_numeric_dtype(values)):
+            raise TypeError("TDigest requires numeric values")
+
+        values = _ensure_float64(values)
+        values = values[~np.isnan(values)]
+        for start in range(0, len(values), self._chunksize):
+            chunk = np.sort(values[start:start + self._chunksize])
+            self._merge_centroids(chunk, np.ones(len(chunk)))
+        return self
+
+    def merge(self, other):
+        """
+        Merge the centroids of another digest into this one
+
+        Parameters
+        ----------
+        other : TDigest
+
+        Returns
+        -------
+        self
+        """
+        if not isinstance(other, TDigest):
+            raise TypeError("can only merge a TDigest")
+        self._merge_centroids(other.means, other.weights)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _merge_centroids(self, means, weights):
+        if not len(means):
+            return
+        self.min = min(self.min, means[0])
+        self.max = max(self.max, means[-1])
+        self.means, self.weights = libsketches.tdigest_merge(
+            self.means, self.weights, means, weights, self.compression)
+
+    def quantile(self, q=0.5):
+        """
+        Return the estimated value at the given quantile
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+
+        Returns
+        -------
+        float or ndarray of floats, NaN if the digest is empty
+        """
+        qs = np.asarray(q, dtype=np.float64)
+        if not len(self.means):
+            result = np.full(qs.shape, np.nan)
+        else:
+            # each centroid sits at the middle of its weight
+            cumulative = np.cumsum(self.weights)
+            total = cumulative[-1]
+            positions = np.concatenate([[0], cumulative - self.weights / 2,
+                                        [total]])
+            centers = np.concatenate([[self.min], self.means, [self.max]])
+            result = np.interp(qs * total, positions, centers)
+
+        if qs.ndim == 0:
+            return float(result)
+        return result
@@ -361,6 +361,35 @@ def compress_group_index(group_index, sort=True):
     return comp_ids, obs_group_ids
 
 
+def hash_group_index(labels, shape, sort=True):
+    """
+    Factorize the rows of ``labels`` straight to dense group ids, hashing
+    the tuple of labels of each row in a single pass instead of building
+    its offset into the cartesian product of all possible labels first.
+
+    Returns the same (comp_ids, obs_group_ids) as ``compress_group_index``
+    of the group index of ``labels`` (with ``xnull``), nulls get a -1 id.
+    """
+    n = len(labels[0])
+    size_hint = min(n, hashtable._SIZE_HINT_LIMIT)
+    table = hashtable.MultiKeyHashTable(size_hint)
+
+    values = np.empty((n, len(labels)), dtype=np.int64)
+    for i, lab in enumerate(labels):
+        values[:, i] = lab
+
+    comp_ids, first = table.get_labels_groupby(values)
+
+    # the offsets of the observed groups only
+    obs_group_ids = get_group_index([lab.take(first) for lab in labels],
+                                    shape, sort=True, xnull=True)
+
+    if sort and len(obs_group_ids) > 0:
+        obs_group_ids, comp_ids = _reorder_by_uniques(obs_group_ids, comp_ids)
+
+    return comp_ids, obs_group_ids
+
+
 def _reorder_by_uniques(uniques, labels):
     # sorter is index where elements ought to go
     sorter = uniques.argsort()
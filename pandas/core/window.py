@@ -33,6 +33,7 @@ from pandas.core.dtypes.common import (
 from pandas.core.base import (PandasObject, SelectionMixin,
                               GroupByMixin)
 from pandas.core.common import _asarray_tuplesafe, _count_not_none
+from pandas.core.parallel import get_num_threads, run_threaded, split_range
 import pandas._libs.window as _window
 
 from pandas import compat
@@ -723,6 +724,7 @@ class _Rolling(_Window):
 
         blocks, obj, index = self._create_blocks()
         index, indexi = self._get_index(index=index)
+        cfunc2d = _get_cfunc_2d(func, self.axis)
         results = []
         for b in blocks:
             try:
@@ -735,6 +737,25 @@ class _Rolling(_Window):
                 results.append(values.copy())
                 continue
 
+            # roll all of the columns of the block in a single call
+            if values.ndim > 1 and cfunc2d is not None:
+                if center:
+                    offset = _offset(window, center)
+                    additional_nans = np.empty((offset, values.shape[1]))
+                    additional_nans.fill(np.NaN)
+                    values = np.concatenate((values, additional_nans))
+
+                minp = check_minp(self.min_periods, window)
+                with np.errstate(all='ignore'):
+                    result = _apply_2d(cfunc2d, values, window, minp, indexi,
+                                       self.closed, **kwargs)
+
+                if center:
+                    result = self._center_window(result, window)
+
+                results.append(result)
+                continue
+
             # if we have a string function name, wrap it
             if isinstance(func, compat.string_types):
                 cfunc = getattr(_window, func, None)
@@ -1246,6 +1267,51 @@ class Rolling(_Rolling_and_Expanding):
         return super(Rolling, self).corr(other=other, pairwise=pairwise,
                                          **kwargs)
 
+    def online(self):
+        """
+        Return an online rolling window, seeded with the rows of the
+        calling object, that can be updated with new rows.
+
+        Each update costs O(rows) and the results are the same as
+        recomputing the rolling statistics over the whole history.
+        Only fixed, non-centered windows are supported.
+
+        .. versionadded:: 0.23.0
+
+        Returns
+        -------
+        OnlineRolling
+
+        Examples
+        --------
+        >>> s = pd.Series([0., 1, 2, 3])
+        >>> online = s.rolling(2).online()
+        >>> online.sum()
+        0    NaN
+        1    1.0
+        2    3.0
+        3    5.0
+        dtype: float64
+        >>> online.update(pd.Series([4., 5], index=[4, 5])).sum()
+        4    7.0
+        5    9.0
+        dtype: float64
+        """
+        if self.is_freq_type:
+            raise NotImplementedError("online is not implemented for "
+                                      "offset based windows")
+        if self.center:
+            raise NotImplementedError("online is not implemented for "
+                                      "centered windows")
+        if self.axis != 0 or self.on is not None:
+            raise NotImplementedError("online is only implemented for "
+                                      "windows over the index")
+
+        obj = self._selected_obj
+        minp = _use_window(self.min_periods, self.window)
+        state = _window.RollingState(_num_columns(obj), self.window, minp)
+        return OnlineRolling(self, state)
+
 
 class RollingGroupby(_GroupByMixin, Rolling):
     """
@@ -1690,6 +1756,7 @@ class EWM(_Rolling):
 
         """
         blocks, obj, index = self._create_blocks()
+        cfunc2d = _get_cfunc_2d(func, self.axis)
         results = []
         for b in blocks:
             try:
@@ -1702,6 +1769,14 @@ class EWM(_Rolling):
                 results.append(values.copy())
                 continue
 
+            # weight all of the columns of the block in a single call
+            if values.ndim > 1 and cfunc2d is not None:
+                results.append(_apply_2d(cfunc2d, values, self.com,
+                                         int(self.adjust),
+                                         int(self.ignore_na),
+                                         int(self.min_periods)))
+                continue
+
             # if we have a string function name, wrap it
             if isinstance(func, compat.string_types):
                 cfunc = getattr(_window, func, None)
@@ -1803,6 +1878,142 @@ class EWM(_Rolling):
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
                                    _get_corr, pairwise=bool(pairwise))
 
+    def online(self):
+        """
+        Return an online exponentially weighted window, seeded with the
+        rows of the calling object, that can be updated with new rows.
+
+        Each update costs O(rows) and the results are the same as
+        recomputing the exponentially weighted statistics over the whole
+        history.
+
+        .. versionadded:: 0.23.0
+
+        Returns
+        -------
+        OnlineEWM
+
+        Examples
+        --------
+        >>> s = pd.Series([0., 1, 2])
+        >>> online = s.ewm(com=1).online()
+        >>> online.update(pd.Series([3., 4], index=[3, 4])).mean()
+        3    2.266667
+        4    3.161290
+        dtype: float64
+        """
+        if self.axis != 0:
+            raise NotImplementedError("online is only implemented for "
+                                      "windows over the index")
+
+        obj = self._selected_obj
+        state = _window.EWMState(_num_columns(obj), self.com,
+                                 int(self.adjust), int(self.ignore_na),
+                                 int(self.min_periods))
+        return OnlineEWM(self, state)
+
+
+class _OnlineWindow(object):
+    """
+    Base class of the online windows, which carry the state of a window
+    calculation forward so that it can be updated with new rows.
+
+    The statistics are computed for the rows of the last update.
+    """
+
+    def __init__(self, window, state):
+        self._window = window
+        self._state = state
+        self._obj = None
+        self.update(window._selected_obj)
+
+    def update(self, obj):
+        """
+        Add new rows to the window.
+
+        Parameters
+        ----------
+        obj : Series or DataFrame
+            the new rows, of the same type (and with the same columns) as
+            the object the window was created from
+
+        Returns
+        -------
+        self
+        """
+        template = self._window._selected_obj
+        if obj.ndim != template.ndim:
+            raise TypeError("the new rows must be a {klass}".format(
+                klass=type(template).__name__))
+        if obj.ndim == 2 and not obj.columns.equals(template.columns):
+            raise ValueError("the new rows must have the same columns as "
+                             "the window")
+
+        values = self._window._prep_values(obj.values)
+        self._state.update(values.reshape(len(values), -1))
+        self._obj = obj
+        return self
+
+    def _wrap_result(self, result):
+        """ wrap a 2d result for the rows of the last update """
+        from pandas import Series, DataFrame
+
+        obj = self._obj
+        if obj.ndim == 1:
+            return Series(result[:, 0], index=obj.index, name=obj.name)
+        return DataFrame(result, index=obj.index, columns=obj.columns)
+
+
+class OnlineRolling(_OnlineWindow):
+    """
+    Rolling sum, mean, variance and standard deviation over a fixed
+    window, which are updated with new rows. Returned by
+    :meth:`Rolling.online`.
+
+    .. versionadded:: 0.23.0
+    """
+
+    def sum(self):
+        """rolling sum of the rows of the last update"""
+        return self._wrap_result(self._state.sum())
+
+    def mean(self):
+        """rolling mean of the rows of the last update"""
+        return self._wrap_result(self._state.mean())
+
+    def var(self, ddof=1):
+        """rolling variance of the rows of the last update"""
+        return self._wrap_result(self._state.var(ddof))
+
+    def std(self, ddof=1):
+        """rolling standard deviation of the rows of the last update"""
+        return _zsqrt(self.var(ddof=ddof))
+
+
+class OnlineEWM(_OnlineWindow):
+    """
+    Exponentially weighted moving average, variance and standard
+    deviation, which are updated with new rows. Returned by
+    :meth:`EWM.online`.
+
+    .. versionadded:: 0.23.0
+    """
+
+    def mean(self):
+        """exponential weighted moving average of the rows of the last
+        update"""
+        return self._wrap_result(self._state.mean())
+
+    def var(self, bias=False):
+        """exponential weighted moving variance of the rows of the last
+        update"""
+        return self._wrap_result(self._state.var(int(bias)))
+
+    def std(self, bias=False):
+        """exponential weighted moving stddev of the rows of the last
+        update"""
+        return _zsqrt(self.var(bias=bias))
+
 # Helper Funcs
 
 
@@ -1937,6 +2148,35 @@ def _get_center_of_mass(com, span, halflife, alpha):
     return float(com)
 
 
+def _get_cfunc_2d(func, axis):
+    """
+    return the cython kernel rolling all of the columns of a 2d block
+    at once for the function name ``func``, or None if there is none
+    """
+    if not isinstance(func, compat.string_types) or axis != 0:
+        return None
+    return getattr(_window, '{func}_2d'.format(func=func), None)
+
+
+def _apply_2d(cfunc, values, *args, **kwargs):
+    """
+    call the 2d cython kernel ``cfunc`` on ``values``, splitting the
+    columns of large blocks across threads
+    """
+    nthreads = min(get_num_threads(values.size), values.shape[1])
+    if nthreads <= 1:
+        return cfunc(values, *args, **kwargs)
+
+    result = np.empty(values.shape, dtype=values.dtype, order='F')
+    chunks = split_range(values.shape[1], nthreads)
+
+    def f(i):
+        result[:, chunks[i]] = cfunc(values[:, chunks[i]], *args, **kwargs)
+
+    run_threaded(f, nthreads)
+    return result
+
+
 def _offset(window, center):
     if not is_integer(window):
         window = len(window)
@@ -1964,6 +2204,10 @@ def _use_window(minp, window):
         return minp
 
 
+def _num_columns(obj):
+    return 1 if obj.ndim == 1 else len(obj.columns)
+
+
 def _zsqrt(x):
     with np.errstate(all='ignore'):
         result = np.sqrt(x)
@@ -5,6 +5,7 @@ from warnings import catch_warnings
 import pytest
 import pandas as pd
 from pandas import api
+from pandas.api import sketches  # noqa
 from pandas.util import testing as tm
 
 
@@ -123,7 +124,7 @@ class TestPDApi(Base):
 
 class TestApi(Base):
 
-    allowed = ['types']
+    allowed = ['sketches', 'types']
 
     def test_api(self):
 
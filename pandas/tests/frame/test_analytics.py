@@ -2199,6 +2199,32 @@ class TestNLargestNSmallest(object):
         expected = df.sort_values(order, ascending=False).head(n)
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('method', ['nsmallest', 'nlargest'])
+    @pytest.mark.parametrize('keep', ['first', 'last'])
+    def test_n_multiple_columns_ties(self, method, keep):
+        rs = np.random.RandomState(0)
+        a = rs.randint(0, 5, 200).astype('float64')
+        a[::17] = np.nan
+        df = pd.DataFrame({'a': a,
+                           'b': rs.choice([-1.5, 0., 2., np.nan], 200),
+                           'c': rs.randint(0, 2, 200).astype('uint8'),
+                           'd': pd.date_range('2000', periods=4).take(
+                               rs.randint(0, 4, 200))},
+                          index=rs.randint(0, 50, 200))
+        order = ['a', 'b', 'c', 'd']
+
+        ascending = method == 'nsmallest'
+        for n in [1, 7, 40, 250]:
+            result = getattr(df, method)(n, order, keep=keep)
+
+            # sort_values keeps ties in order and puts missing values last
+            expected = df.dropna(subset=['a'])
+            if keep == 'last':
+                expected = expected.iloc[::-1]
+            expected = expected.sort_values(order,
+                                            ascending=ascending).head(n)
+            tm.assert_frame_equal(result, expected)
+
     def test_series_broadcasting(self):
         # smoke test for numpy warnings
         # GH 16378, GH 16306
@@ -67,6 +67,104 @@ class TestDataFrameBlockInternals(TestData):
         for letter in range(ord('A'), ord('Z')):
             self.frame[chr(letter)] = chr(letter)
 
+    def test_consolidate_insert_budget(self):
+        df = DataFrame(index=range(3))
+        max_blocks = 0
+        for i in range(500):
+            df[i] = float(i)
+            nblocks = len(df._data.blocks)
+            assert nblocks <= max(100, (i + 1) // 2) + 1
+            max_blocks = max(max_blocks, nblocks)
+
+        # the block budget grows with the number of columns
+        assert max_blocks > 101
+        assert len(df._data.blocks) > 1
+
+        # reductions need 2-D values and consolidate
+        result = df.sum()
+        assert df._data.is_consolidated()
+        expected = Series(np.arange(500) * 3.)
+        assert_series_equal(result, expected)
+
+    def test_consolidate_insert_options(self):
+        with option_context('mode.consolidate_max_blocks', 1000):
+            df = DataFrame(index=range(3))
+            for i in range(150):
+                df[i] = float(i)
+            assert len(df._data.blocks) == 150
+
+        with option_context('mode.consolidate_max_bytes', 0):
+            df = DataFrame(index=range(3))
+            for i in range(5):
+                df[i] = float(i)
+            assert len(df._data.blocks) == 1
+
+        # the fragmented bytes are counted per dtype across inserts
+        with option_context('mode.consolidate_max_bytes', 100):
+            df = DataFrame(index=range(3))
+            for i in range(4):
+                df[i] = float(i) if i % 2 == 0 else i
+            assert len(df._data.blocks) == 4
+
+            df[4] = 4.
+            assert len(df._data.blocks) == 2
+            del df[4]
+            df[4] = 4
+            assert len(df._data.blocks) == 3
+
+    def test_copy_on_write(self):
+        df = DataFrame({'a': [1., 2., 3.], 'b': [4., 5., 6.]})
+        expected = df.copy()
+
+        with option_context('mode.copy_on_write', True):
+            result = df.copy()
+            assert np.shares_memory(result['a'].values, df['a'].values)
+
+            result.loc[0, 'a'] = 10.
+            result['b'].fillna(0, inplace=True)
+            result.at[1, 'b'] = 20.
+            assert_frame_equal(df, expected)
+            assert result.loc[0, 'a'] == 10.
+            assert result.loc[1, 'b'] == 20.
+
+            # writing to the original leaves the copy alone
+            other = df.rename(columns=str.upper)
+            df.iloc[2, 0] = 30.
+            assert other.loc[2, 'A'] == 3.
+
+            s = other['B'].copy()
+            s[0] = 40.
+            assert other.loc[0, 'B'] == 4.
+            assert df.loc[0, 'b'] == 4.
+
+    def test_copy_on_write_inplace_methods(self):
+        df = DataFrame({'a': [1., np.nan, 3.], 'b': ['x', 'y', np.nan]})
+        expected = df.copy()
+
+        with option_context('mode.copy_on_write', True):
+            result = df.copy()
+            result.fillna(method='ffill', inplace=True)
+            assert_frame_equal(df, expected)
+            assert result.loc[1, 'a'] == 1.
+            assert result.loc[2, 'b'] == 'y'
+
+            floats = df[['a']]
+            result = floats.copy()
+            result.interpolate(method='pad', inplace=True)
+            assert_frame_equal(floats, expected[['a']])
+            assert result.loc[1, 'a'] == 1.
+
+            result = df.copy()
+            result.replace(r'^x$', 'z', regex=True, inplace=True)
+            assert_frame_equal(df, expected)
+            assert result.loc[0, 'b'] == 'z'
+
+            s = Series(pd.Categorical(['u', 'v', 'u']))
+            result = s.copy()
+            result.where(result != 'v', 'u', inplace=True)
+            assert_series_equal(s, Series(pd.Categorical(['u', 'v', 'u'])))
+            assert result[1] == 'u'
+
     def test_values_consolidate(self):
         self.frame['E'] = 7.
         assert not self.frame._data.is_consolidated()
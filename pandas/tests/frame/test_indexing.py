@@ -1691,6 +1691,71 @@ class TestDataFrameIndexing(TestData):
         with tm.assert_raises_regex(ValueError, 'same size'):
             self.frame.lookup(['a', 'b', 'c'], ['a'])
 
+    def test_lookup_blocks(self):
+        df = DataFrame({'a': [1, 2, 3],
+                        'b': pd.date_range('2017', periods=3),
+                        'c': pd.date_range('2017', periods=3, tz='CET'),
+                        'd': pd.Categorical(['x', 'y', 'x']),
+                        'e': [1.5, 2.5, 3.5]}, index=list('pqr'))
+        rows = ['r', 'p', 'q', 'r', 'p']
+        cols = ['b', 'c', 'd', 'a', 'b']
+        result = df.lookup(rows, cols)
+        expected = np.array([df.at[r, c] for r, c in zip(rows, cols)],
+                            dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+        assert result[1].tz is not None
+
+        result = df.lookup(['q', 'p', 'q'], ['a', 'e', 'e'])
+        tm.assert_numpy_array_equal(result, np.array([2., 1.5, 2.5]))
+
+        result = df.lookup(['r', 'p'], ['b', 'b'])
+        tm.assert_numpy_array_equal(result, df['b'].values[[2, 0]])
+
+    def test_set_lookup(self):
+        df = DataFrame({'a': [1, 2, 3],
+                        'b': [1.5, 2.5, 3.5],
+                        'c': ['x', 'y', 'z'],
+                        'd': pd.date_range('2017', periods=3)},
+                       index=list('pqr'))
+        expected = df.copy()
+        for r, c, v in [('r', 'b', 10.), ('p', 'a', 4), ('q', 'c', 'w'),
+                        ('p', 'd', pd.Timestamp('2018'))]:
+            expected.at[r, c] = v
+
+        result = df.copy()
+        result.set_lookup(['r', 'p', 'q', 'p'], ['b', 'a', 'c', 'd'],
+                          [10., 4, 'w', pd.Timestamp('2018')])
+        tm.assert_frame_equal(result, expected)
+
+        # scalar value
+        result = df.copy()
+        result.set_lookup(['p', 'r'], ['b', 'b'], 0.)
+        assert result['b'].tolist() == [0., 2.5, 0.]
+
+        # columns which cannot hold the values are upcast
+        result = df.copy()
+        result.set_lookup(['q', 'r'], ['a', 'b'], [np.nan, 0.5])
+        assert result['a'].dtype == np.float64
+        assert np.isnan(result.at['q', 'a'])
+        assert result.at['r', 'b'] == 0.5
+
+        with pytest.raises(KeyError):
+            df.set_lookup(['xyz'], ['a'], 1)
+        with tm.assert_raises_regex(ValueError, 'same size'):
+            df.set_lookup(['p', 'q'], ['a', 'a'], [1, 2, 3])
+
+    def test_set_lookup_copy_on_write(self):
+        df = DataFrame({'a': [1., 2., 3.], 'b': [4., 5., 6.]})
+        expected = df.copy()
+
+        with pd.option_context('mode.copy_on_write', True):
+            result = df.copy()
+            result['a']
+            result.set_lookup([0, 2], ['a', 'b'], [10., 30.])
+            tm.assert_frame_equal(df, expected)
+            assert result['a'].tolist() == [10., 2., 3.]
+            assert result['b'].tolist() == [4., 5., 30.]
+
     def test_set_value(self):
         for idx in self.frame.index:
             for col in self.frame.columns:
@@ -690,6 +690,112 @@ class TestGroupByAggregate(object):
         expected = self.df.groupby('A').agg(ex_funcs)
         assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('funcs', [
+        ['sum', 'mean', 'min', 'max', 'count'],
+        ['std', 'var', 'prod'],
+        ('count', 'std', 'sum')])
+    def test_agg_multiple_cython_functions_fused(self, funcs):
+        # the list of reductions is computed in a single pass, the result
+        # must match aggregating each function separately
+        df = DataFrame({'key': np.random.randint(0, 5, size=50),
+                        'float': np.random.randn(50),
+                        'float32': np.random.randn(50).astype('float32'),
+                        'int': np.random.randint(0, 10, size=50)})
+        df.loc[::7, 'float'] = np.nan
+        grouped = df.groupby('key')
+
+        result = grouped.agg(funcs)
+        expected = pd.concat(
+            [pd.concat([getattr(grouped[col], f)() for f in funcs],
+                       axis=1, keys=list(funcs))
+             for col in ['float', 'float32', 'int']],
+            axis=1, keys=['float', 'float32', 'int'])
+        assert_frame_equal(result, expected)
+
+        result = grouped['float'].agg(funcs)
+        assert_frame_equal(result, expected['float'])
+
+    @pytest.mark.parametrize('how', ['sum', 'prod', 'mean', 'var', 'min',
+                                     'max', 'median', 'first', 'last'])
+    def test_cython_agg_threaded(self, how, monkeypatch):
+        monkeypatch.setattr(pd.core.parallel, '_MIN_THREADED_SIZE', 0)
+
+        df = DataFrame({'key': np.random.randint(0, 10, size=100),
+                        'A': np.random.randn(100),
+                        'B': np.random.randn(100),
+                        'C': np.random.randint(0, 10, size=100)})
+        df.loc[::3, 'A'] = np.nan
+        df.loc[df.key == 3, 'B'] = np.nan
+        grouped = df.groupby('key')
+
+        with pd.option_context('compute.num_threads', 1):
+            expected = getattr(grouped, how)()
+        with pd.option_context('compute.num_threads', 4):
+            result = getattr(grouped, how)()
+        assert_frame_equal(result, expected)
+
+        # a single column is split in chunks of rows
+        for col in ['A', 'B']:
+            with pd.option_context('compute.num_threads', 3):
+                result = getattr(grouped[col], how)()
+            assert_series_equal(result, expected[col])
+
+    def test_cython_agg_threaded_concurrent_callers(self, monkeypatch):
+        # callers on several threads share the pool of threads
+        import threading
+        assert pd.get_option('compute.num_threads') == 0
+        monkeypatch.setattr(pd.core.parallel, '_MIN_THREADED_SIZE', 0)
+        monkeypatch.setattr(pd.core.parallel, '_NUM_THREADS', 3)
+
+        df = DataFrame({'key': np.random.randint(0, 10, size=100),
+                        'A': np.random.randn(100)})
+        expected = df.groupby('key').A.sum()
+
+        results = []
+
+        def f():
+            for _ in range(5):
+                results.append(df.groupby('key').A.sum())
+
+        threads = [threading.Thread(target=f) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 20
+        for result in results:
+            assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize('func', [
+        'sum', 'count', 'mean', 'var', 'std', 'min', 'max', 'first', 'last',
+        'nunique', ['sum', 'mean', 'std', 'max'], ['count', 'nunique']])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_aggregate_chunks(self, func, sort):
+        from pandas.core.groupby import aggregate_chunks
+
+        df = DataFrame({'A': np.random.choice(['a', 'b', 'c', None], 100),
+                        'B': np.random.randint(0, 3, size=100),
+                        'C': np.random.randn(100),
+                        'D': np.random.randint(0, 5, size=100),
+                        'E': np.random.choice(list('xyz'), 100)})
+        df.loc[::5, 'C'] = np.nan
+        chunks = [df.iloc[i:i + 30] for i in range(0, 100, 30)]
+
+        result = aggregate_chunks(iter(chunks), ['A', 'B'], func, sort=sort)
+        expected = df.groupby(['A', 'B'], sort=sort).agg(func)
+        assert_frame_equal(result, expected)
+
+        result = aggregate_chunks(iter(chunks), 'B', func, sort=sort)
+        expected = df.groupby('B', sort=sort).agg(func)
+        assert_frame_equal(result, expected)
+
+    def test_aggregate_chunks_raises(self):
+        from pandas.core.groupby import aggregate_chunks
+
+        with tm.assert_raises_regex(ValueError, 'cannot combine median'):
+            aggregate_chunks(iter([self.df]), 'A', 'median')
+
     def test_agg_multiple_functions_too_many_lambdas(self):
         grouped = self.df.groupby('A')
         funcs = ['mean', lambda x: x.mean(), lambda x: x.std()]
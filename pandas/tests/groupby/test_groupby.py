@@ -8,7 +8,7 @@ from datetime import datetime
 
 from pandas import (date_range, bdate_range, Timestamp,
                     Index, MultiIndex, DataFrame, Series,
-                    concat, Panel, DatetimeIndex, read_csv)
+                    concat, Panel, DatetimeIndex, read_csv, isna)
 from pandas.errors import UnsupportedFunctionCall, PerformanceWarning
 from pandas.util.testing import (assert_frame_equal, assert_index_equal,
                                  assert_series_equal, assert_almost_equal)
@@ -1064,6 +1064,19 @@ class TestGroupBy(MixIn):
         pytest.raises(ValueError, s.groupby, level=[0, 1])
         pytest.raises(ValueError, s.groupby, level=[1])
 
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_groupby_level_cached_factorize(self, sort):
+        # the factorization of an index is reused by the groupbys on it
+        s = Series([1, 2, 3, 10, 4, 5, 20, 6],
+                   Index([3, 2, 1, 3, 4, 5, 2, 6], name='foo'))
+        expected = s.groupby(s.index.values, sort=sort).sum()
+        expected.index.name = 'foo'
+
+        for _ in range(2):
+            result = s.groupby(level=0, sort=sort).sum()
+            tm.assert_series_equal(result, expected)
+            assert ('factorize', sort) in s.index._cache
+
     def test_groupby_complex(self):
         # GH 12902
         a = Series(data=np.arange(4) * (1 + 2j), index=[0, 0, 1, 1])
@@ -2759,6 +2772,95 @@ class TestGroupBy(MixIn):
             df.groupby((7, 8)).mean()
 
 
+@pytest.mark.parametrize("agg_func", ['any', 'all'])
+@pytest.mark.parametrize("skipna", [True, False])
+@pytest.mark.parametrize("vals", [
+    ['foo', 'bar', 'baz'], ['foo', '', ''], ['', '', ''],
+    [1, 2, 3], [1, 0, 0], [0, 0, 0],
+    [1., 2., 3.], [1., 0., 0.], [0., 0., 0.],
+    [True, True, True], [True, False, False], [False, False, False],
+    [np.nan, np.nan, np.nan]
+])
+def test_groupby_bool_aggs(agg_func, skipna, vals):
+    df = DataFrame({'key': ['a'] * 3 + ['b'] * 3, 'val': vals * 2})
+
+    # Figure out expectation using Python builtin
+    exp = getattr(compat.builtins, agg_func)(vals)
+
+    # edge case for missing data with skipna and 'any'
+    if skipna and all(isna(vals)) and agg_func == 'any':
+        exp = False
+
+    exp_df = DataFrame([exp] * 2, columns=['val'], index=Index(
+        ['a', 'b'], name='key'))
+    result = getattr(df.groupby('key'), agg_func)(skipna=skipna)
+    assert_frame_equal(result, exp_df)
+
+
+@pytest.mark.parametrize("interpolation", [
+    "linear", "lower", "higher", "nearest", "midpoint"])
+@pytest.mark.parametrize("a_vals,b_vals", [
+    ([1, 2, 3, 4, 5], [5, 4, 3, 2, 1]),
+    ([1., 2., 3., 4., 5.], [5., 4., np.nan, 2., 1.]),
+    ([1, 2, 4, 7, 11], [11, 7, 4, 2, 1]),
+    ([np.nan] * 5, [4., 3., 2., 1., np.nan]),
+])
+@pytest.mark.parametrize("q", [0, .25, .5, .75, 1])
+def test_groupby_quantile(interpolation, a_vals, b_vals, q):
+    df = DataFrame({'key': ['a'] * len(a_vals) + ['b'] * len(b_vals),
+                    'val': a_vals + b_vals})
+
+    a_expected = Series(a_vals).quantile(q, interpolation=interpolation)
+    b_expected = Series(b_vals).quantile(q, interpolation=interpolation)
+    expected = DataFrame({'val': [a_expected, b_expected]},
+                         index=Index(['a', 'b'], name='key'))
+
+    result = df.groupby('key').quantile(q, interpolation=interpolation)
+    assert_frame_equal(result, expected)
+
+
+def test_groupby_quantile_list_like():
+    df = DataFrame({'key': ['a', 'a', 'b', 'b'], 'val': [1., 2., 3., 4.]})
+    result = df.groupby('key').val.quantile([.25, .75])
+    expected = df.groupby('key').val.apply(lambda x: x.quantile([.25, .75]))
+    assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("vals", [
+    [2, 2, 8, 2, 6],
+    [2., 2., 8., 2., 6.],
+    [2., np.nan, 8., 2., np.nan],
+    [pd.Timestamp('2018-01-02'), pd.Timestamp('2018-01-02'),
+     pd.Timestamp('2018-01-08'), pd.Timestamp('2018-01-02'),
+     pd.Timestamp('2018-01-06')],
+    [pd.Timestamp('2018-01-02'), pd.NaT, pd.Timestamp('2018-01-08'),
+     pd.Timestamp('2018-01-02'), pd.NaT],
+])
+@pytest.mark.parametrize("ties_method", [
+    'average', 'min', 'max', 'first', 'dense'])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_option", ['keep', 'top', 'bottom'])
+@pytest.mark.parametrize("pct", [True, False])
+def test_groupby_rank(vals, ties_method, ascending, na_option, pct):
+    key = np.repeat(['foo', 'bar'], 5)
+    df = DataFrame({'key': key, 'val': np.concatenate([vals, vals[::-1]])})
+
+    result = df.groupby('key').rank(method=ties_method, ascending=ascending,
+                                    na_option=na_option, pct=pct)
+    expected = df.groupby('key').val.apply(
+        lambda x: x.rank(method=ties_method, ascending=ascending,
+                         na_option=na_option, pct=pct)).to_frame()
+    assert_frame_equal(result, expected)
+
+
+def test_groupby_rank_object_fallback():
+    df = DataFrame({'key': ['a', 'a', 'b', 'b'],
+                    'val': ['x', 'w', 'z', 'y']})
+    result = df.groupby('key').rank()
+    expected = DataFrame({'val': [2., 1., 2., 1.]})
+    assert_frame_equal(result, expected)
+
+
 def _check_groupby(df, result, keys, field, f=lambda x: x.sum()):
     tups = lmap(tuple, df[keys].values)
     tups = com._asarray_tuplesafe(tups)
@@ -434,6 +434,9 @@ class Base(object):
             result = index.memory_usage()
             if len(index):
                 index.get_loc(index[0])
+
+                # lookups of sorted indexes don't populate the hash table
+                index.get_indexer_for(index[:1])
                 result2 = index.memory_usage()
                 result3 = index.memory_usage(deep=True)
 
@@ -30,6 +30,7 @@ from pandas.core.indexes.datetimes import _to_m8
 
 import pandas as pd
 from pandas._libs.lib import Timestamp
+from pandas._libs import index as libindex
 
 
 class TestIndex(Base):
@@ -1291,6 +1292,148 @@ class TestIndex(Base):
         with pytest.raises(TypeError):
             idx.get_loc('a', method='pad', tolerance='invalid')
 
+    def test_get_loc_monotonic_without_hashtable(self):
+        # sorted values are binary searched
+        idx = pd.Index([1, 3, 5, 5, 8])
+        assert idx.get_loc(3) == 1
+        assert idx.get_loc(5) == slice(2, 4)
+        assert 8 in idx
+        assert 4 not in idx
+        with pytest.raises(KeyError):
+            idx.get_loc(4)
+        assert not idx.is_unique
+        assert not idx._engine.is_mapping_populated
+
+        idx = pd.Index(['a', 'b', 'd'])
+        assert idx.get_loc('b') == 1
+        with pytest.raises(KeyError):
+            idx.get_loc(1)
+        assert idx.is_unique
+        assert not idx._engine.is_mapping_populated
+
+        idx = pd.date_range('2017', periods=5)
+        assert idx.get_loc(pd.Timestamp('2017-01-03')) == 2
+        assert idx[4] in idx
+        assert not idx._engine.is_mapping_populated
+
+    def test_get_loc_scan_before_hashtable(self, monkeypatch):
+        # the first lookups of a large index scan its values
+        monkeypatch.setattr(libindex, '_SIZE_CUTOFF', 3)
+        idx = pd.Index([5, 1, 3, 1, 8, 2])
+        expected = np.array([False, True, False, True, False, False])
+        for _ in range(libindex._SCAN_LOOKUPS // 2):
+            assert idx.get_loc(3) == 2
+            tm.assert_numpy_array_equal(idx.get_loc(1), expected)
+        assert not idx._engine.is_mapping_populated
+
+        assert idx.get_loc(3) == 2
+        assert idx._engine.is_mapping_populated
+
+        # nan is only looked up in the hash table
+        idx = pd.Index([2., np.nan, 1., 0.])
+        assert idx.get_loc(1.) == 2
+        assert not idx._engine.is_mapping_populated
+        assert idx._engine.get_loc(np.nan) == 1
+        assert idx._engine.is_mapping_populated
+
+    def test_hashtable_max_size(self):
+        idx = pd.Index([3, 1, 2, 5])
+        with pd.option_context('compute.index_hashtable_max_size', 3):
+            assert idx.is_unique
+            tm.assert_numpy_array_equal(idx.get_indexer([2, 4]),
+                                        np.array([2, -1], dtype=np.intp))
+            assert idx.get_loc(5) == 3
+            assert 1 in idx
+            assert not idx._engine.is_mapping_populated
+
+        assert idx.get_loc(5) == 3
+        assert idx._engine.is_mapping_populated
+
+    @pytest.mark.parametrize('values, present, missing', [
+        (np.array([], dtype=np.int64), [], [1, 0]),
+        (np.array([], dtype=np.float64), [], [1., 0.]),
+        (np.array([], dtype=object), [], ['a', 1]),
+        (np.array([5], dtype=np.int64), [5], [4, 6]),
+        (np.array([5.], dtype=np.float64), [5.], [4., 6.]),
+        (np.array(['b'], dtype=object), ['b'], ['a', 'c'])])
+    def test_get_loc_sorted_small(self, values, present, missing):
+        # empty and single values are monotonic, and searched
+        idx = Index(values)
+        for key in present:
+            assert idx.get_loc(key) == 0
+            assert key in idx
+        for key in missing:
+            with pytest.raises(KeyError):
+                idx.get_loc(key)
+            assert key not in idx
+        assert not idx._engine.is_mapping_populated
+
+    def test_empty_frame_lookups(self):
+        df = pd.DataFrame()
+        assert 'a' not in df
+        df['a'] = [1]
+        tm.assert_frame_equal(df, pd.DataFrame({'a': [1]}))
+
+    def test_is_unique_sorted_without_hashtable(self):
+        idx = Index([1, 2, 5, 7])
+        assert idx.is_unique
+        assert not idx._engine.is_mapping_populated
+
+        idx = Index(['a', 'b', 'b'])
+        assert not idx.is_unique
+        assert not idx._engine.is_mapping_populated
+
+    def test_hashtable_max_size_scans(self):
+        # the lookups which would build a hash table only to drop it scan
+        # the values instead
+        nan = float('nan')
+        mi = pd.MultiIndex.from_tuples([('b', 1), ('a', 2), ('c', 1),
+                                        ('a', 2)])
+        cases = [
+            (pd.Index(['b', nan, 'a', 'c', 'a'])._engine, ['c', nan, 'a'],
+             'd'),
+            (pd.Index([3., nan, 1., 2.])._engine, [nan, 1.], 4.),
+            (libindex.MultiIndexObjectEngine(lambda: mi.values, len(mi)),
+             [('c', 1), ('a', 2)], ('d', 1))]
+
+        for engine, keys, missing in cases:
+            expected = [engine.get_loc(key) for key in keys]
+            engine.clear_mapping()
+
+            with pd.option_context('compute.index_hashtable_max_size', 3):
+                for key, loc in zip(keys, expected):
+                    result = engine.get_loc(key)
+                    if isinstance(loc, np.ndarray):
+                        tm.assert_numpy_array_equal(result, loc)
+                    else:
+                        assert result == loc
+                    assert key in engine
+                    assert not engine.is_mapping_populated
+
+                with pytest.raises(KeyError):
+                    engine.get_loc(missing)
+                assert missing not in engine
+                assert not engine.is_mapping_populated
+
+    def test_clear_engine_cache(self):
+        idx = pd.Index(['b', 'a', 'c'])
+        assert idx.get_loc('a') == 1
+        assert idx._engine.is_mapping_populated
+        assert idx.memory_usage() > idx.nbytes
+
+        idx.clear_engine_cache()
+        assert not idx._engine.is_mapping_populated
+        assert idx.memory_usage() == idx.nbytes
+        assert idx.get_loc('c') == 2
+
+        # the labels kept for groupbys on the index are freed too
+        labels, _ = idx._factorize_cached(sort=True)
+        tm.assert_numpy_array_equal(labels, np.array([1, 0, 2],
+                                                     dtype=np.intp))
+        assert ('factorize', True) in idx._cache
+        idx.clear_engine_cache()
+        assert ('factorize', True) not in idx._cache
+
     def test_slice_locs(self):
         for dtype in [int, float]:
             idx = Index(np.array([0, 1, 2, 5, 6, 7, 9, 10], dtype=dtype))
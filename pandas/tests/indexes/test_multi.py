@@ -18,6 +18,7 @@ from pandas.compat import PY3, long, lrange, lzip, range, u, PYPY
 from pandas.errors import PerformanceWarning, UnsortedIndexError
 from pandas.core.dtypes.dtypes import CategoricalDtype
 from pandas.core.indexes.base import InvalidIndexError
+from pandas.core.indexes.multi import MultiIndexUIntEngine
 from pandas.core.dtypes.cast import construct_1d_object_array_from_listlike
 from pandas._libs.lib import Timestamp
 
@@ -1432,6 +1433,89 @@ class TestMultiIndex(Base):
         with tm.assert_raises_regex(InvalidIndexError, msg):
             idx1.get_indexer(idx2)
 
+    def test_uint_engine(self):
+        # the labels of unsorted levels and NaN are packed into uint64 keys
+        idx = MultiIndex(levels=[['c', 'a', 'b'], [20, 10]],
+                         labels=[[1, 1, 2, 2, 0, -1], [1, 0, 1, 0, 1, 1]])
+        assert isinstance(idx._engine, MultiIndexUIntEngine)
+        assert idx.is_unique
+
+        keys = [('a', 10), ('a', 20), ('b', 10), ('b', 20), ('c', 10),
+                (np.nan, 10)]
+        for i, key in enumerate(keys):
+            assert idx.get_loc(key) == i
+            assert key in idx
+        for key in [('a', 30), ('d', 10), ('a', 10.5)]:
+            with pytest.raises(KeyError):
+                idx.get_loc(key)
+            assert key not in idx
+
+        target = MultiIndex.from_tuples([('b', 20), ('a', 15), ('d', 10),
+                                         ('a', 10)])
+        tm.assert_numpy_array_equal(idx.get_indexer(target),
+                                    np.array([3, -1, -1, 0], dtype=np.intp))
+
+        s = pd.Series(range(6), index=idx)
+        assert s[('b', 20)] == 3
+
+    def test_uint_engine_fill(self):
+        idx = MultiIndex(levels=[['c', 'a', 'b'], [20, 10]],
+                         labels=[[1, 1, 2, 2, 0], [0, 1, 0, 1, 0]])
+        target = MultiIndex.from_tuples([('a', 5), ('a', 15), ('b', 20),
+                                         ('b', 25), ('bb', 0), ('d', 0)])
+
+        result = idx.sort_values().get_indexer(target, method='pad')
+        expected = np.array([-1, 0, 3, 3, 3, 4], dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)
+
+        result = idx.sort_values().get_indexer(target, method='backfill')
+        expected = np.array([0, 1, 3, 4, 4, -1], dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_uint_engine_non_unique(self):
+        idx = MultiIndex.from_arrays([[1, 1, 2, 2], ['a', 'a', 'b', 'c']])
+        assert isinstance(idx._engine, MultiIndexUIntEngine)
+        assert not idx.is_unique
+
+        indexer, missing = idx.get_indexer_non_unique(
+            [(1, 'a'), (2, 'd'), (2, 'c')])
+        tm.assert_numpy_array_equal(indexer,
+                                    np.array([0, 1, -1, 3], dtype=np.intp))
+        tm.assert_numpy_array_equal(missing, np.array([1], dtype=np.int64))
+
+        # values which are not tuples are missing
+        indexer, missing = idx.get_indexer_non_unique(np.array([1, 2]))
+        tm.assert_numpy_array_equal(indexer,
+                                    np.array([-1, -1], dtype=np.intp))
+        tm.assert_numpy_array_equal(missing,
+                                    np.array([0, 1], dtype=np.int64))
+        tm.assert_numpy_array_equal(idx.get_indexer_for([1, 2]),
+                                    np.array([-1, -1], dtype=np.intp))
+
+    def test_uint_engine_small(self):
+        # a single row and no rows are searched in the packed keys
+        idx = MultiIndex(levels=[['a', 'b'], [1, 2]], labels=[[1], [1]])
+        assert isinstance(idx._engine, MultiIndexUIntEngine)
+        assert idx.get_loc(('b', 2)) == 0
+        for key in [('a', 1), ('a', 2), ('b', 1)]:
+            with pytest.raises(KeyError):
+                idx.get_loc(key)
+            assert key not in idx
+
+        idx = MultiIndex(levels=[['a', 'b'], [1, 2]], labels=[[], []])
+        assert isinstance(idx._engine, MultiIndexUIntEngine)
+        for key in [('a', 1), ('b', 2)]:
+            with pytest.raises(KeyError):
+                idx.get_loc(key)
+            assert key not in idx
+
+    def test_uint_engine_overflow(self):
+        # five levels of 10000 labels do not fit in 64 bits
+        idx = MultiIndex.from_arrays([np.arange(10000)] * 5)
+        assert not isinstance(idx._engine, MultiIndexUIntEngine)
+        assert idx.get_loc((5, 5, 5, 5, 5)) == 5
+        assert idx.is_unique
+
     def test_get_indexer_nearest(self):
         midx = MultiIndex.from_tuples([('a', 1), ('b', 2)])
         with pytest.raises(NotImplementedError):
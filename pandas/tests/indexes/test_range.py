@@ -12,6 +12,7 @@ import numpy as np
 
 from pandas import (isna, Series, Index, Float64Index,
                     Int64Index, RangeIndex)
+from pandas.core.indexes.range import _maybe_as_range
 
 import pandas.util.testing as tm
 
@@ -707,6 +708,23 @@ class TestRangeIndex(Numeric):
             tm.assert_index_equal(res2, expected, exact=True)
             tm.assert_index_equal(res3, expected)
 
+        # evenly spaced integers extend the range
+        result = RI(0, 10, 2).union(I64([10, 12]))
+        tm.assert_index_equal(result, RI(0, 14, 2), exact=True)
+        result = RI(0, 3).union(I64([3, 5]))
+        tm.assert_index_equal(result, I64([0, 1, 2, 3, 5]), exact=True)
+
+        # the differences of values spanning more than int64 wrap around
+        for values in [[-2**63, 2**63 - 1], [2**63 - 1, -2**63],
+                       [-2**63, 0, 2**63 - 1]]:
+            assert _maybe_as_range(I64(values)) is None
+
+        # names are kept on consensus
+        result = RI(0, 5, name='foo').union(RI(5, 10, name='foo'))
+        tm.assert_index_equal(result, RI(0, 10, name='foo'), exact=True)
+        result = RI(0, 5, name='foo').union(RI(5, 10, name='bar'))
+        tm.assert_index_equal(result, RI(0, 10), exact=True)
+
     def test_nbytes(self):
 
         # memory savings vs int index
@@ -763,6 +781,39 @@ class TestRangeIndex(Numeric):
         with pytest.raises(IndexError):
             idx.take(np.array([1, -5]))
 
+    def test_take_preserve_range(self):
+        idx = RangeIndex(0, 20, 2, name='foo')
+        empty = np.array([], dtype=np.int64)
+        cases = [([1, 2, 3], RangeIndex(2, 8, 2, name='foo')),
+                 ([7, 4, 1], RangeIndex(14, 0, -6, name='foo')),
+                 ([9], RangeIndex(18, 20, 2, name='foo')),
+                 (empty, RangeIndex(0, 0, 2, name='foo')),
+                 ([3, 0, 1], Int64Index([6, 0, 2], name='foo')),
+                 ([-2, -1], Int64Index([16, 18], name='foo'))]
+        for indices, expected in cases:
+            tm.assert_index_equal(idx.take(indices), expected, exact=True)
+            tm.assert_index_equal(idx[indices], expected, exact=True)
+
+        with pytest.raises(IndexError):
+            idx.take([8, 9, 10])
+
+        mask = idx < 10
+        tm.assert_index_equal(idx[mask], RangeIndex(0, 10, 2, name='foo'),
+                              exact=True)
+        tm.assert_index_equal(idx[~mask], RangeIndex(10, 20, 2, name='foo'),
+                              exact=True)
+        tm.assert_index_equal(idx[idx % 4 == 0],
+                              Int64Index([0, 4, 8, 12, 16], name='foo'),
+                              exact=True)
+
+    def test_frame_ops_preserve_range(self):
+        df = pd.DataFrame({'a': np.arange(10), 'b': np.arange(10.)})
+        assert isinstance(df[df.a < 5].index, RangeIndex)
+        assert isinstance(df.sort_values('a', ascending=False).index,
+                          RangeIndex)
+        assert isinstance(df.a[df.a >= 5].index, RangeIndex)
+        assert isinstance(pd.concat([df[:5], df[5:]]).index, RangeIndex)
+
     def test_print_unicode_columns(self):
         df = pd.DataFrame({u("\u05d0"): [1, 2, 3],
                            "\u05d1": [4, 5, 6],
@@ -962,6 +1013,9 @@ class TestRangeIndex(Numeric):
                  ([RI(2,), RI(3, 5), RI(5, 8, 4)], I64([0, 1, 3, 4, 5])),
                  ([RI(-2, 2), RI(2, 5), RI(5, 8, 4)], RI(-2, 6)),
                  ([RI(3,), I64([-1, 3, 15])], I64([0, 1, 2, -1, 3, 15])),
+                 ([RI(3,), I64([3, 4]), RI(5, 7)], RI(7)),
+                 ([RI(0, 6, 2), I64([6]), I64([8, 10])], RI(0, 12, 2)),
+                 ([RI(3,), I64([4, 5])], I64([0, 1, 2, 4, 5])),
                  ([RI(3,), F64([-1, 3.1, 15.])], F64([0, 1, 2, -1, 3.1, 15.])),
                  ([RI(3,), OI(['a', None, 14])], OI([0, 1, 2, 'a', None, 14])),
                  ([RI(3, 1), OI(['a', None, 14])], OI(['a', None, 14]))
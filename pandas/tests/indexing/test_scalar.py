@@ -5,7 +5,7 @@ import pytest
 import numpy as np
 
 from pandas import (Series, DataFrame, Timestamp,
-                    Timedelta, date_range)
+                    Timedelta, date_range, Index, Float64Index, UInt64Index)
 from pandas.util import testing as tm
 from pandas.tests.indexing.common import Base
 
@@ -170,3 +170,45 @@ class TestScalar(Base):
 
         result = df.at[0, 'date']
         assert result == expected
+
+    @pytest.mark.parametrize('index', [
+        Index(list('abcde')),
+        Index(np.arange(5) * 10),
+        UInt64Index(np.arange(5) * 10),
+        Float64Index(np.arange(5) * 1.5),
+        Index(np.arange(5) * 10)[::-1]])
+    @pytest.mark.parametrize('values', [
+        np.arange(5.),
+        np.array(list('vwxyz'), dtype=object),
+        date_range('2000', periods=5).values,
+        np.array([1, 2, 3, 4, 5], dtype='m8[s]')])
+    def test_scalar_fast_path(self, index, values):
+        s = Series(values, index=index)
+        for i, label in enumerate(index):
+            expected = s.at[label]
+            assert type(s.loc[label]) is type(expected)
+            assert s.loc[label] == expected
+            assert s[label] == expected
+            assert s.iloc[i] == expected
+            assert s.iloc[i - len(s)] == expected
+            assert s.iat[i] == expected
+
+        pytest.raises(IndexError, lambda: s.iloc[len(s)])
+        pytest.raises(IndexError, lambda: s.iloc[-len(s) - 1])
+        missing = 'f' if index.is_object() else 100
+        pytest.raises(KeyError, lambda: s.loc[missing])
+        pytest.raises(KeyError, lambda: s[missing])
+
+    def test_scalar_fast_path_fallback(self):
+        # keys the engine alone cannot answer keep their semantics
+        s = Series([1, 2, 3], index=list('abc'))
+        assert s[1] == 2
+        pytest.raises(TypeError, lambda: s.loc[1])
+
+        s = Series([1, 2, 3], index=[1, 1, 2])
+        tm.assert_series_equal(s.loc[1], Series([1, 2], index=[1, 1]))
+        tm.assert_series_equal(s[1], Series([1, 2], index=[1, 1]))
+
+        s = Series([1., 2., 3.], index=[0.5, np.nan, 2.])
+        assert s.loc[np.nan] == 2.
+        assert s[2] == 3.
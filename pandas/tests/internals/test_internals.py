@@ -252,6 +252,30 @@ class TestBlock(object):
         assert cop is not self.fblock
         assert_block_equal(self.fblock, cop)
 
+    def test_copy_on_write(self):
+        with pd.option_context('mode.copy_on_write', True):
+            cop = self.fblock.copy()
+        assert cop.values is self.fblock.values
+
+        # writing to the copy copies its values first
+        original = self.fblock.values.copy()
+        cop.setitem((0, 0), 100.)
+        assert cop.values is not self.fblock.values
+        assert cop.values[0, 0] == 100.
+        tm.assert_numpy_array_equal(self.fblock.values, original)
+
+        # and the original no longer shares its values
+        assert not self.fblock._maybe_copy_on_write()
+
+    def test_copy_on_write_released(self):
+        with pd.option_context('mode.copy_on_write', True):
+            cop = self.fblock.copy()
+        values = self.fblock.values
+        del cop
+
+        assert not self.fblock._maybe_copy_on_write()
+        assert self.fblock.values is values
+
     def test_reindex_index(self):
         pass
 
@@ -1412,6 +1412,193 @@ class TestMergeDtypes(object):
             with tm.assert_raises_regex(ValueError, msg):
                 pd.merge(left, right, on='A')
 
+    @pytest.mark.parametrize('left_vals, right_vals', [
+        ([1.5, -0., np.nan, 2.5, 1.5], [0., 2.5, np.nan, 3.5]),
+        (np.array([2**63, 1, 2, 1], dtype=np.uint64),
+         np.array([2, 2**63 + 1, 2**63], dtype=np.uint64)),
+        (['b', 'a', 'c', 'a'], ['d', 'a', 'b'])])
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_merge_typed_keys(self, left_vals, right_vals, how, sort):
+        # float, uint64 and string keys are factorized without boxing
+        # the values, the result is the same as merging on objects
+        left = DataFrame({'key': left_vals,
+                          'lval': np.arange(len(left_vals))})
+        right = DataFrame({'key': right_vals,
+                           'rval': np.arange(len(right_vals))})
+
+        result = pd.merge(left, right, on='key', how=how, sort=sort)
+
+        left_obj = left.assign(key=left['key'].astype(object))
+        right_obj = right.assign(key=right['key'].astype(object))
+        expected = pd.merge(left_obj, right_obj, on='key', how=how,
+                            sort=sort)
+        expected['key'] = expected['key'].astype(result['key'].dtype)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    @pytest.mark.parametrize('threaded', [True, False])
+    def test_merge_parallel_hash(self, how, sort, threaded, monkeypatch):
+        # the partitioned join gives the same result as the default engine
+        import pandas.core.parallel as parallel
+        if threaded:
+            monkeypatch.setattr(parallel, '_MIN_THREADED_SIZE', 0)
+
+        left = DataFrame({'key': [3, 1, np.nan, 7, 1, 5, 3, 3, 8],
+                          'key2': list('aabbaabba'),
+                          'lval': np.arange(9)})
+        right = DataFrame({'key': [1, 3, 3, 2, np.nan, 8, 9],
+                           'key2': list('aabbabb'),
+                           'rval': np.arange(7)})
+
+        with pd.option_context('compute.num_threads', 3):
+            for on in ['key', ['key', 'key2']]:
+                result = pd.merge(left, right, on=on, how=how, sort=sort,
+                                  engine='parallel_hash')
+                expected = pd.merge(left, right, on=on, how=how, sort=sort)
+                assert_frame_equal(result, expected)
+
+            # empty
+            result = pd.merge(left[:0], right, on='key', how=how,
+                              sort=sort, engine='parallel_hash')
+            expected = pd.merge(left[:0], right, on='key', how=how,
+                                sort=sort)
+            assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('keys', [
+        np.array([2**63 + 5, 7, 2**63 + 5, 1, 0, 7, 3, 2], dtype=np.uint64),
+        np.array([-0., 1.5, np.nan, 0., 2.5, -1., 1.5, np.nan]),
+        pd.date_range('2017', periods=4).repeat(2)[::-1].insert(1, pd.NaT),
+        pd.Categorical(list('bacbadcb'), categories=list('dcab')),
+        np.array([5, -3, 5, 2**40, 0, -3, 7, 1], dtype=np.int64)])
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_merge_parallel_hash_dtypes(self, keys, how, sort, monkeypatch):
+        # each key column is factorized by hash partition
+        import pandas.core.parallel as parallel
+        monkeypatch.setattr(parallel, '_MIN_THREADED_SIZE', 0)
+
+        n = len(keys)
+        rng = np.random.RandomState(2)
+        left = DataFrame({'key': keys, 'key2': rng.randint(0, 2, n),
+                          'lval': np.arange(n)})
+        right = DataFrame({'key': keys[rng.permutation(n)[:6]],
+                           'key2': rng.randint(0, 2, 6),
+                           'rval': np.arange(6)})
+
+        with pd.option_context('compute.num_threads', 3):
+            for on in ['key', ['key', 'key2']]:
+                result = pd.merge(left, right, on=on, how=how, sort=sort,
+                                  engine='parallel_hash')
+                expected = pd.merge(left, right, on=on, how=how, sort=sort)
+                assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('left_vals, right_vals', [
+        ([1, 2, 2, 4, 7, 7], [0, 2, 4, 5, 7]),
+        ([1, 2, 4, 7], [0, 2, 2, 4, 5, 7, 7, 7]),
+        ([1.5, 2.5, 2.5, 3.5], [-1., 2.5, 3.5, 4.5]),
+        (pd.date_range('2017', periods=6, freq='H').repeat(2),
+         pd.date_range('2017', periods=4, freq='2H')),
+        (np.array([], dtype=np.int64), [1, 2, 3])])
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_merge_monotonic_keys(self, left_vals, right_vals, how, sort):
+        # sorted keys are joined by the ordered join routines, the result
+        # is the same as with the hash join
+        left = DataFrame({'key': left_vals,
+                          'lval': np.arange(len(left_vals))})
+        right = DataFrame({'key': right_vals,
+                           'rval': np.arange(len(right_vals))})
+
+        result = pd.merge(left, right, on='key', how=how, sort=sort)
+
+        left_obj = left.assign(key=left['key'].astype(object))
+        right_obj = right.assign(key=right['key'].astype(object))
+        expected = pd.merge(left_obj, right_obj, on='key', how=how,
+                            sort=sort)
+        expected['key'] = expected['key'].astype(result['key'].dtype)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('left_vals, right_vals', [
+        ([1, 2, 2], [2, 2, 3]),
+        ([1., 2., np.nan], [1., 2.]),
+        ([2, 1], [1, 2]),
+        ([1, 2], [1., 2.])])
+    def test_monotonic_join_indexers_fallback(self, left_vals, right_vals):
+        # many-to-many, missing, unsorted or mixed keys are hash joined
+        from pandas.core.reshape.merge import _get_monotonic_join_indexers
+        result = _get_monotonic_join_indexers(np.array(left_vals),
+                                              np.array(right_vals))
+        assert result is None
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_merge_semi_join_filter(self, how, sort, monkeypatch):
+        # the rows of the large side which cannot match are dropped before
+        # the keys are hashed, which does not change the result
+        import pandas.core.reshape.merge as merge_mod
+        np.random.seed(1234)
+        large = DataFrame({'key': np.random.randint(0, 100, 200),
+                           'key2': np.random.choice([1.5, np.nan], 200),
+                           'val': np.arange(200)})
+        small = DataFrame({'key': [3, 5, 5, 99, 1000],
+                           'key2': [1.5, np.nan, 1.5, 1.5, 1.5],
+                           'val2': np.arange(5)})
+
+        pairs = [(large, small), (small, large)]
+        expected = [pd.merge(left, right, on=['key', 'key2'], how=how,
+                             sort=sort) for left, right in pairs]
+
+        monkeypatch.setattr(merge_mod, '_SEMI_JOIN_MIN_SIZE', 0)
+        for (left, right), exp in zip(pairs, expected):
+            result = pd.merge(left, right, on=['key', 'key2'], how=how,
+                              sort=sort)
+            assert_frame_equal(result, exp)
+
+    @pytest.mark.parametrize('index', [
+        Index([3, 1, 7]),
+        Index([3., 1., np.nan]),
+        Index(['b', 'a', 'd']),
+        pd.date_range('2017', periods=3)])
+    def test_merge_on_unique_index(self, index):
+        # a left merge on a unique index looks the keys up in the hash
+        # table of the index
+        right = DataFrame({'rval': [10, 20, 30]}, index=index)
+        left = DataFrame({'key': index.take([2, 0, 2, 1]).insert(1, index[0]),
+                          'lval': np.arange(5)})
+
+        result = pd.merge(left, right, left_on='key', right_index=True,
+                          how='left')
+        expected = left.assign(rval=[30, 10, 10, 30, 20])
+        assert_frame_equal(result, expected)
+
+    def test_merge_invalid_engine(self):
+        left = DataFrame({'key': [1, 2], 'lval': [1, 2]})
+        right = DataFrame({'key': [1, 2], 'rval': [1, 2]})
+        with tm.assert_raises_regex(ValueError, 'engine must be one of'):
+            pd.merge(left, right, on='key', engine='foo')
+
+    @pytest.mark.parametrize('left_vals, right_vals, lval, rval', [
+        (['a\x00b', 'a', 'a\x00c', 'a\x00b'], ['a\x00c', 'a\x00', 'a\x00b'],
+         [0, 3, 2], [2, 2, 0]),
+        ([u'\ud800', 'a', u'\udc00', u'\ud800'], [u'\udc00', 'b', u'\ud800'],
+         [0, 3, 2], [2, 2, 0])])
+    def test_merge_string_keys_fallback(self, left_vals, right_vals, lval,
+                                        rval):
+        # strings with an embedded NUL or a lone surrogate are not hashed
+        # as C strings
+        left = DataFrame({'key': left_vals,
+                          'lval': np.arange(len(left_vals))})
+        right = DataFrame({'key': right_vals,
+                           'rval': np.arange(len(right_vals))})
+
+        result = pd.merge(left, right, on='key')
+        expected = DataFrame({'key': [left_vals[i] for i in lval],
+                              'lval': lval, 'rval': rval},
+                             columns=['key', 'lval', 'rval'])
+        assert_frame_equal(result, expected)
+
     @pytest.mark.parametrize('d1', [np.int64, np.int32,
                                     np.int16, np.int8, np.uint8])
     @pytest.mark.parametrize('d2', [np.int64, np.float64,
@@ -404,6 +404,41 @@ class TestAsOfMerge(object):
             pd.merge_asof(left, right, left_index=True, right_index=True,
                           left_by=['k1', 'k2'], right_by=['k1'])
 
+    @pytest.mark.parametrize('direction', ['backward', 'forward',
+                                           'nearest'])
+    def test_multiby_factorized(self, direction):
+        # the 'by' keys are factorized to combined int64 codes, which
+        # matches joining by a single key made of all of them
+        np.random.seed(1234)
+        n = 200
+        dates = pd.date_range('20160525', periods=2)
+        left = pd.DataFrame({
+            'time': np.sort(np.random.randint(0, 100, n)),
+            'k1': np.random.choice(['a', 'b', 'c'], n),
+            'k2': np.random.choice([1.5, 2.5], n),
+            'k3': np.random.choice(dates, n),
+            'lval': np.arange(n)})
+        right = pd.DataFrame({
+            'time': np.sort(np.random.randint(0, 100, n)),
+            'k1': np.random.choice(['a', 'b', 'd'], n),
+            'k2': np.random.choice([1.5, 2.5], n),
+            'k3': np.random.choice(dates, n),
+            'rval': np.arange(n)})
+
+        result = pd.merge_asof(left, right, on='time',
+                               by=['k1', 'k2', 'k3'], direction=direction)
+
+        def combine(df):
+            return df.assign(key=(df['k1'] + df['k2'].astype(str) +
+                                  df['k3'].astype(str)))
+
+        expected = pd.merge_asof(combine(left),
+                                 combine(right).drop(['k1', 'k2', 'k3'],
+                                                     axis=1),
+                                 on='time', by='key', direction=direction)
+        expected = expected.drop('key', axis=1)
+        assert_frame_equal(result, expected)
+
     def test_basic2(self):
 
         expected = self.read_data('asof2.csv')
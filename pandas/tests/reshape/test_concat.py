@@ -1246,6 +1246,41 @@ class TestConcatenate(ConcatenateBase):
         result = concat([empty, df])
         assert_frame_equal(result, df)
 
+    def test_concat_upcast_into_preallocated(self):
+        # the upcasted columns are copied into a single allocation, with
+        # the same result as concatenating upcasted copies
+        df1 = DataFrame({'a': [1, 2], 'b': [1.5, 2.5], 'c': ['x', 'y'],
+                         'd': [True, False],
+                         'e': pd.to_datetime(['2017-01-01', '2017-01-02']),
+                         'f': [None, None]},
+                        columns=list('abcdef'))
+        df2 = DataFrame({'a': [3.5], 'c': [1], 'd': [1], 'e': ['z'],
+                         'f': [2]},
+                        columns=list('acdef'))
+
+        result = concat([df1, df2, df1], ignore_index=True)
+        expected = DataFrame(
+            {'a': [1., 2., 3.5, 1., 2.],
+             'b': [1.5, 2.5, np.nan, 1.5, 2.5],
+             'c': np.array(['x', 'y', 1, 'x', 'y'], dtype=object),
+             'd': [1, 0, 1, 1, 0],
+             'e': np.array([Timestamp('2017-01-01'), Timestamp('2017-01-02'),
+                            'z', Timestamp('2017-01-01'),
+                            Timestamp('2017-01-02')], dtype=object),
+             'f': np.array([None, None, 2, None, None], dtype=object)},
+            columns=list('abcdef'))
+        assert_frame_equal(result, expected)
+
+        # missing values
+        result = concat([df1[['e']], df2[['a']], df1[['e']]],
+                        ignore_index=True)
+        expected = DataFrame(
+            {'e': pd.to_datetime(['2017-01-01', '2017-01-02', None,
+                                  '2017-01-01', '2017-01-02']),
+             'a': [np.nan, np.nan, 3.5, np.nan, np.nan]},
+            columns=['a', 'e'])
+        assert_frame_equal(result, expected)
+
     def test_concat_mixed_objs(self):
 
         # concat mixed series/frames
@@ -193,6 +193,29 @@ class TestFactorize(object):
         assert len(set(key)) == len(set(expected))
         tm.assert_numpy_array_equal(pd.isna(key), expected == na_sentinel)
 
+    @pytest.mark.parametrize('klass, left, right', [
+        (ht.Float64Factorizer, np.array([1.5, np.nan, 0., 1.5]),
+         np.array([2.5, 0., np.nan, 1.5])),
+        (ht.UInt64Factorizer, np.array([2**63, 1, 0, 1], dtype=np.uint64),
+         np.array([3, 2**63 + 1, 1, 2**63], dtype=np.uint64)),
+        (ht.StringFactorizer, np.array(['b', 'a', 'c', 'a'], dtype=object),
+         np.array(['d', 'b', 'e', 'a'], dtype=object))])
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_typed_factorizers(self, klass, left, right, sort):
+        # the typed factorizers label like the object one, including
+        # across consecutive calls
+        expected = ht.Factorizer(len(left))
+        rizer = klass(len(left))
+        for values in [left, right]:
+            result = rizer.factorize(values, sort=sort)
+            tm.assert_numpy_array_equal(
+                result, expected.factorize(values.astype(object), sort=sort),
+                check_dtype=False)
+            assert rizer.get_count() == expected.get_count()
+        tm.assert_numpy_array_equal(rizer.uniques.to_array(),
+                                    expected.uniques.to_array(),
+                                    check_dtype=False)
+
     @pytest.mark.parametrize("data,expected_label,expected_level", [
         (
             [(1, 1), (1, 2), (0, 0), (1, 2), 'nonsense'],
@@ -535,6 +558,65 @@ class TestIsin(object):
         expected[1] = True
         tm.assert_numpy_array_equal(result, expected)
 
+    @pytest.mark.parametrize('values', [
+        # dense: looked up in a table indexed by value
+        np.array([0, 5, 99, 5, 42]),
+        np.array([2**63 + 5, 2**63, 2**63 + 99], dtype=np.uint64),
+        # large and sorted: binary searched
+        np.arange(-10**6, 10**6, 7),
+        np.arange(2**63, 2**63 + 10**6 * 7, 7, dtype=np.uint64),
+        # sparse: hashed
+        np.array([10**12, -3, 5, 10**15])])
+    def test_isin_integer_strategies(self, values):
+        rs = RandomState(1234)
+        offsets = rs.randint(0, 100, 1000).astype(values.dtype)
+        comps = np.concatenate([
+            values[rs.randint(0, len(values), 500)],
+            values.min() + offsets[:500], values.max() - offsets[500:]])
+        expected = np.in1d(comps.astype(object), values.astype(object))
+
+        result = algos.isin(comps, values)
+        tm.assert_numpy_array_equal(result, expected)
+
+        if values.dtype == np.int64:
+            result = algos.isin(comps.view('M8[ns]'),
+                                values.view('M8[ns]'))
+            tm.assert_numpy_array_equal(result, expected)
+
+    @pytest.mark.parametrize('values', [
+        Index([3, 1, 7]),
+        Index([3., 1., 7.5]),
+        Index(['b', 'a', 'd']),
+        pd.date_range('2017', periods=3)])
+    def test_isin_index_engine(self, values):
+        # a unique index is matched against with its hash table
+        comps = Series(values.take([0, 1, 0, 2, 1]))
+        values = values[:2]
+        expected = np.array([True, True, True, False, True])
+
+        result = algos.isin(comps, values)
+        tm.assert_numpy_array_equal(result, expected)
+        assert values._engine.is_mapping_populated
+
+    @pytest.mark.parametrize('comps, values', [
+        (np.arange(-50, 50), np.arange(0, 100, 3)),
+        (np.arange(50, dtype=np.uint64), np.array([2**63, 3, 7],
+                                                  dtype=np.uint64)),
+        (np.array([-0., 1.5, np.nan, 2.5, 3.]), np.array([0., np.nan, 3.])),
+        (pd.date_range('2017', periods=10).values,
+         pd.date_range('2017-01-05', periods=3).values)])
+    def test_bloom_filter(self, comps, values, monkeypatch):
+        # values are hashed in a Bloom filter first for large value sets
+        expected = algos.isin(comps, values)
+        monkeypatch.setattr(algos, '_BLOOM_MIN_SIZE', 0)
+        result = algos.isin(comps, values)
+        tm.assert_numpy_array_equal(result, expected)
+
+        # a Bloom filter has no false negatives
+        mask = algos._bloom_mask(comps, values)
+        assert mask[expected].all()
+        assert mask.sum() < len(comps)
+
     def test_categorical_from_codes(self):
         # GH 16639
         vals = np.array([0, 1, 2, 0])
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+import pandas as pd
+from pandas import Series, DataFrame, Categorical, date_range
+from pandas.api.sketches import HyperLogLog, TDigest
+import pandas.util.testing as tm
+
+
+class TestHyperLogLog(object):
+
+    @pytest.mark.parametrize('n', [10, 1000, 100000])
+    def test_count(self, n):
+        values = np.random.RandomState(0).permutation(n)
+        result = HyperLogLog().update(np.tile(values, 3)).count()
+        assert abs(result - n) <= 0.03 * n
+
+    @pytest.mark.parametrize('values', [
+        np.arange(20000) * 1.5,
+        np.array(['a%d' % i for i in range(20000)], dtype=object),
+        Categorical(np.arange(20000)),
+        date_range('2000', periods=20000, freq='s', tz='US/Eastern')])
+    def test_merge(self, values):
+        values = Series(values)
+        expected = HyperLogLog().update(values)
+
+        left = HyperLogLog().update(values[:12000])
+        right = HyperLogLog().update(values[8000:])
+        result = left.merge(right)
+
+        tm.assert_numpy_array_equal(result.registers, expected.registers)
+        assert abs(result.count() - 20000) <= 600
+
+    def test_dropna(self):
+        s = Series([1., 2., np.nan, -0., 0., np.nan])
+        assert HyperLogLog().update(s).count() == 3
+        assert HyperLogLog().update(s, dropna=False).count() == 4
+
+    def test_invalid(self):
+        with tm.assert_raises_regex(ValueError, 'precision'):
+            HyperLogLog(precision=3)
+        with tm.assert_raises_regex(ValueError, 'precision'):
+            HyperLogLog(10).merge(HyperLogLog(12))
+        with tm.assert_raises_regex(TypeError, 'HyperLogLog'):
+            HyperLogLog().merge(TDigest())
+
+
+class TestTDigest(object):
+
+    def test_quantile(self):
+        values = np.random.RandomState(1).randn(200000)
+        digest = TDigest().update(values)
+
+        q = np.array([0.001, 0.01, 0.1, 0.5, 0.9, 0.99, 0.999])
+        expected = np.percentile(values, q * 100)
+        result = digest.quantile(q)
+        tm.assert_numpy_array_equal(np.abs(result - expected) < 0.05,
+                                    np.ones(len(q), dtype=bool))
+
+        assert digest.quantile(0) == values.min()
+        assert digest.quantile(1) == values.max()
+        assert len(digest.means) < 500
+
+    def test_merge(self):
+        values = np.random.RandomState(2).exponential(size=100000)
+        chunks = [TDigest().update(chunk)
+                  for chunk in np.array_split(values, 7)]
+        result = chunks[0]
+        for chunk in chunks[1:]:
+            result.merge(chunk)
+
+        assert result.weights.sum() == len(values)
+        assert result.min == values.min()
+        assert result.max == values.max()
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            expected = np.percentile(values, q * 100)
+            assert abs(result.quantile(q) - expected) < 0.02 * (1 + expected)
+
+    def test_empty_and_nan(self):
+        digest = TDigest().update(np.array([np.nan, np.nan]))
+        assert np.isnan(digest.quantile(0.5))
+        digest.update(np.array([1., np.nan, 3.]))
+        assert digest.quantile(0.5) == 2.
+
+    def test_invalid(self):
+        with tm.assert_raises_regex(TypeError, 'numeric'):
+            TDigest().update(np.array(['a', 'b'], dtype=object))
+        with tm.assert_raises_regex(TypeError, 'numeric'):
+            TDigest().update(date_range('2000', periods=3))
+        with tm.assert_raises_regex(ValueError, 'compression'):
+            TDigest(compression=10)
+
+
+class TestSeries(object):
+
+    def test_approx_nunique(self):
+        s = Series(np.arange(50000) % 5000, dtype='float64')
+        s[::7] = np.nan
+        assert abs(s.approx_nunique() - 5000) <= 150
+        assert abs(s.approx_nunique(dropna=False) - 5001) <= 150
+        assert Series([]).approx_nunique() == 0
+
+    def test_approx_quantile(self):
+        s = Series(np.random.RandomState(3).rand(100000), name='x')
+        assert abs(s.approx_quantile() - s.quantile()) < 0.01
+
+        result = s.approx_quantile([0.1, 0.9])
+        expected = s.quantile([0.1, 0.9])
+        tm.assert_index_equal(result.index, expected.index)
+        assert result.name == 'x'
+        assert (np.abs(result - expected) < 0.01).all()
+
+        with tm.assert_raises_regex(ValueError, 'percentiles'):
+            s.approx_quantile(1.5)
+
+
+class TestGroupBy(object):
+
+    def test_approx_nunique(self):
+        rs = np.random.RandomState(4)
+        df = DataFrame({'key': rs.randint(0, 20, 100000),
+                        'a': rs.randint(0, 1000, 100000),
+                        'b': rs.choice(np.array(['x', 'y', 'z', np.nan],
+                                                dtype=object), 100000)})
+        expected = df.groupby('key')[['a', 'b']].nunique()
+        result = df.groupby('key')[['a', 'b']].approx_nunique()
+        tm.assert_index_equal(result.index, expected.index)
+        tm.assert_index_equal(result.columns, expected.columns)
+        assert (np.abs(result - expected) <= 0.05 * expected).all().all()
+
+        result = df.groupby('key')['b'].approx_nunique(dropna=False)
+        assert (result == 4).all()
+        assert result.name == 'b'
+
+    def test_approx_nunique_small_groups(self):
+        # the groups with fewer values than a sketch has registers are
+        # counted exactly
+        rs = np.random.RandomState(5)
+        key = np.concatenate([np.repeat(np.arange(1000), 3),
+                              np.full(5000, 1000)])
+        s = Series(rs.randint(0, 1000, len(key)))
+        s[::7] = np.nan
+
+        result = s.groupby(key).approx_nunique(precision=6)
+        expected = s.groupby(key).nunique()
+        tm.assert_series_equal(result[:1000], expected[:1000])
+        assert abs(result[1000] - expected[1000]) <= 0.5 * expected[1000]
+
+        result = s.groupby(key).approx_nunique(dropna=False, precision=6)
+        expected = s.groupby(key).nunique(dropna=False)
+        tm.assert_series_equal(result[:1000], expected[:1000])
+
+    def test_approx_nunique_unobserved_group(self):
+        s = Series([1, 2, 2, np.nan])
+        key = Categorical(['a', 'a', 'c', 'c'], categories=['a', 'b', 'c'])
+        result = s.groupby(key).approx_nunique()
+        expected = Series([2, 0, 1],
+                          index=pd.CategoricalIndex(['a', 'b', 'c']))
+        tm.assert_series_equal(result, expected)
+
+    def test_approx_quantile(self):
+        rs = np.random.RandomState(5)
+        df = DataFrame({'key': rs.randint(0, 5, 50000),
+                        'a': rs.rand(50000),
+                        'b': rs.randint(0, 10000, 50000),
+                        'c': 'foo'})
+        g = df.groupby('key')
+
+        expected = g[['a', 'b']].quantile(0.3)
+        result = g.approx_quantile(0.3)
+        tm.assert_index_equal(result.columns, expected.columns)
+        tm.assert_index_equal(result.index, expected.index)
+        assert (np.abs(result - expected) < 0.02 * (1 + expected)).all().all()
+
+        result = g['a'].approx_quantile([0.25, 0.75])
+        expected = g['a'].quantile([0.25, 0.75])
+        tm.assert_index_equal(result.index, expected.index)
+        assert (np.abs(result - expected) < 0.02).all()
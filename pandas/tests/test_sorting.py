@@ -14,6 +14,8 @@ from pandas.util.testing import assert_frame_equal, assert_series_equal
 from pandas.core.sorting import (is_int64_overflow_possible,
                                  decons_group_index,
                                  get_group_index,
+                                 compress_group_index,
+                                 hash_group_index,
                                  nargsort,
                                  lexsort_indexer,
                                  safe_sort)
@@ -100,6 +102,29 @@ class TestSorting(object):
         assert_frame_equal(gr.mean(), aggr(np.mean))
         assert_frame_equal(gr.median(), aggr(np.median))
 
+    @pytest.mark.parametrize('sort', [True, False])
+    def test_hash_group_index(self, sort):
+        shape = (10, 20, 5)
+        labels = [np.random.randint(-1, n, size=1000).astype('i8')
+                  for n in shape]
+
+        result = hash_group_index(labels, shape, sort=sort)
+        group_index = get_group_index(labels, shape, sort=True, xnull=True)
+        expected = compress_group_index(group_index, sort=sort)
+        for res, exp in zip(result, expected):
+            tm.assert_numpy_array_equal(res, exp)
+
+        # the product space of the levels does not fit in int64
+        shape = (2**20, ) * 4
+        labels = [np.random.randint(0, 3, size=1000).astype('i8')
+                  for n in shape]
+        comp_ids, obs_ids = hash_group_index(labels, shape, sort=sort)
+        assert len(obs_ids) == len(np.unique(comp_ids))
+        keys = list(zip(*labels))
+        for i, j in zip(*np.nonzero(comp_ids[:, None] ==
+                                    comp_ids[None, :20])):
+            assert keys[i] == keys[j]
+
     def test_lexsort_indexer(self):
         keys = [[nan] * 5 + list(range(100)) + [nan] * 5]
         # orders=True, na_position='last'
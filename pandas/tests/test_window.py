@@ -450,6 +450,62 @@ class TestRolling(Base):
         tm.assert_index_equal(result.columns, df.columns)
         assert result.index.names == [None, '1', '2']
 
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'max', 'min'])
+    @pytest.mark.parametrize('center', [True, False])
+    @pytest.mark.parametrize('threaded', [True, False])
+    def test_block_kernels(self, func, center, threaded, monkeypatch):
+        # the columns of a block are rolled in a single (possibly
+        # threaded) cython call, which matches rolling each column
+        import pandas.core.parallel as parallel
+        if threaded:
+            monkeypatch.setattr(parallel, '_MIN_THREADED_SIZE', 0)
+            monkeypatch.setattr(parallel, '_NUM_THREADS', 3)
+
+        df = self.frame.copy()
+        df.iloc[20:40, ::2] = np.NaN
+
+        for window in [5, '5D']:
+            if center and window == '5D':
+                continue
+            r = df.rolling(window, min_periods=2, center=center)
+            result = getattr(r, func)()
+            expected = df.apply(
+                lambda x: getattr(x.rolling(window, min_periods=2,
+                                            center=center), func)())
+            tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'std'])
+    @pytest.mark.parametrize('min_periods', [None, 1, 3])
+    def test_online(self, func, min_periods):
+        # updating with batches of rows gives the same results as
+        # recomputing over the whole history
+        df = self.frame.copy()
+        df.iloc[20:40, ::2] = np.NaN
+        df.iloc[50, 1] = np.inf
+
+        for obj in [df, df[3]]:
+            online = obj.iloc[:7].rolling(5, min_periods=min_periods).online()
+            expected = getattr(obj.iloc[:7].rolling(
+                5, min_periods=min_periods), func)()
+            assert_equal(getattr(online, func)(), expected)
+
+            full = getattr(obj.rolling(5, min_periods=min_periods), func)()
+            for start, stop in [(7, 8), (8, 30), (30, 31), (31, N)]:
+                result = getattr(online.update(obj.iloc[start:stop]), func)()
+                assert_equal(result, full.iloc[start:stop])
+
+    def test_online_raises(self):
+        with pytest.raises(NotImplementedError):
+            self.frame.rolling('2D').online()
+        with pytest.raises(NotImplementedError):
+            self.frame.rolling(2, center=True).online()
+
+        online = self.frame.rolling(2).online()
+        with pytest.raises(ValueError):
+            online.update(self.frame[[0, 1]])
+        with pytest.raises(TypeError):
+            online.update(self.frame[0])
+
 
 class TestExpanding(Base):
 
@@ -574,6 +630,42 @@ class TestEWM(Base):
             tm.assert_raises_regex(UnsupportedFunctionCall, msg,
                                    getattr(e, func), dtype=np.float64)
 
+    @pytest.mark.parametrize('adjust', [True, False])
+    @pytest.mark.parametrize('ignore_na', [True, False])
+    def test_mean_block_kernel(self, adjust, ignore_na):
+        # the columns of a block are weighted in a single cython call
+        df = self.frame.copy()
+        df.iloc[20:40, ::2] = np.NaN
+
+        result = df.ewm(com=3, adjust=adjust, ignore_na=ignore_na,
+                        min_periods=5).mean()
+        expected = df.apply(lambda x: x.ewm(com=3, adjust=adjust,
+                                            ignore_na=ignore_na,
+                                            min_periods=5).mean())
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('func', ['mean', 'var', 'std'])
+    @pytest.mark.parametrize('adjust', [True, False])
+    @pytest.mark.parametrize('ignore_na', [True, False])
+    def test_online(self, func, adjust, ignore_na):
+        # updating with batches of rows gives the same results as
+        # recomputing over the whole history
+        df = self.frame.copy()
+        df.iloc[:5, 0] = np.NaN
+        df.iloc[20:40, ::2] = np.NaN
+
+        kwargs = dict(com=3, adjust=adjust, ignore_na=ignore_na,
+                      min_periods=2)
+        for obj in [df, df[0]]:
+            online = obj.iloc[:1].ewm(**kwargs).online()
+            assert_equal(getattr(online, func)(),
+                         getattr(obj.iloc[:1].ewm(**kwargs), func)())
+
+            full = getattr(obj.ewm(**kwargs), func)()
+            for start, stop in [(1, 3), (3, 30), (30, N)]:
+                result = getattr(online.update(obj.iloc[start:stop]), func)()
+                assert_equal(result, full.iloc[start:stop])
+
 
 class TestDeprecations(Base):
     """ test that we are catching deprecation warnings """
@@ -3494,6 +3586,26 @@ class TestRollingTS(object):
         result = df.rolling('2s', closed='neither').sum()
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both', 'neither'])
+    def test_closed_skiplist(self, closed):
+        # the first window is empty when the right endpoint is open
+        df = DataFrame({'A': [3., 1, np.nan, 4, 2, 8]},
+                       index=[Timestamp('20130101 09:00:01'),
+                              Timestamp('20130101 09:00:02'),
+                              Timestamp('20130101 09:00:03'),
+                              Timestamp('20130101 09:00:04'),
+                              Timestamp('20130101 09:00:06'),
+                              Timestamp('20130101 09:00:07')])
+        r = df.rolling('3s', closed=closed)
+
+        result = r.median()
+        expected = r.apply(lambda x: np.median(x[~np.isnan(x)]))
+        tm.assert_frame_equal(result, expected)
+
+        result = r.quantile(0.3)
+        expected = r.apply(lambda x: np.percentile(x[~np.isnan(x)], 30))
+        tm.assert_frame_equal(result, expected)
+
     def test_ragged_sum(self):
 
         df = self.ragged
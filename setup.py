@@ -315,6 +315,7 @@ class CheckSDist(sdist_class):
                  'pandas/_libs/testing.pyx',
                  'pandas/_libs/window.pyx',
                  'pandas/_libs/skiplist.pyx',
+                 'pandas/_libs/sketches.pyx',
                  'pandas/_libs/sparse.pyx',
                  'pandas/_libs/parsers.pyx',
                  'pandas/_libs/tslibs/ccalendar.pyx',
@@ -488,8 +489,9 @@ ext_data = {
         'depends': _pxi_dep['interval']},
     '_libs.join': {
         'pyxfile': '_libs/join',
-        'pxdfiles': ['_libs/src/util', '_libs/hashtable'],
-        'depends': _pxi_dep['join']},
+        'pxdfiles': ['_libs/src/util', '_libs/hashtable', '_libs/khash'],
+        'depends': (['pandas/_libs/src/klib/khash_python.h'] +
+                    _pxi_dep['join'])},
     '_libs.lib': {
         'pyxfile': '_libs/lib',
         'pxdfiles': ['_libs/src/util',
@@ -522,6 +524,8 @@ ext_data = {
     '_libs.reshape': {
         'pyxfile': '_libs/reshape',
         'depends': _pxi_dep['reshape']},
+    '_libs.sketches': {
+        'pyxfile': '_libs/sketches'},
     '_libs.skiplist': {
         'pyxfile': '_libs/skiplist',
         'depends': ['pandas/_libs/src/skiplist.h']},